@@ -0,0 +1,53 @@
+import argparse
+import sys
+
+from studio.tests.benchmark.benchmark_suite import (
+    BENCHMARK_CASES,
+    BenchmarkReport,
+    compare_reports,
+    run_benchmarks,
+)
+
+
+def main(args):
+    report = run_benchmarks(scale=args.scale, repeat=args.repeat, names=args.cases)
+    report.save(args.output)
+    print(f"Saved the results: {args.output}")
+
+    if args.baseline:
+        regressions = compare_reports(
+            report, BenchmarkReport.read(args.baseline), threshold=args.threshold
+        )
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+        print("No regression.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the I/O paths and wrappers over synthetic data."
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="size of the synthetic data"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case")
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=list(BENCHMARK_CASES),
+        help="cases to run (default: all)",
+    )
+    parser.add_argument(
+        "--output", default="benchmark_results.json", help="results (json) path"
+    )
+    parser.add_argument("--baseline", help="results (json) to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="allowed slowdown ratio (0.2: +20%%) unless set per case in baseline",
+    )
+
+    main(parser.parse_args())
@@ -3,6 +3,7 @@ from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import Depends, FastAPI, Request
+from fastapi.responses import PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi_pagination import add_pagination
@@ -13,6 +14,11 @@ from studio.app.common.core.auth.auth_dependencies import (
     get_current_user,
 )
 from studio.app.common.core.logger import AppLogger
+from studio.app.common.core.metrics import (
+    REGISTRY,
+    HTTPMetricsMiddleware,
+    MetricsRegistry,
+)
 from studio.app.common.core.mode import MODE
 from studio.app.common.core.workspace.workspace_dependencies import (
     is_workspace_available,
@@ -82,6 +88,19 @@ async def health_check():
         }
 
 
+@app.get("/metrics", response_class=PlainTextResponse, tags=["others"])
+async def metrics():
+    """
+    Metrics of this server process (Prometheus text format).
+    *Not authenticated (as /health), for the scrapers.
+    """
+    # Note: the content-type is set as is (media_type gets a charset appended).
+    return PlainTextResponse(
+        REGISTRY.generate_latest(),
+        headers={"Content-Type": MetricsRegistry.CONTENT_TYPE},
+    )
+
+
 add_pagination(app)
 
 # common routers
@@ -116,6 +135,7 @@ if MODE.IS_STANDALONE:
     app.dependency_overrides[is_workspace_owner] = skip_dependencies
     app.dependency_overrides[is_workspace_available] = skip_dependencies
 
+app.add_middleware(HTTPMetricsMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -1,15 +1,16 @@
 import json
 import logging
 
-import pyrebase
-
 from studio.app.common.core.mode import MODE
 from studio.app.dir_path import DIRPATH
 
 try:
-    pyrebase_app = pyrebase.initialize_app(
-        json.load(open(DIRPATH.FIREBASE_CONFIG_PATH))
-    )
+    firebase_config = json.load(open(DIRPATH.FIREBASE_CONFIG_PATH))
+
+    # Note: pyrebase is imported only if firebase is configured.
+    import pyrebase
+
+    pyrebase_app = pyrebase.initialize_app(firebase_config)
 except FileNotFoundError as e:
     if MODE.IS_STANDALONE:
         pyrebase_app = None
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Dict, Optional
 
 from studio.app.common.core.snakemake.smk import SmkParam
-from studio.app.common.core.workflow.workflow import OutputPath
+from studio.app.common.core.workflow.workflow import NodeRunMetrics, OutputPath
 from studio.app.dir_path import DIRPATH
 from studio.app.optinist.schemas.nwb import NWBParams
 
@@ -18,6 +18,7 @@ class ExptFunction:
     outputPaths: Optional[Dict[str, OutputPath]] = None
     started_at: Optional[str] = None
     finished_at: Optional[str] = None
+    metrics: Optional[NodeRunMetrics] = None
 
 
 @dataclass
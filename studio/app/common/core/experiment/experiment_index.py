@@ -0,0 +1,185 @@
+import copy
+import json
+import os
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+
+from studio.app.common.core.experiment.experiment import ExptConfig
+from studio.app.common.core.experiment.experiment_reader import ExptConfigReader
+from studio.app.common.core.logger import AppLogger
+from studio.app.common.core.utils.filelock_handler import FileLockUtils
+from studio.app.common.core.utils.filepath_creater import (
+    create_directory,
+    join_filepath,
+)
+from studio.app.dir_path import DIRPATH
+
+logger = AppLogger.get_logger()
+
+
+class ExptConfigIndex:
+    """
+    Persisted index of the experiment configs (experiment.yaml) of a workspace.
+
+    Each entry holds the mtime of the experiment.yaml and its parsed config,
+      so that listing the experiments only stats the config files,
+      and parses the ones added or updated since the last listing.
+    """
+
+    # Note: the index is kept in a hidden directory,
+    #   which is skipped as an experiment directory.
+    INDEX_DIRNAME = ".experiment_index"
+    INDEX_FILENAME = "experiment_index.json"
+    FILE_LOCK_TIMEOUT = 10
+
+    SORT_FIELDS = ["started_at", "finished_at", "name", "unique_id", "success"]
+
+    # Loaded indexes shared in the process {index_path: (index mtime, entries)}
+    __loaded: Dict[str, Tuple[int, Dict[str, dict]]] = {}
+
+    def __init__(self, workspace_id: str):
+        self.workspace_id = workspace_id
+        self.root_dir = join_filepath([DIRPATH.OUTPUT_DIR, workspace_id])
+        self.index_path = join_filepath(
+            [self.root_dir, self.INDEX_DIRNAME, self.INDEX_FILENAME]
+        )
+
+        self.__entries: Dict[str, dict] = self.__read()
+        self.__modified = False
+
+    def __read(self) -> Dict[str, dict]:
+        try:
+            mtime = os.stat(self.index_path).st_mtime_ns
+        except FileNotFoundError:
+            return {}
+
+        loaded = self.__loaded.get(self.index_path)
+        if loaded is not None and loaded[0] == mtime:
+            # Note: the entries themselves are never modified (only replaced).
+            return dict(loaded[1])
+
+        try:
+            with open(self.index_path) as f:
+                entries = json.load(f)["experiments"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return {}
+
+        self.__loaded[self.index_path] = (mtime, entries)
+        return dict(entries)
+
+    def save(self):
+        if not self.__modified:
+            return
+
+        # Note: write to a temporary file and replace,
+        #   so that readers never see a partially written index.
+        create_directory(os.path.dirname(self.index_path))
+        with FileLockUtils.lock(
+            self.index_path, timeout=self.FILE_LOCK_TIMEOUT, name="experiment_index"
+        ):
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"experiments": self.__entries}, f)
+            os.replace(tmp_path, self.index_path)
+
+            self.__loaded[self.index_path] = (
+                os.stat(self.index_path).st_mtime_ns,
+                dict(self.__entries),
+            )
+
+        self.__modified = False
+
+    def __parse(self, unique_id: str, mtime: int) -> dict:
+        try:
+            config = ExptConfigReader.read(self.workspace_id, unique_id)
+        except Exception as e:
+            logger.error(f"experiment config read error: [{unique_id}] {e}")
+            return {"mtime": mtime, "valid": False, "config": None}
+
+        try:
+            valid = ExptConfigReader.validate_experiment_config(config)
+        except AssertionError as e:
+            logger.error(f"invalid experiment config: [{unique_id}] {e}")
+            valid = False
+
+        return {"mtime": mtime, "valid": valid, "config": asdict(config)}
+
+    def refresh(self) -> "ExptConfigIndex":
+        """
+        Updates the entries of the experiments added, updated or removed,
+          comparing the mtime of their experiment.yaml.
+        """
+        found = set()
+        if os.path.isdir(self.root_dir):
+            with os.scandir(self.root_dir) as it:
+                for entry in it:
+                    if entry.name.startswith(".") or not entry.is_dir():
+                        continue
+                    try:
+                        mtime = os.stat(
+                            join_filepath([entry.path, DIRPATH.EXPERIMENT_YML])
+                        ).st_mtime_ns
+                    except FileNotFoundError:
+                        continue
+
+                    unique_id = entry.name
+                    found.add(unique_id)
+                    indexed = self.__entries.get(unique_id)
+                    if indexed is None or indexed["mtime"] != mtime:
+                        self.__entries[unique_id] = self.__parse(unique_id, mtime)
+                        self.__modified = True
+
+        for unique_id in set(self.__entries) - found:
+            del self.__entries[unique_id]
+            self.__modified = True
+
+        self.save()
+
+        return self
+
+    def search(
+        self,
+        name: Optional[str] = None,
+        success: Optional[str] = None,
+        sort_field: str = "started_at",
+        desc: bool = True,
+        valid_only: bool = True,
+    ) -> List[str]:
+        """
+        Returns the unique_ids of the experiments,
+          filtered by name (partial match, case-insensitive) and status,
+          and sorted by the sort_field (one of SORT_FIELDS, case-insensitive).
+        """
+        if sort_field not in self.SORT_FIELDS:
+            raise ValueError(f"Invalid sort field: {sort_field}")
+
+        name = name.lower() if name else None
+        matched = []
+        for unique_id, entry in self.__entries.items():
+            config = entry["config"]
+            if config is None or (valid_only and not entry["valid"]):
+                continue
+            if name and name not in (config["name"] or "").lower():
+                continue
+            if success and config["success"] != success:
+                continue
+            matched.append((str(config[sort_field] or "").lower(), unique_id))
+
+        matched.sort(reverse=desc)
+
+        return [unique_id for _, unique_id in matched]
+
+    def get_config(self, unique_id: str) -> Optional[ExptConfig]:
+        entry = self.__entries.get(unique_id)
+        if entry is None or entry["config"] is None:
+            return None
+
+        # Note: copied, as the configs may be changed by the callers.
+        return ExptConfigReader._create_experiment_config(
+            copy.deepcopy(entry["config"])
+        )
+
+    def get_configs(self, unique_ids: List[str] = None) -> Dict[str, ExptConfig]:
+        if unique_ids is None:
+            unique_ids = self.search()
+        return {unique_id: self.get_config(unique_id) for unique_id in unique_ids}
@@ -13,6 +13,7 @@ from studio.app.common.core.logger import AppLogger
 from studio.app.common.core.utils.config_handler import ConfigReader
 from studio.app.common.core.utils.filepath_creater import join_filepath
 from studio.app.common.core.workflow.workflow import (
+    NodeRunMetrics,
     NodeRunStatus,
     OutputPath,
     WorkflowRunStatus,
@@ -114,10 +115,15 @@ class ExptConfigReader:
                 hasNWB=value["hasNWB"],
                 message=value.get("message"),
                 outputPaths=cls.convert_output_paths(value.get("outputPaths")),
+                metrics=cls.convert_metrics(value.get("metrics")),
             )
             for key, value in config.items()
         }
 
+    @classmethod
+    def convert_metrics(cls, config: dict) -> Optional[NodeRunMetrics]:
+        return NodeRunMetrics(**config) if config else None
+
     @classmethod
     def convert_output_paths(cls, config: dict) -> Dict[str, OutputPath]:
         if config:
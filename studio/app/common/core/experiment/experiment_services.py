@@ -1,5 +1,3 @@
-from datetime import datetime
-from glob import glob
 from typing import Optional
 
 from fastapi import HTTPException, status
@@ -7,7 +5,7 @@ from sqlalchemy.exc import NoResultFound
 from sqlmodel import Session, delete
 
 from studio.app.common.core.experiment.experiment import ExptConfig
-from studio.app.common.core.experiment.experiment_reader import ExptConfigReader
+from studio.app.common.core.experiment.experiment_index import ExptConfigIndex
 from studio.app.common.core.experiment.experiment_writer import ExptDataWriter
 from studio.app.common.core.logger import AppLogger
 from studio.app.common.core.workflow.workflow_runner import WorkflowRunner
@@ -16,27 +14,17 @@ from studio.app.common.core.workspace.workspace_data_capacity_services import (
 )
 from studio.app.common.models.experiment import ExperimentRecord
 from studio.app.common.schemas.experiment import CopyItem
-from studio.app.const import DATE_FORMAT
 
 logger = AppLogger.get_logger()
 
 
 class ExperimentService:
     @classmethod
-    def get_last_experiment(cls, workspace_id: str):
-        last_expt_config: Optional[ExptConfig] = None
-        config_paths = glob(ExptConfigReader.get_config_yaml_wild_path(workspace_id))
+    def get_last_experiment(cls, workspace_id: str) -> Optional[ExptConfig]:
+        expt_index = ExptConfigIndex(workspace_id).refresh()
+        unique_ids = expt_index.search(sort_field="started_at", valid_only=False)
 
-        for path in config_paths:
-            config = ExptConfigReader.read_from_path(path)
-            if not last_expt_config:
-                last_expt_config = config
-            elif datetime.strptime(config.started_at, DATE_FORMAT) > datetime.strptime(
-                last_expt_config.started_at, DATE_FORMAT
-            ):
-                last_expt_config = config
-
-        return last_expt_config
+        return expt_index.get_config(unique_ids[0]) if unique_ids else None
 
     @classmethod
     async def delete_experiment(
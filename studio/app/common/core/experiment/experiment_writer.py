@@ -1,6 +1,5 @@
 import glob
 import os
-import pickle
 import re
 import shutil
 from dataclasses import asdict
@@ -8,7 +7,6 @@ from datetime import datetime
 from typing import Dict
 
 import numpy as np
-from filelock import FileLock
 
 from studio.app.common.core.experiment.experiment import ExptConfig, ExptFunction
 from studio.app.common.core.experiment.experiment_builder import ExptConfigBuilder
@@ -26,6 +24,11 @@ from studio.app.common.core.utils.config_handler import (
 )
 from studio.app.common.core.utils.filelock_handler import FileLockUtils
 from studio.app.common.core.utils.filepath_creater import join_filepath
+from studio.app.common.core.utils.pickle_handler import (
+    PICKLE_ARRAYS_SUFFIX,
+    PickleReader,
+    PickleWriter,
+)
 from studio.app.common.core.workflow.workflow import (
     NodeRunStatus,
     ProcessType,
@@ -90,8 +93,9 @@ class ExptConfigWriter:
         )
 
         # Exclusive control for parallel updates from multiple processes.
-        lock_path = FileLockUtils.get_lockfile_path(expt_filepath)
-        with FileLock(lock_path, ConfigWriter.FILE_LOCK_TIMEOUT):
+        with FileLockUtils.lock(
+            expt_filepath, ConfigWriter.FILE_LOCK_TIMEOUT, name="experiment_config"
+        ):
             # Read experiment config
             config = ExptConfigReader.read(self.workspace_id, self.unique_id)
 
@@ -296,9 +300,14 @@ class ExptDataWriter:
                 "yaml": glob.glob(
                     os.path.join(directory, "**", "*.yaml"), recursive=True
                 ),
-                "npy": glob.glob(
-                    os.path.join(directory, "**", "*.npy"), recursive=True
-                ),
+                "npy": [
+                    path
+                    for path in glob.glob(
+                        os.path.join(directory, "**", "*.npy"), recursive=True
+                    )
+                    # arrays of node pickles hold no ids
+                    if f"{PICKLE_ARRAYS_SUFFIX}{os.sep}" not in path
+                ],
                 "pkl": glob.glob(
                     os.path.join(directory, "**", "*.pkl"), recursive=True
                 ),
@@ -344,12 +353,11 @@ class ExptDataWriter:
     ) -> None:
         logger = AppLogger.get_logger()
         try:
-            with open(file_path, "rb") as file:
-                data = pickle.load(file)
+            # Note: the arrays saved beside the pickle are copied as they are.
+            data = PickleReader.read(file_path, load_arrays=False)
 
             updated_data = self.__replace_ids_recursive(data, old_id, new_id)
-            with open(file_path, "wb") as file:
-                pickle.dump(updated_data, file)
+            PickleWriter.write(file_path, updated_data)
 
             logger.info(f"Updated Pickle: {file_path}")
         except Exception as e:
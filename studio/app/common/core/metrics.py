@@ -0,0 +1,283 @@
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class MetricsRegistry:
+    """
+    Per-process registry of the metrics, exposed (by /metrics)
+      in the Prometheus text exposition format.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__metrics: Dict[str, "Metric"] = {}
+
+    def register(self, metric: "Metric"):
+        with self.__lock:
+            if metric.name in self.__metrics:
+                raise ValueError(f"Duplicated metric: {metric.name}")
+            self.__metrics[metric.name] = metric
+
+    def get(self, name: str) -> Optional["Metric"]:
+        return self.__metrics.get(name)
+
+    def generate_latest(self) -> str:
+        with self.__lock:
+            metrics = list(self.__metrics.values())
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.TYPE}")
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    pairs = [
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'),
+        )
+        for name, value in labels
+    ]
+    return "{" + ",".join(pairs) + "}"
+
+
+class Metric:
+    """
+    Base of the metrics (the interface follows prometheus_client).
+    """
+
+    TYPE = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: MetricsRegistry = REGISTRY,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        if registry is not None:
+            registry.register(self)
+
+    def _get_key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Invalid labels for {self.name}: {sorted(labels)} "
+                f"(expected: {sorted(self.labelnames)})"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _get_labels(self, key: Tuple[str, ...]) -> List[Tuple[str, str]]:
+        return list(zip(self.labelnames, key))
+
+    def collect(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    TYPE = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        if amount < 0:
+            raise ValueError("Counters can only be incremented.")
+        key = self._get_key(labels)
+        with self._lock:
+            self.__values[key] = self.__values.get(key, 0.0) + amount
+
+    def get(self, **labels) -> float:
+        return self.__values.get(self._get_key(labels), 0.0)
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            values = list(self.__values.items())
+        return [
+            f"{self.name}{_format_labels(self._get_labels(key))} {_format_value(v)}"
+            for key, v in values
+        ]
+
+
+class Gauge(Metric):
+    """
+    *set_function() gives a value read at the scrape (eg. queue length).
+    """
+
+    TYPE = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__values: Dict[Tuple[str, ...], float] = {}
+        self.__function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, **labels):
+        key = self._get_key(labels)
+        with self._lock:
+            self.__values[key] = float(value)
+
+    def set_function(self, function: Callable[[], float]):
+        assert not self.labelnames, "set_function is only for unlabeled gauges."
+        self.__function = function
+
+    def get(self, **labels) -> float:
+        if self.__function is not None:
+            return float(self.__function())
+        return self.__values.get(self._get_key(labels), 0.0)
+
+    def collect(self) -> List[str]:
+        if self.__function is not None:
+            return [f"{self.name} {_format_value(self.get())}"]
+
+        with self._lock:
+            values = list(self.__values.items())
+        return [
+            f"{self.name}{_format_labels(self._get_labels(key))} {_format_value(v)}"
+            for key, v in values
+        ]
+
+
+class Histogram(Metric):
+    TYPE = "histogram"
+    DEFAULT_BUCKETS = (
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+        30.0,
+        60.0,
+    )
+
+    def __init__(self, *args, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # {key: [bucket counts (not cumulative)..., sum]}
+        self.__values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._get_key(labels)
+        with self._lock:
+            values = self.__values.setdefault(key, [0] * len(self.buckets) + [0.0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    values[i] += 1
+                    break
+            values[-1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """
+        Observe the duration (sec) of the block.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def get_count(self, **labels) -> int:
+        values = self.__values.get(self._get_key(labels))
+        return int(sum(values[:-1])) if values else 0
+
+    def get_sum(self, **labels) -> float:
+        values = self.__values.get(self._get_key(labels))
+        return values[-1] if values else 0.0
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(values)) for key, values in self.__values.items()]
+
+        lines = []
+        for key, values in items:
+            labels = self._get_labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets, values):
+                cumulative += count
+                bucket_labels = _format_labels(labels + [("le", _format_value(bound))])
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+            lines.append(
+                f"{self.name}_sum{_format_labels(labels)} {_format_value(values[-1])}"
+            )
+        return lines
+
+
+HTTP_REQUESTS = Counter(
+    "optinist_http_requests_total",
+    "HTTP requests handled by the API server.",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "optinist_http_request_duration_seconds",
+    "HTTP request latency (until the response is sent).",
+    ["method", "route"],
+)
+
+
+class HTTPMetricsMiddleware:
+    """
+    ASGI middleware recording the request count and latency per route.
+
+    Note: the route path template (eg. "/outputs/data/{filepath:path}")
+      is used as the label, so that the label values are bounded.
+    """
+
+    UNMATCHED_ROUTE = "<unmatched>"
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = getattr(scope.get("route"), "path", self.UNMATCHED_ROUTE)
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start, method=scope["method"], route=route
+            )
+            HTTP_REQUESTS.inc(
+                method=scope["method"], route=route, status=str(status_code)
+            )
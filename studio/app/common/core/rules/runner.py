@@ -1,4 +1,3 @@
-import copy
 import gc
 import json
 import os
@@ -7,8 +6,6 @@ import traceback
 from dataclasses import asdict
 from pathlib import Path
 
-from filelock import FileLock
-
 from studio.app.common.core.experiment.experiment import ExptOutputPathIds
 from studio.app.common.core.logger import AppLogger
 from studio.app.common.core.snakemake.smk import Rule
@@ -18,16 +15,18 @@ from studio.app.common.core.utils.file_reader import JsonReader
 from studio.app.common.core.utils.filelock_handler import FileLockUtils
 from studio.app.common.core.utils.filepath_creater import join_filepath
 from studio.app.common.core.utils.filepath_finder import find_condaenv_filepath
-from studio.app.common.core.utils.pickle_handler import PickleReader, PickleWriter
+from studio.app.common.core.utils.pickle_handler import (
+    PickleReader,
+    PickleWriter,
+    map_arrays_readonly,
+)
+from studio.app.common.core.workflow.workflow import NodeRunStatus
+from studio.app.common.core.workflow.workflow_node_metrics import WorkflowNodeMetrics
+from studio.app.common.core.workflow.workflow_status_events import WorkflowStatusEvents
+from studio.app.common.core.wrapper_registry import WrapperRegistry
 from studio.app.common.schemas.workflow import WorkflowPIDFileData
 from studio.app.dir_path import DIRPATH
 from studio.app.optinist.core.nwb.nwb import NWBDATASET
-from studio.app.optinist.core.nwb.nwb_creater import (
-    merge_nwbfile,
-    overwrite_nwbfile,
-    save_nwb,
-)
-from studio.app.wrappers import wrapper_dict
 
 logger = AppLogger.get_logger()
 
@@ -37,16 +36,25 @@ class Runner:
 
     @classmethod
     def run(cls, __rule: Rule, last_output, run_script_path: str):
+        metrics = WorkflowNodeMetrics()
         try:
             logger.info("start rule runner")
 
             # write pid file
             workflow_dirpath = str(Path(__rule.output).parent.parent)
             cls.write_pid_file(workflow_dirpath, __rule.type, run_script_path)
+            cls.__emit_status(__rule.output, NodeRunStatus.RUNNING)
 
             input_info = cls.read_input_info(__rule.input)
             cls.__change_dict_key_exist(input_info, __rule)
-            nwbfile = input_info["nwbfile"]
+            # Note: the results of the upstream nodes in nwbfile are mapped again
+            #   read-only (before the function may change its copy-on-write inputs,
+            #   which share the arrays), so that their arrays are linked
+            #   (not copied) to the output pickle.
+            nwbfile = {
+                name: value if name == "input" else map_arrays_readonly(value)
+                for name, value in input_info["nwbfile"].items()
+            }
 
             # input_info
             for key in list(input_info):
@@ -70,6 +78,10 @@ class Runner:
                 output_info,
             )
 
+            # Note: the metrics are saved before the node pickle,
+            #   which tells the watchers that the node has finished.
+            metrics.save(os.path.dirname(__rule.output))
+
             # 各関数での結果を保存
             PickleWriter.write(__rule.output, output_info)
 
@@ -81,6 +93,7 @@ class Runner:
                 cls.save_all_nwb(path, output_info["nwbfile"])
 
             logger.info("rule output: %s", __rule.output)
+            cls.__emit_status(__rule.output, NodeRunStatus.SUCCESS)
 
             del input_info, output_info
             gc.collect()
@@ -91,7 +104,21 @@ class Runner:
             logger.error("\n".join(err_msg))
 
             # save error info to node pickle data.
+            metrics.save(os.path.dirname(__rule.output))
             PickleWriter.write_error(__rule.output, e)
+            cls.__emit_status(__rule.output, NodeRunStatus.ERROR)
+
+    @classmethod
+    def __emit_status(cls, rule_output: str, status: NodeRunStatus):
+        try:
+            ids = ExptOutputPathIds(os.path.dirname(rule_output))
+            WorkflowStatusEvents.emit(
+                ids.workspace_id, ids.unique_id, ids.function_id, status.value
+            )
+        except Exception as e:
+            # Note: status events are only notifications for watchers,
+            #   the node result itself is in the pickle file.
+            logger.warning(f"Failed to emit node status: {e}")
 
     @classmethod
     def __get_pid_file_path(cls, workspace_id: str, unique_id: str) -> str:
@@ -152,6 +179,9 @@ class Runner:
 
     @classmethod
     def __save_func_nwb(cls, save_path, name, nwbfile, output_info):
+        # Note: pynwb is imported on use (Runner is also imported by the API server).
+        from studio.app.optinist.core.nwb.nwb_creater import save_nwb
+
         if "nwbfile" in output_info:
             nwbfile[name] = output_info["nwbfile"]
             save_nwb(
@@ -163,6 +193,12 @@ class Runner:
 
     @classmethod
     def save_all_nwb(cls, save_path, all_nwbfile):
+        from studio.app.optinist.core.nwb.nwb_creater import (
+            merge_nwbfile,
+            overwrite_nwbfile,
+            save_nwb,
+        )
+
         input_nwbfile = all_nwbfile["input"]
         all_nwbfile.pop("input")
         nwbconfig = {}
@@ -170,8 +206,7 @@ class Runner:
             nwbconfig = merge_nwbfile(nwbconfig, x)
 
         # Controls locking for simultaneous writing to nwbfile from multiple nodes.
-        lock_path = FileLockUtils.get_lockfile_path(save_path)
-        with FileLock(lock_path, timeout=120):
+        with FileLockUtils.lock(save_path, timeout=120, name="whole_nwb"):
             if os.path.exists(save_path):
                 overwrite_nwbfile(save_path, nwbconfig)
             else:
@@ -179,12 +214,10 @@ class Runner:
 
     @classmethod
     def __execute_function(cls, path, params, nwb_params, output_dir, input_info):
-        wrapper = cls.__dict2leaf(wrapper_dict, path.split("/"))
-        func = copy.deepcopy(wrapper["function"])
-        output_info = func(
+        wrapper = WrapperRegistry.get_wrapper(path)
+        output_info = wrapper["function"](
             params=params, nwbfile=nwb_params, output_dir=output_dir, **input_info
         )
-        del func
         gc.collect()
 
         try:
@@ -252,20 +285,14 @@ class Runner:
 
     @classmethod
     def __deep_merge(cls, dict1, dict2):
+        """
+        Merge dict2 into dict1 (in place, values are not copied).
+        """
         if not isinstance(dict1, dict) or not isinstance(dict2, dict):
             return dict2
-        merged = dict1.copy()
         for k, v in dict2.items():
-            if k in merged and isinstance(merged[k], dict):
-                merged[k] = cls.__deep_merge(merged[k], v)
+            if k in dict1 and isinstance(dict1[k], dict):
+                dict1[k] = cls.__deep_merge(dict1[k], v)
             else:
-                merged[k] = v
-        return merged
-
-    @classmethod
-    def __dict2leaf(cls, root_dict: dict, path_list):
-        path = path_list.pop(0)
-        if len(path_list) > 0:
-            return cls.__dict2leaf(root_dict[path], path_list)
-        else:
-            return root_dict[path]
+                dict1[k] = v
+        return dict1
@@ -15,6 +15,7 @@ class Rule:
     hdf5Path: str = None
     matPath: str = None
     path: str = None
+    resources: dict = None  # {"threads": int, "mem_mb": int}
 
 
 @dataclass
@@ -43,3 +44,5 @@ class SmkParam:
     forcetargets: bool
     lock: bool
     forcerun: List[ForceRun] = field(default_factory=list)
+    # memory allowance of the workflow (shared by the running nodes)
+    mem_mb: int = None
@@ -12,6 +12,7 @@ class RuleBuilder:
         self._hdf5Path = None
         self._matPath = None
         self._path = None
+        self._resources = None
 
     def set_input(self, input, workspace_id=None) -> "RuleBuilder":
         if workspace_id:
@@ -55,6 +56,10 @@ class RuleBuilder:
         self._path = path
         return self
 
+    def set_resources(self, resources) -> "RuleBuilder":
+        self._resources = resources
+        return self
+
     def build(self) -> Rule:
         return Rule(
             input=self._input,
@@ -66,4 +71,5 @@ class RuleBuilder:
             hdf5Path=self._hdf5Path,
             matPath=self._matPath,
             path=self._path,
+            resources=self._resources,
         )
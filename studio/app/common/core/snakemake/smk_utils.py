@@ -11,16 +11,18 @@ from studio.app.common.core.logger import AppLogger
 from studio.app.common.core.snakemake.smk import Rule
 from studio.app.common.core.snakemake.snakemake_reader import SmkConfigReader
 from studio.app.common.core.utils.filepath_creater import join_filepath
-from studio.app.common.core.utils.filepath_finder import find_condaenv_filepath
 from studio.app.common.core.workflow.workflow import NodeType, NodeTypeUtil, ProcessType
+from studio.app.common.core.wrapper_registry import WrapperRegistry
 from studio.app.const import FILETYPE
 from studio.app.dir_path import DIRPATH
-from studio.app.wrappers import wrapper_dict
 
 logger = AppLogger.get_logger()
 
 
 class SmkUtils:
+    # resources of a node, unless declared in the wrapper metadata ("resources")
+    DEFAULT_RESOURCES = {"threads": 1, "mem_mb": 1000}
+
     @classmethod
     def input(cls, details):
         if NodeTypeUtil.check_nodetype_from_filetype(details["type"]) == NodeType.DATA:
@@ -35,6 +37,28 @@ class SmkUtils:
     def output(cls, details):
         return join_filepath([DIRPATH.OUTPUT_DIR, details["output"]])
 
+    @classmethod
+    def threads(cls, details):
+        resources = details.get("resources") or cls.DEFAULT_RESOURCES
+        return resources["threads"]
+
+    @classmethod
+    def mem_mb(cls, details):
+        resources = details.get("resources") or cls.DEFAULT_RESOURCES
+        return resources["mem_mb"]
+
+    @classmethod
+    def get_wrapper_resources(cls, wrapper_path: str) -> Dict[str, int]:
+        """
+        Resources (threads, mem_mb) declared in the wrapper metadata.
+        """
+        try:
+            wrapper = WrapperRegistry.get_wrapper(wrapper_path)
+        except KeyError:
+            return dict(cls.DEFAULT_RESOURCES)
+
+        return {**cls.DEFAULT_RESOURCES, **wrapper.get("resources", {})}
+
     @classmethod
     def dict2leaf(cls, root_dict: dict, path_list):
         """Recursively unpacks nested dictionary using path list to get leaf value"""
@@ -46,11 +70,7 @@ class SmkUtils:
 
     @classmethod
     def get_conda_env_filepath(cls, conda_name) -> str:
-        conda_env_filepath = f"{DIRPATH.CONDAENV_DIR}/envs/{conda_name}"
-        if os.path.exists(conda_env_filepath):
-            return conda_env_filepath
-        else:
-            return find_condaenv_filepath(conda_name)
+        return WrapperRegistry.get_conda_env_filepath(conda_name)
 
     @classmethod
     def conda(cls, details):
@@ -65,7 +85,7 @@ class SmkUtils:
         ]:
             return None
 
-        wrapper = cls.dict2leaf(wrapper_dict, details["path"].split("/"))
+        wrapper = WrapperRegistry.get_wrapper(details["path"])
 
         if "conda_name" in wrapper:
             conda_name = wrapper["conda_name"]
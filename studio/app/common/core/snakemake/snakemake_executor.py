@@ -1,5 +1,4 @@
 import asyncio
-import os
 from collections import deque
 from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List
@@ -17,7 +16,11 @@ from studio.app.common.core.storage.remote_storage_controller import (
     RemoteSyncStatusFileUtil,
 )
 from studio.app.common.core.utils.filepath_creater import get_pickle_file, join_filepath
+from studio.app.common.core.utils.pickle_handler import PickleWriter
 from studio.app.common.core.workflow.workflow import Edge, Node
+from studio.app.common.core.workflow.workflow_process_status import (
+    WorkflowProcessStatus,
+)
 from studio.app.common.core.workflow.workflow_result import WorkflowResult
 from studio.app.common.core.workspace.workspace_data_capacity_services import (
     WorkspaceDataCapacityService,
@@ -57,16 +60,24 @@ def _snakemake_execute_process(
         ]
     )
 
-    result = snakemake(
-        DIRPATH.SNAKEMAKE_FILEPATH,
-        forceall=params.forceall,
-        cores=params.cores,
-        use_conda=params.use_conda,
-        conda_prefix=DIRPATH.SNAKEMAKE_CONDA_ENV_DIR,
-        workdir=smk_workdir,
-        configfiles=[SmkConfigReader.get_config_yaml_path(workspace_id, unique_id)],
-        log_handler=[smk_logger.log_handler],
-    )
+    # record this process (and its children) with heartbeats for the watchers
+    process_status = WorkflowProcessStatus(workspace_id, unique_id)
+    process_status.start()
+
+    try:
+        result = snakemake(
+            DIRPATH.SNAKEMAKE_FILEPATH,
+            forceall=params.forceall,
+            cores=params.cores,
+            resources={"mem_mb": params.mem_mb} if params.mem_mb else {},
+            use_conda=params.use_conda,
+            conda_prefix=DIRPATH.SNAKEMAKE_CONDA_ENV_DIR,
+            workdir=smk_workdir,
+            configfiles=[SmkConfigReader.get_config_yaml_path(workspace_id, unique_id)],
+            log_handler=[smk_logger.log_handler],
+        )
+    finally:
+        process_status.stop()
 
     if result:
         logger.info("snakemake_execute succeeded.")
@@ -141,8 +152,7 @@ def delete_dependencies(
         )
         # logger.debug(pickle_filepath)
 
-        if os.path.exists(pickle_filepath):
-            os.remove(pickle_filepath)
+        PickleWriter.remove(pickle_filepath)
 
         # 全てのedgeを見て、node_idがsourceならtargetをqueueに追加する
         for edge in edgeDict.values():
@@ -173,5 +183,4 @@ def delete_procs_dependencies(
             ]
         )
 
-        if os.path.exists(pickle_filepath):
-            os.remove(pickle_filepath)
+        PickleWriter.remove(pickle_filepath)
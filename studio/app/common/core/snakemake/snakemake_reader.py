@@ -20,6 +20,7 @@ class RuleConfigReader:
             hdf5Path=rule["hdf5Path"],
             matPath=rule["matPath"],
             path=rule["path"],
+            resources=rule.get("resources"),
         )
 
 
@@ -2,6 +2,7 @@ from typing import Dict
 
 from studio.app.common.core.snakemake.smk import Rule
 from studio.app.common.core.snakemake.smk_builder import RuleBuilder
+from studio.app.common.core.snakemake.smk_utils import SmkUtils
 from studio.app.common.core.utils.filepath_creater import get_pickle_file
 from studio.app.common.core.workflow.workflow import Edge, Node, NodeType, ProcessType
 from studio.app.common.core.workflow.workflow_params import get_typecheck_params
@@ -43,6 +44,7 @@ class SmkRule:
             .set_params(self._node.data.param)
             .set_output(_output_file)
             .set_nwbfile(self._nwbfile)
+            .set_resources(dict(SmkUtils.DEFAULT_RESOURCES))
         )
 
     def image(self) -> Rule:
@@ -109,6 +111,7 @@ class SmkRule:
             .set_path(self._node.data.path)
             .set_type(self._node.data.label)
             .set_nwbfile(self._nwbfile)
+            .set_resources(SmkUtils.get_wrapper_resources(self._node.data.path))
             .build()
         )
 
@@ -1,5 +1,6 @@
 import os
 import shutil
+import uuid
 from glob import glob
 
 from studio.app.common.core.logger import AppLogger
@@ -27,6 +28,7 @@ class MockStorageController(BaseRemoteStorageController):
     )
     MOCK_INPUT_DIR = f"{MOCK_STORAGE_DIR}/input"
     MOCK_OUTPUT_DIR = f"{MOCK_STORAGE_DIR}/output"
+    MOCK_MULTIPART_DIR = f"{MOCK_STORAGE_DIR}/multipart"
 
     def __init__(self):
         # initialization: create directories
@@ -133,6 +135,79 @@ class MockStorageController(BaseRemoteStorageController):
 
         return True
 
+    async def create_input_data_multipart_upload(
+        self, workspace_id: str, filename: str
+    ) -> str:
+        upload_id = uuid.uuid4().hex
+
+        logger.debug(
+            "create multipart upload to remote storage (mock). [%s] [%s]",
+            self._make_input_data_remote_path(workspace_id, filename),
+            upload_id,
+        )
+
+        create_directory(join_filepath([__class__.MOCK_MULTIPART_DIR, upload_id]))
+
+        return upload_id
+
+    async def upload_input_data_part(
+        self,
+        workspace_id: str,
+        filename: str,
+        upload_id: str,
+        part_number: int,
+        data: bytes,
+    ) -> dict:
+        part_path = join_filepath(
+            [__class__.MOCK_MULTIPART_DIR, upload_id, f"{part_number:05}"]
+        )
+
+        # Note: re-uploading the same part_number overwrites the part.
+        with open(part_path, "wb") as f:
+            f.write(data)
+
+        return {"PartNumber": part_number, "ETag": f"{upload_id}-{part_number}"}
+
+    async def complete_input_data_multipart_upload(
+        self, workspace_id: str, filename: str, upload_id: str, parts: list
+    ) -> bool:
+        input_data_remote_path = self._make_input_data_remote_path(
+            workspace_id, filename
+        )
+        multipart_dir = join_filepath([__class__.MOCK_MULTIPART_DIR, upload_id])
+
+        logger.debug(
+            "complete multipart upload to remote storage (mock). [%s] [%s parts]",
+            input_data_remote_path,
+            len(parts),
+        )
+
+        # ----------------------------------------
+        # exec uploading (concatenate parts)
+        # ----------------------------------------
+
+        create_directory(os.path.dirname(input_data_remote_path))
+
+        with open(input_data_remote_path, "wb") as f:
+            for part in sorted(parts, key=lambda p: p["PartNumber"]):
+                part_path = join_filepath([multipart_dir, f"{part['PartNumber']:05}"])
+                with open(part_path, "rb") as part_file:
+                    shutil.copyfileobj(part_file, f)
+
+        shutil.rmtree(multipart_dir)
+
+        return True
+
+    async def abort_input_data_multipart_upload(
+        self, workspace_id: str, filename: str, upload_id: str
+    ) -> bool:
+        multipart_dir = join_filepath([__class__.MOCK_MULTIPART_DIR, upload_id])
+
+        if os.path.isdir(multipart_dir):
+            shutil.rmtree(multipart_dir)
+
+        return True
+
     async def download_all_experiments_metas(self, workspace_ids: list = None) -> bool:
         # ----------------------------------------
         # make paths
@@ -2,16 +2,30 @@ import datetime
 import json
 import os
 import shutil
+import time
 from abc import ABCMeta, abstractmethod
 from enum import Enum
+from typing import List
 
 from studio.app.common.core.logger import AppLogger
+from studio.app.common.core.metrics import Counter, Histogram
 from studio.app.common.core.snakemake.smk_utils import SmkUtils
 from studio.app.common.core.utils.filepath_creater import join_filepath
 from studio.app.dir_path import DIRPATH
 
 logger = AppLogger.get_logger()
 
+REMOTE_STORAGE_TRANSFER_BYTES = Counter(
+    "optinist_remote_storage_transfer_bytes_total",
+    "Bytes transferred from/to the remote storage.",
+    ["direction"],
+)
+REMOTE_STORAGE_TRANSFER_DURATION = Histogram(
+    "optinist_remote_storage_transfer_seconds",
+    "Duration of the transfers from/to the remote storage.",
+    ["direction", "target"],
+)
+
 
 class RemoteStorageType(Enum):
     NO_USE = "0"
@@ -358,6 +372,49 @@ class BaseRemoteStorageController(metaclass=ABCMeta):
         delete input data from remote storage.
         """
 
+    @abstractmethod
+    def create_input_data_multipart_upload(
+        self, workspace_id: str, filename: str
+    ) -> str:
+        """
+        start multipart upload of input data to remote storage.
+
+        Returns:
+            upload_id str
+        """
+
+    @abstractmethod
+    def upload_input_data_part(
+        self,
+        workspace_id: str,
+        filename: str,
+        upload_id: str,
+        part_number: int,
+        data: bytes,
+    ) -> dict:
+        """
+        upload a part (1-based part_number) of multipart upload to remote storage.
+
+        Returns:
+            part info dict ({"PartNumber": int, "ETag": str})
+        """
+
+    @abstractmethod
+    def complete_input_data_multipart_upload(
+        self, workspace_id: str, filename: str, upload_id: str, parts: list
+    ) -> bool:
+        """
+        complete multipart upload of input data with the uploaded parts.
+        """
+
+    @abstractmethod
+    def abort_input_data_multipart_upload(
+        self, workspace_id: str, filename: str, upload_id: str
+    ) -> bool:
+        """
+        abort multipart upload of input data, and discard the uploaded parts.
+        """
+
     @abstractmethod
     def download_all_experiments_metas(self, workspace_ids: list = None) -> bool:
         """
@@ -518,15 +575,97 @@ class RemoteStorageController(BaseRemoteStorageController):
 
         return True
 
+    @staticmethod
+    def __get_data_size(path: str) -> int:
+        if os.path.isfile(path):
+            return os.path.getsize(path)
+
+        data_size = 0
+        for dirpath, _, filenames in os.walk(path):
+            for filename in filenames:
+                filepath = join_filepath([dirpath, filename])
+                if os.path.isfile(filepath):
+                    data_size += os.path.getsize(filepath)
+        return data_size
+
+    def __observe_transfer(
+        self, direction: str, target: str, start: float, paths: List[str]
+    ):
+        """
+        Record the transfer (size of the local data) to the metrics.
+        """
+        REMOTE_STORAGE_TRANSFER_DURATION.observe(
+            time.perf_counter() - start, direction=direction, target=target
+        )
+        REMOTE_STORAGE_TRANSFER_BYTES.inc(
+            sum(self.__get_data_size(path) for path in paths), direction=direction
+        )
+
     async def download_input_data(self, workspace_id: str, filename: str) -> bool:
-        return await self.__controller.download_input_data(workspace_id, filename)
+        start = time.perf_counter()
+        result = await self.__controller.download_input_data(workspace_id, filename)
+        if result:
+            self.__observe_transfer(
+                "download",
+                "input_data",
+                start,
+                [self._make_input_data_local_path(workspace_id, filename)],
+            )
+        return result
 
     async def upload_input_data(self, workspace_id: str, filename: str) -> bool:
-        return await self.__controller.upload_input_data(workspace_id, filename)
+        start = time.perf_counter()
+        result = await self.__controller.upload_input_data(workspace_id, filename)
+        if result:
+            self.__observe_transfer(
+                "upload",
+                "input_data",
+                start,
+                [self._make_input_data_local_path(workspace_id, filename)],
+            )
+        return result
 
     async def delete_input_data(self, workspace_id: str, filename: str) -> bool:
         return await self.__controller.delete_input_data(workspace_id, filename)
 
+    async def create_input_data_multipart_upload(
+        self, workspace_id: str, filename: str
+    ) -> str:
+        return await self.__controller.create_input_data_multipart_upload(
+            workspace_id, filename
+        )
+
+    async def upload_input_data_part(
+        self,
+        workspace_id: str,
+        filename: str,
+        upload_id: str,
+        part_number: int,
+        data: bytes,
+    ) -> dict:
+        with REMOTE_STORAGE_TRANSFER_DURATION.time(
+            direction="upload", target="input_data_part"
+        ):
+            result = await self.__controller.upload_input_data_part(
+                workspace_id, filename, upload_id, part_number, data
+            )
+        REMOTE_STORAGE_TRANSFER_BYTES.inc(len(data), direction="upload")
+        return result
+
+    async def complete_input_data_multipart_upload(
+        self, workspace_id: str, filename: str, upload_id: str, parts: list
+    ) -> bool:
+        return await self.__controller.complete_input_data_multipart_upload(
+            workspace_id, filename, upload_id, parts
+        )
+
+    async def abort_input_data_multipart_upload(
+        self, workspace_id: str, filename: str, upload_id: str
+    ) -> bool:
+        return await self.__controller.abort_input_data_multipart_upload(
+            workspace_id, filename, upload_id
+        )
+
     async def download_all_experiments_metas(self, workspace_ids: list = None) -> bool:
         """
         Args:
@@ -551,9 +690,17 @@ class RemoteStorageController(BaseRemoteStorageController):
             )
 
             # download experiment data
+            start = time.perf_counter()
             result = await self.__controller.download_experiment(
                 workspace_id, unique_id
             )
+            if result:
+                self.__observe_transfer(
+                    "download",
+                    "experiment",
+                    start,
+                    [self._make_experiment_local_path(workspace_id, unique_id)],
+                )
 
             # download input data
             # *Download the input data related to the experiment data as well.
@@ -592,9 +739,24 @@ class RemoteStorageController(BaseRemoteStorageController):
                 **sync_status_params
             )
 
+            start = time.perf_counter()
             result = await self.__controller.upload_experiment(
                 workspace_id, unique_id, target_files
             )
+            if result:
+                experiment_local_path = self._make_experiment_local_path(
+                    workspace_id, unique_id
+                )
+                self.__observe_transfer(
+                    "upload",
+                    "experiment",
+                    start,
+                    (
+                        [f"{experiment_local_path}/{f}" for f in target_files]
+                        if target_files
+                        else [experiment_local_path]
+                    ),
+                )
 
             # update sync status file
             RemoteSyncStatusFileUtil.create_sync_status_file_for_success(
@@ -223,6 +223,93 @@ class S3StorageController(BaseRemoteStorageController):
 
         return True
 
+    async def create_input_data_multipart_upload(
+        self, workspace_id: str, filename: str
+    ) -> str:
+        input_data_remote_path = self._make_input_data_remote_path(
+            workspace_id, filename
+        )
+
+        async with self.__get_s3_client() as __s3_client:
+            response = await __s3_client.create_multipart_upload(
+                Bucket=self.bucket_name, Key=input_data_remote_path
+            )
+
+        logger.debug(
+            "create multipart upload to S3. [%s] [%s] [%s]",
+            self.bucket_name,
+            input_data_remote_path,
+            response["UploadId"],
+        )
+
+        return response["UploadId"]
+
+    async def upload_input_data_part(
+        self,
+        workspace_id: str,
+        filename: str,
+        upload_id: str,
+        part_number: int,
+        data: bytes,
+    ) -> dict:
+        """
+        Note: S3 requires parts of at least 5MiB (except the last part).
+        """
+        input_data_remote_path = self._make_input_data_remote_path(
+            workspace_id, filename
+        )
+
+        async with self.__get_s3_client() as __s3_client:
+            response = await __s3_client.upload_part(
+                Bucket=self.bucket_name,
+                Key=input_data_remote_path,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=data,
+            )
+
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    async def complete_input_data_multipart_upload(
+        self, workspace_id: str, filename: str, upload_id: str, parts: list
+    ) -> bool:
+        input_data_remote_path = self._make_input_data_remote_path(
+            workspace_id, filename
+        )
+
+        logger.debug(
+            "complete multipart upload to S3. [%s] [%s] [%s parts]",
+            self.bucket_name,
+            input_data_remote_path,
+            len(parts),
+        )
+
+        async with self.__get_s3_client() as __s3_client:
+            await __s3_client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=input_data_remote_path,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": sorted(parts, key=lambda p: p["PartNumber"])},
+            )
+
+        return True
+
+    async def abort_input_data_multipart_upload(
+        self, workspace_id: str, filename: str, upload_id: str
+    ) -> bool:
+        input_data_remote_path = self._make_input_data_remote_path(
+            workspace_id, filename
+        )
+
+        async with self.__get_s3_client() as __s3_client:
+            await __s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=input_data_remote_path,
+                UploadId=upload_id,
+            )
+
+        return True
+
     async def download_all_experiments_metas(self, workspace_ids: list = None) -> bool:
         # Whether to use AWS CLI to download user metadata
         USE_AWS_CLI_FOR_DOWNLOADING = (
@@ -1,7 +1,6 @@
 import os
 
 import yaml
-from filelock import FileLock
 
 from studio.app.common.core.utils.filelock_handler import FileLockUtils
 from studio.app.common.core.utils.filepath_creater import (
@@ -51,8 +50,7 @@ class ConfigWriter:
 
         if auto_file_lock:
             # Exclusive control for parallel updates from multiple processes.
-            lock_path = FileLockUtils.get_lockfile_path(config_path)
-            with FileLock(lock_path, cls.FILE_LOCK_TIMEOUT):
+            with FileLockUtils.lock(config_path, cls.FILE_LOCK_TIMEOUT, name="config"):
                 cls.__write(config_path, config)
         else:
             cls.__write(config_path, config)
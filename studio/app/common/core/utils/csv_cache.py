@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import shutil
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from studio.app.common.core.utils.filepath_creater import (
+    create_directory,
+    join_filepath,
+)
+
+
+class CsvTable:
+    """
+    Parsed csv table read from the cache, column by column (memory-mapped).
+    """
+
+    def __init__(self, dirpath: str, meta: dict):
+        self.dirpath = dirpath
+        self.shape = tuple(meta["shape"])
+        self.nulls: Dict[str, List[int]] = meta["nulls"]
+
+    def get_column(self, column: int, start: int, end: int) -> list:
+        column_path = join_filepath([self.dirpath, f"{column}.npy"])
+        values = np.load(column_path, mmap_mode="r")[start:end]
+
+        if values.dtype.kind == "f":
+            nan = np.isnan(values)
+            values = values.astype(object)
+            values[nan] = None
+        values = values.tolist()
+
+        for row in self.nulls.get(str(column), []):
+            if start <= row < end:
+                values[row - start] = None
+
+        return values
+
+    def get_values(
+        self, rows: slice = slice(None), columns: slice = slice(None), transpose=False
+    ) -> List[list]:
+        """
+        Returns the rows x columns range (of the transposed table if transpose).
+        """
+        n_rows, n_columns = self.shape[::-1] if transpose else self.shape
+        row_range, column_range = range(n_rows)[rows], range(n_columns)[columns]
+
+        if transpose:
+            return [
+                self.get_column(row, column_range.start, column_range.stop)
+                for row in row_range
+            ]
+
+        values = [
+            self.get_column(column, row_range.start, row_range.stop)
+            for column in column_range
+        ]
+        return (
+            [list(row) for row in zip(*values)] if values else [[] for _ in row_range]
+        )
+
+
+class CsvCache:
+    """
+    Cache of the parsed csv files in a binary columnar form.
+
+    The table parsed with READ_OPTIONS is saved as one .npy file per column,
+      keyed by the file path, mtime, size and the parsing options,
+      so that previews of the same file are served without parsing it again,
+      reading only the requested range.
+    Columns which are not numeric (eg. with a header row) are saved as text,
+      so that their cells are returned as written in the file,
+      and their empty cells are kept in the meta file ({column: [row]}).
+    """
+
+    CACHE_DIRNAME = ".csv_cache"
+    META_FILENAME = "meta.json"
+    READ_OPTIONS = {"header": None}
+    # Note: increment when the cache format changes.
+    VERSION = 2
+
+    @classmethod
+    def get_cache_key(cls, csv_filepath: str) -> str:
+        stat = os.stat(csv_filepath)
+        key = json.dumps(
+            {
+                "path": os.path.abspath(csv_filepath),
+                "mtime": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "options": cls.READ_OPTIONS,
+                "version": cls.VERSION,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+    @classmethod
+    def read(cls, csv_filepath: str, cache_root: str) -> CsvTable:
+        """
+        Returns the table of the csv, parsed (and cached under cache_root)
+          if it is not cached yet or the file has changed.
+        """
+        cache_dirpath = join_filepath(
+            [cache_root, cls.CACHE_DIRNAME, cls.get_cache_key(csv_filepath)]
+        )
+
+        meta = cls.__read_meta(cache_dirpath)
+        if meta is None:
+            meta = cls.__write(csv_filepath, cache_dirpath)
+
+        return CsvTable(cache_dirpath, meta)
+
+    @classmethod
+    def is_cached(cls, csv_filepath: str, cache_root: str) -> bool:
+        cache_dirpath = join_filepath(
+            [cache_root, cls.CACHE_DIRNAME, cls.get_cache_key(csv_filepath)]
+        )
+        return cls.__read_meta(cache_dirpath) is not None
+
+    @classmethod
+    def __read_meta(cls, cache_dirpath: str) -> Optional[dict]:
+        try:
+            with open(join_filepath([cache_dirpath, cls.META_FILENAME])) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    @classmethod
+    def __write(cls, csv_filepath: str, cache_dirpath: str) -> dict:
+        df = pd.read_csv(csv_filepath, **cls.READ_OPTIONS)
+        # Note: the text columns are read again as str, since a column parsed
+        #   in chunks can mix the numbers and the strings of its cells.
+        text_columns = [
+            i for i, column in df.items() if column.dtype.kind not in "biuf"
+        ]
+        if text_columns:
+            df[text_columns] = pd.read_csv(
+                csv_filepath, usecols=text_columns, dtype=str, **cls.READ_OPTIONS
+            )
+
+        # Note: written to a temporary directory and renamed,
+        #   so that readers never see a partially written cache.
+        tmp_dirpath = f"{cache_dirpath}.{os.getpid()}.tmp"
+        create_directory(tmp_dirpath, delete_dir=True)
+
+        nulls = {}
+        for i, (_, column) in enumerate(df.items()):
+            if column.dtype.kind in "biuf":
+                values = column.to_numpy()
+            else:
+                is_null = column.isna().to_numpy()
+                if is_null.any():
+                    nulls[str(i)] = np.flatnonzero(is_null).tolist()
+                values = column.to_numpy(dtype=str)
+            np.save(join_filepath([tmp_dirpath, f"{i}.npy"]), values)
+
+        meta = {"shape": list(df.shape), "nulls": nulls}
+        with open(join_filepath([tmp_dirpath, cls.META_FILENAME]), "w") as f:
+            json.dump(meta, f)
+
+        # Note: the caches of the previous versions of the file are removed.
+        cache_parent = os.path.dirname(cache_dirpath)
+        for name in os.listdir(cache_parent):
+            if "." not in name and name != os.path.basename(cache_dirpath):
+                shutil.rmtree(join_filepath([cache_parent, name]), ignore_errors=True)
+
+        try:
+            os.rename(tmp_dirpath, cache_dirpath)
+        except OSError:
+            # written by another request in the meantime
+            shutil.rmtree(tmp_dirpath, ignore_errors=True)
+
+        return meta
@@ -1,8 +1,24 @@
 import hashlib
 import os
+import time
+from contextlib import contextmanager
 
+from filelock import FileLock, Timeout
+
+from studio.app.common.core.metrics import Counter, Histogram
 from studio.app.dir_path import DIRPATH
 
+FILE_LOCK_WAIT = Histogram(
+    "optinist_file_lock_wait_seconds",
+    "Time waited to acquire the file locks.",
+    ["lock"],
+)
+FILE_LOCK_TIMEOUTS = Counter(
+    "optinist_file_lock_timeouts_total",
+    "File locks not acquired within the timeout.",
+    ["lock"],
+)
+
 
 class FileLockUtils:
     @classmethod
@@ -21,3 +37,26 @@ class FileLockUtils:
         )
 
         return lockfile_path
+
+    @classmethod
+    @contextmanager
+    def lock(cls, file_path: str, timeout: float, name: str):
+        """
+        Exclusive lock (FileLock) of the file, recording the wait time.
+        *name is the kind of the lock (metrics label), eg. "experiment_config".
+        """
+        file_lock = FileLock(cls.get_lockfile_path(file_path), timeout=timeout)
+
+        start = time.perf_counter()
+        try:
+            file_lock.acquire()
+        except Timeout:
+            FILE_LOCK_TIMEOUTS.inc(lock=name)
+            raise
+        finally:
+            FILE_LOCK_WAIT.observe(time.perf_counter() - start, lock=name)
+
+        try:
+            yield file_lock
+        finally:
+            file_lock.release()
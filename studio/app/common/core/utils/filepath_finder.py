@@ -2,22 +2,49 @@ import datetime
 import os
 import re
 from glob import glob
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from studio.app.common.core.utils.filepath_creater import join_filepath
 from studio.app.dir_path import CORE_PARAM_PATH, DIRPATH
 
+# Cache yaml filepaths under the wrappers directories (performance consideration)
+#   {(category, name): filepath}
+_global_wrapper_yaml_filepaths_cache: Dict[Tuple[str, str], str] = None
+
+
+def get_wrapper_yaml_filepaths() -> Dict[Tuple[str, str], str]:
+    """
+    Index of the yaml files (params, conda) under the wrappers directories,
+      built by a single directory walk per process.
+    """
+    global _global_wrapper_yaml_filepaths_cache
+
+    if _global_wrapper_yaml_filepaths_cache is None:
+        filepaths = glob(
+            join_filepath([DIRPATH.APP_DIR, "*", "wrappers", "**", "*.yaml"]),
+            recursive=True,
+        )
+
+        yaml_filepaths = {}
+        for filepath in sorted(filepaths):
+            category = os.path.basename(os.path.dirname(filepath))
+            name, _ = os.path.splitext(os.path.basename(filepath))
+            yaml_filepaths.setdefault((category, name), filepath)
+
+        _global_wrapper_yaml_filepaths_cache = yaml_filepaths
+
+    return _global_wrapper_yaml_filepaths_cache
+
+
+def clear_filepath_cache():
+    global _global_wrapper_yaml_filepaths_cache
+    _global_wrapper_yaml_filepaths_cache = None
+
 
 def find_filepath(name, category) -> Optional[str]:
     name, _ = os.path.splitext(name)
 
-    filepaths = glob(
-        join_filepath(
-            [DIRPATH.APP_DIR, "*", "wrappers", "**", category, f"{name}.yaml"]
-        ),
-        recursive=True,
-    )
-    return filepaths[0] if len(filepaths) > 0 else None
+    return get_wrapper_yaml_filepaths().get((category, name))
 
 
 def find_param_filepath(name: str):
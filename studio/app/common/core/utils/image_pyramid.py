@@ -0,0 +1,110 @@
+import json
+import os
+from typing import List, Optional
+
+import numpy as np
+from PIL import Image
+
+# Note: pyramid levels are built until the image fits in this size.
+PYRAMID_MIN_SIZE = 256
+THUMBNAIL_SIZE = 128
+
+
+def downsample_image(data: np.ndarray, factor: int) -> np.ndarray:
+    """
+    Downsample the last 2 axes (y, x) by the mean of factor x factor blocks.
+    """
+    if factor <= 1:
+        return data
+
+    h, w = data.shape[-2] // factor, data.shape[-1] // factor
+    blocks = data[..., : h * factor, : w * factor].reshape(
+        *data.shape[:-2], h, factor, w, factor
+    )
+    downsampled = blocks.mean(axis=(-3, -1))
+
+    if np.issubdtype(data.dtype, np.integer):
+        downsampled = np.rint(downsampled)
+    return downsampled.astype(data.dtype)
+
+
+def get_pyramid_level(shape: List[int], max_size: Optional[int]) -> int:
+    """
+    The coarsest level (downsampled by 2 ** level) still covering max_size pixels.
+    """
+    if not max_size:
+        return 0
+
+    level = 0
+    while max(shape[-2:]) // 2 ** (level + 1) >= max_size:
+        level += 1
+    return level
+
+
+def get_pyramid_meta_path(json_path: str) -> str:
+    return f"{os.path.splitext(json_path)[0]}.pyramid.json"
+
+
+def get_pyramid_level_path(json_path: str, level: int) -> str:
+    if level == 0:
+        return json_path
+    return f"{os.path.splitext(json_path)[0]}.level{level}.json"
+
+
+def get_thumbnail_path(filepath: str) -> str:
+    return f"{os.path.splitext(filepath)[0]}.thumb.png"
+
+
+def build_image_pyramid(data: np.ndarray) -> List[np.ndarray]:
+    """
+    Downsampled levels (1/2, 1/4, ...) of the 2D image,
+      until the image fits in PYRAMID_MIN_SIZE (or its short axis can not be
+      downsampled any more).
+    """
+    levels = []
+    shape = data.shape
+    while max(shape) > PYRAMID_MIN_SIZE and min(shape) >= 2:
+        levels.append(downsample_image(levels[-1] if levels else data, 2))
+        shape = levels[-1].shape
+    return levels
+
+
+def save_pyramid_meta(json_path: str, shapes: List[tuple]):
+    with open(get_pyramid_meta_path(json_path), "w") as f:
+        json.dump({"shapes": [list(x) for x in shapes]}, f)
+
+
+def select_image_pyramid_level(json_path: str, max_size: Optional[int]) -> str:
+    """
+    Returns the json path of the pyramid level for the viewport max_size.
+    """
+    meta_path = get_pyramid_meta_path(json_path)
+    if not max_size or not os.path.exists(meta_path):
+        return json_path
+
+    with open(meta_path) as f:
+        shapes = json.load(f)["shapes"]
+
+    level = min(get_pyramid_level(shapes[0], max_size), len(shapes) - 1)
+    return get_pyramid_level_path(json_path, level)
+
+
+def save_image_thumbnail(thumbnail_path: str, data: np.ndarray):
+    """
+    Save the 2D image as a small PNG, scaled by its 1-99 percentiles.
+    """
+    # Note: the short axis is kept at least 1 pixel (for narrow images).
+    factor = max(1, min(max(data.shape) // THUMBNAIL_SIZE, min(data.shape)))
+    data = downsample_image(np.asarray(data, dtype=np.float32), factor)
+
+    vmin, vmax = np.nanpercentile(data, [1, 99]) if data.size else (0, 0)
+    scaled = np.clip((data - vmin) / max(vmax - vmin, 1e-12), 0, 1)
+    image = Image.fromarray(np.nan_to_num(scaled * 255).astype(np.uint8))
+    image.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+    image.save(thumbnail_path, optimize=True)
+
+
+def save_plot_thumbnail(plot_file: str):
+    with Image.open(plot_file) as image:
+        image.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        image.save(get_thumbnail_path(plot_file), optimize=True)
@@ -10,6 +10,7 @@ from studio.app.common.core.utils.filepath_creater import (
     create_directory,
     join_filepath,
 )
+from studio.app.common.core.utils.image_pyramid import downsample_image
 from studio.app.common.schemas.outputs import PlotMetaData
 
 
@@ -30,28 +31,40 @@ class JsonWriter:
                 json.dump(data.value_present_dict(), f, indent=4)
 
 
-def save_tiff2json(tiff_filepath, save_dirpath, start_index=None, end_index=None):
+def save_tiff2json(
+    tiff_filepath, save_dirpath, start_index=None, end_index=None, level=0
+):
+    """
+    Save the pages [start_index, end_index] of the tiff to json,
+      downsampled by 2 ** level (see get_tiff2json_path).
+    """
     # Tiff画像を読み込む
     tiffs = []
-    image = tifffile.imread(tiff_filepath)
+    try:
+        # Read only the requested pages from the file-backed view when possible.
+        image = tifffile.memmap(tiff_filepath, mode="r")
+    except ValueError:
+        image = tifffile.imread(tiff_filepath)
     if image.ndim == 2:
         image = image[np.newaxis, :, :]
 
-    for i, page in enumerate(image):
-        if i < start_index - 1:
-            continue
-
-        if i >= end_index:
-            break
-
-        tiffs.append(page.tolist())
+    for page in image[max(start_index - 1, 0) : end_index]:
+        tiffs.append(downsample_image(page, 2**level).tolist())
 
     filename, _ = os.path.splitext(os.path.basename(tiff_filepath))
     create_directory(save_dirpath)
 
     JsonWriter.write_as_split(
-        join_filepath(
-            [save_dirpath, f"{filename}_{str(start_index)}_{str(end_index)}.json"]
-        ),
+        get_tiff2json_path(save_dirpath, filename, start_index, end_index, level),
         pd.DataFrame(tiffs),
     )
+
+
+def get_tiff2json_path(save_dirpath, filename, start_index, end_index, level=0):
+    level_suffix = f"_level{level}" if level > 0 else ""
+    return join_filepath(
+        [
+            save_dirpath,
+            f"{filename}_{str(start_index)}_{str(end_index)}{level_suffix}.json",
+        ]
+    )
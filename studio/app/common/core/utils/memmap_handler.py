@@ -0,0 +1,101 @@
+import os
+import re
+from typing import Iterator, Tuple
+
+import numpy as np
+
+
+class MemmapReader:
+    """
+    File-backed reader for CaImAn style memmap movies
+      (eg. "Yr_d1_512_d2_512_d3_1_order_C_frames_3000.mmap").
+
+    The layout is parsed from the file name (same rule as caiman.load_memmap),
+      so caiman itself is not required to read these files.
+    """
+
+    FILENAME_PATTERN = re.compile(
+        r"_d1_(\d+)_d2_(\d+)_d3_(\d+)_order_([CF])_frames_(\d+)\.mmap$"
+    )
+
+    # Upper bound of bytes held in memory by `iter_frames`
+    CHUNK_BYTES = 64 * 1024**2
+
+    @classmethod
+    def is_memmap_file(cls, filepath) -> bool:
+        return isinstance(filepath, str) and bool(
+            cls.FILENAME_PATTERN.search(os.path.basename(filepath))
+        )
+
+    @classmethod
+    def get_filepath(
+        cls, dirpath: str, file_name: str, shape: tuple, order: str = "F"
+    ) -> str:
+        """
+        Returns the memmap file path of a (frames, *dims) movie.
+        *The file is created by `read` with mode="w+".
+        """
+        frames, *dims = shape
+        d1, d2, d3 = (*dims, 1) if len(dims) == 2 else dims
+
+        return os.path.join(
+            dirpath,
+            f"{file_name}_d1_{d1}_d2_{d2}_d3_{d3}_order_{order}_frames_{frames}.mmap",
+        )
+
+    @classmethod
+    def parse_layout(cls, filepath: str) -> Tuple[tuple, int, str]:
+        """
+        Returns (dims, frames, order) encoded in the memmap file name.
+        """
+        matched = cls.FILENAME_PATTERN.search(os.path.basename(filepath))
+        assert matched, f"Invalid memmap file name: {filepath}"
+
+        d1, d2, d3, order, frames = matched.groups()
+        dims = (int(d1), int(d2)) if int(d3) == 1 else (int(d1), int(d2), int(d3))
+
+        return dims, int(frames), order
+
+    @classmethod
+    def read_yr(cls, filepath: str, mode: str = "r") -> np.memmap:
+        """
+        Returns the raw (pixels, frames) memmap.
+        """
+        dims, frames, order = cls.parse_layout(filepath)
+
+        return np.memmap(
+            filepath,
+            mode=mode,
+            shape=(int(np.prod(dims)), frames),
+            dtype=np.float32,
+            order=order,
+        )
+
+    @classmethod
+    def read(cls, filepath: str, mode: str = "r") -> np.memmap:
+        """
+        Returns a (frames, *dims) view of the memmap, without loading it in memory.
+        """
+        dims, frames, _ = cls.parse_layout(filepath)
+        Yr = cls.read_yr(filepath, mode=mode)
+
+        return np.reshape(Yr.T, (frames,) + dims, order="F")
+
+    @classmethod
+    def iter_frames(
+        cls, filepath: str, chunk_bytes: int = None
+    ) -> Iterator[np.ndarray]:
+        """
+        Yields in-memory blocks of consecutive frames,
+          each block being at most `chunk_bytes` in size.
+        """
+        dims, frames, _ = cls.parse_layout(filepath)
+        frame_bytes = int(np.prod(dims)) * np.dtype(np.float32).itemsize
+        chunk_frames = max(1, (chunk_bytes or cls.CHUNK_BYTES) // frame_bytes)
+
+        for start in range(0, frames, chunk_frames):
+            # Re-open the memmap for each block,
+            #   so that the pages touched so far are released.
+            images = cls.read(filepath)
+            yield np.array(images[start : start + chunk_frames])
+            del images
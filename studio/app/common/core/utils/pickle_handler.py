@@ -1,19 +1,177 @@
+import mmap
 import os
 import pickle
+import shutil
 import traceback
+import uuid
 from glob import glob
 
+import numpy as np
+
 from studio.app.common.core.utils.filepath_creater import (
     create_directory,
     join_filepath,
 )
 
+PICKLE_ARRAYS_SUFFIX = ".arrays"
+
+
+class PickleArrayRef:
+    """
+    Reference to an array saved beside the pickle, kept without loading it.
+    """
+
+    def __init__(self, pid: tuple):
+        self.pid = pid
+
+
+def get_pickle_arrays_dirpath(pickle_path: str) -> str:
+    """
+    Directory of the arrays saved beside the pickle (as .npy files).
+    """
+    return f"{pickle_path}{PICKLE_ARRAYS_SUFFIX}"
+
+
+def _link_array_file(src_path: str, dst_path: str):
+    # Note: the file is shared with the source pickle (not copied),
+    #   and it is kept while either of the pickles refers to it.
+    try:
+        os.link(src_path, dst_path)
+    except OSError:
+        shutil.copyfile(src_path, dst_path)
+
+
+def _get_mapped_array_path(obj) -> str:
+    """
+    Path of the .npy file (saved beside a pickle) which the array maps as a whole.
+    """
+    if (
+        type(obj) is np.memmap
+        and isinstance(obj.base, mmap.mmap)
+        and obj.filename is not None
+        and f"{PICKLE_ARRAYS_SUFFIX}{os.sep}" in obj.filename
+    ):
+        return obj.filename
+    return None
+
+
+def map_arrays_readonly(obj, mapped: dict = None):
+    """
+    Returns the object (nested dicts/lists) with the arrays loaded from the .npy
+      files mapped again read-only, so that they are linked (not saved again)
+      when the object is pickled.
+    *The given arrays are not changed, and may still be changed (copy-on-write)
+      by their other users. Call this before they are changed.
+    """
+    mapped = {} if mapped is None else mapped
+
+    if isinstance(obj, dict):
+        return {key: map_arrays_readonly(value, mapped) for key, value in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        values = [map_arrays_readonly(value, mapped) for value in obj]
+        return values if isinstance(obj, list) else tuple(values)
+
+    path = _get_mapped_array_path(obj)
+    if path is None or obj.mode == "r":
+        return obj
+    if path not in mapped:
+        mapped[path] = np.load(path, mmap_mode="r")
+    return mapped[path]
+
+
+class _NodePickler(pickle.Pickler):
+    """
+    Pickler which saves large numeric arrays as .npy files beside the pickle,
+      so that the pickle holds only their references.
+    Arrays mapped read-only from such files are linked instead of saved again.
+    """
+
+    # Note: smaller arrays are kept in the pickle.
+    MIN_ARRAY_BYTES = 1024**2
+
+    def __init__(self, file, pickle_path: str):
+        super().__init__(file)
+        self.token = uuid.uuid4().hex[:8]
+        self.arrays_dirpath = get_pickle_arrays_dirpath(pickle_path)
+        self.saved_arrays = {}
+        self.referenced_tokens = {self.token}
+
+    def persistent_id(self, obj):
+        if isinstance(obj, PickleArrayRef):
+            self.referenced_tokens.add(obj.pid[1].split("/")[0])
+            return obj.pid
+
+        if (
+            type(obj) not in (np.ndarray, np.memmap)
+            or obj.dtype.kind not in "biufc"
+            or obj.nbytes < self.MIN_ARRAY_BYTES
+        ):
+            return None
+
+        src_path = self.__get_unchanged_array_path(obj)
+        if src_path:
+            # Note: the same file may be loaded by several readers (or linked).
+            stat = os.stat(src_path)
+            key = (stat.st_dev, stat.st_ino)
+        else:
+            key = id(obj)
+
+        # Note: keep the array itself, so that its id is not reused while pickling.
+        if key not in self.saved_arrays:
+            name = f"{self.token}/{len(self.saved_arrays)}.npy"
+            dst_path = join_filepath([self.arrays_dirpath, name])
+            create_directory(join_filepath([self.arrays_dirpath, self.token]))
+            if src_path:
+                _link_array_file(src_path, dst_path)
+            else:
+                np.save(dst_path, obj)
+            self.saved_arrays[key] = (("ndarray", name), obj)
+
+        return self.saved_arrays[key][0]
+
+    @staticmethod
+    def __get_unchanged_array_path(obj) -> str:
+        """
+        Path of the .npy file (saved beside a pickle) which the array maps as is,
+          if the array can not have been changed since it was loaded.
+        """
+        # Note: copy-on-write arrays are saved again, even if they are made
+        #   read-only afterwards (they may have been changed before).
+        if getattr(obj, "mode", None) == "r":
+            return _get_mapped_array_path(obj)
+        return None
+
+
+class _NodeUnpickler(pickle.Unpickler):
+    def __init__(self, file, pickle_path: str, load_arrays: bool = True):
+        super().__init__(file)
+        self.arrays_dirpath = get_pickle_arrays_dirpath(pickle_path)
+        self.load_arrays = load_arrays
+        self.loaded = {}
+
+    def persistent_load(self, pid):
+        pid = tuple(pid)
+        if pid not in self.loaded:
+            if not self.load_arrays:
+                self.loaded[pid] = PickleArrayRef(pid)
+            else:
+                # Note: the array is mapped copy-on-write (pages are read on access,
+                #   and changes are not written back to the file).
+                self.loaded[pid] = np.load(
+                    join_filepath([self.arrays_dirpath, pid[1]]), mmap_mode="c"
+                )
+        return self.loaded[pid]
+
 
 class PickleReader:
     @classmethod
-    def read(cls, filepath):
+    def read(cls, filepath, load_arrays: bool = True):
+        """
+        load_arrays: If False, the arrays saved beside the pickle are returned
+          as PickleArrayRef (to rewrite the pickle without loading them).
+        """
         with open(filepath, "rb") as f:
-            return pickle.load(f)
+            return _NodeUnpickler(f, filepath, load_arrays).load()
 
     @classmethod
     def search_node_pickle_path(cls, search_path: str) -> str:
@@ -55,15 +213,82 @@ class PickleWriter:
         # Note: Use temporary files to avoid read during file writing.
         tmp_pickle_path = f"{pickle_path}.tmp"
 
-        if os.path.exists(pickle_path):
-            os.remove(pickle_path)
-
         with open(tmp_pickle_path, "wb") as f:
-            pickle.dump(info, f)
+            pickler = _NodePickler(f, pickle_path)
+            pickler.dump(info)
             f.flush()
 
+        if os.path.exists(pickle_path):
+            os.remove(pickle_path)
+
         os.rename(tmp_pickle_path, pickle_path)
 
+        cls.__remove_unreferenced_arrays(pickle_path, pickler.referenced_tokens)
+
+    @classmethod
+    def __remove_unreferenced_arrays(cls, pickle_path, referenced_tokens: set):
+        """
+        Remove the arrays written for the previous contents of the pickle.
+        """
+        arrays_dirpath = get_pickle_arrays_dirpath(pickle_path)
+        if not os.path.isdir(arrays_dirpath):
+            return
+
+        for token in os.listdir(arrays_dirpath):
+            if token not in referenced_tokens:
+                # Note: arrays still mapped by readers may not be removed (Windows),
+                #   they are retried at the next write.
+                shutil.rmtree(
+                    join_filepath([arrays_dirpath, token]), ignore_errors=True
+                )
+
+        if not os.listdir(arrays_dirpath):
+            os.rmdir(arrays_dirpath)
+
+    @classmethod
+    def copy(cls, src_path, dst_path):
+        """
+        Copy the pickle with the arrays saved beside it (linked, not copied),
+          so that the copy is kept as is when the source pickle is rewritten.
+        """
+        cls.remove(dst_path)
+
+        src_arrays_dirpath = get_pickle_arrays_dirpath(src_path)
+        if os.path.isdir(src_arrays_dirpath):
+            shutil.copytree(
+                src_arrays_dirpath,
+                get_pickle_arrays_dirpath(dst_path),
+                copy_function=_link_array_file,
+            )
+
+        # Note: Use temporary files to avoid read during file writing.
+        tmp_pickle_path = f"{dst_path}.tmp"
+        shutil.copyfile(src_path, tmp_pickle_path)
+        os.replace(tmp_pickle_path, dst_path)
+
+    @classmethod
+    def move(cls, src_path, dst_path):
+        """
+        Move the pickle with the arrays saved beside it (replacing dst_path).
+        """
+        cls.remove(dst_path)
+
+        src_arrays_dirpath = get_pickle_arrays_dirpath(src_path)
+        if os.path.isdir(src_arrays_dirpath):
+            os.rename(src_arrays_dirpath, get_pickle_arrays_dirpath(dst_path))
+
+        os.rename(src_path, dst_path)
+
+    @classmethod
+    def remove(cls, pickle_path):
+        """
+        Remove the pickle with the arrays saved beside it.
+        """
+        if os.path.exists(pickle_path):
+            os.remove(pickle_path)
+
+        shutil.rmtree(get_pickle_arrays_dirpath(pickle_path), ignore_errors=True)
+
     @classmethod
     def write_error(cls, pickle_path, err: Exception):
         err_msg = list(traceback.TracebackException.from_exception(err).format())
@@ -72,20 +297,8 @@ class PickleWriter:
 
     @classmethod
     def overwrite(cls, pickle_path, info):
-        with open(pickle_path, "rb") as f:
-            old_pkl = pickle.load(f)
+        old_pkl = PickleReader.read(pickle_path, load_arrays=False)
 
         if isinstance(old_pkl, dict) and isinstance(info, dict):
             old_pkl.update(info)
-
-            # Note: Use temporary files to avoid read during file writing.
-            tmp_pickle_path = f"{pickle_path}.tmp"
-
-            if os.path.exists(pickle_path):
-                os.remove(pickle_path)
-
-            with open(tmp_pickle_path, "wb") as f:
-                pickle.dump(old_pkl, f)
-                f.flush()
-
-            os.rename(tmp_pickle_path, pickle_path)
+            cls.write(pickle_path, old_pkl)
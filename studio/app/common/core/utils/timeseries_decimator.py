@@ -0,0 +1,202 @@
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from studio.app.common.core.utils.filepath_creater import join_filepath
+
+
+class TimeSeriesDecimator:
+    """
+    Min/max decimation of time series for plotting.
+
+    A multi-resolution summary (min/max of each bucket, for bucket sizes
+      of LEVEL_FACTOR ** level) is saved beside the per-cell json files,
+      so that a decimated range is read from the coarsest level that still
+      has at least the requested number of buckets.
+    """
+
+    SUMMARY_FILENAME = "timeseries_summary.npz"
+
+    LEVEL_FACTOR = 8
+    # levels are built while the series is longer than this
+    MIN_LEVEL_LENGTH = 1024
+
+    @classmethod
+    def get_summary_path(cls, dirpath: str) -> str:
+        return join_filepath([dirpath, cls.SUMMARY_FILENAME])
+
+    @classmethod
+    def __bucket_extrema(
+        cls, values: np.ndarray, positions: np.ndarray, size: int, func
+    ):
+        """
+        Reduce (cells, n) values/positions to (cells, ceil(n / size)) buckets.
+        """
+        n_cells, length = values.shape
+        n_buckets = -(-length // size)
+        pad = n_buckets * size - length
+        fill = np.inf if func is np.argmin else -np.inf
+
+        values = np.pad(
+            values.astype(np.float64), ((0, 0), (0, pad)), constant_values=fill
+        ).reshape(n_cells, n_buckets, size)
+        positions = np.pad(positions, ((0, 0), (0, pad)), mode="edge").reshape(
+            n_cells, n_buckets, size
+        )
+
+        selected = func(values, axis=2)[..., np.newaxis]
+        return (
+            np.take_along_axis(values, selected, axis=2)[..., 0],
+            np.take_along_axis(positions, selected, axis=2)[..., 0],
+        )
+
+    @classmethod
+    def build_levels(cls, data: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Build the min/max levels of (cells, frames) data.
+        """
+        levels = {}
+        positions = np.broadcast_to(
+            np.arange(data.shape[1], dtype=np.int64), data.shape
+        )
+        mins = maxs = (data, positions)
+
+        level = 1
+        while mins[0].shape[1] > cls.MIN_LEVEL_LENGTH:
+            mins = cls.__bucket_extrema(*mins, cls.LEVEL_FACTOR, np.argmin)
+            maxs = cls.__bucket_extrema(*maxs, cls.LEVEL_FACTOR, np.argmax)
+            levels[f"min_value_{level}"] = mins[0].astype(data.dtype)
+            levels[f"min_index_{level}"] = mins[1]
+            levels[f"max_value_{level}"] = maxs[0].astype(data.dtype)
+            levels[f"max_index_{level}"] = maxs[1]
+            level += 1
+
+        return levels
+
+    @classmethod
+    def save_summary(
+        cls,
+        dirpath: str,
+        index: np.ndarray,
+        data: np.ndarray,
+        cell_numbers: List,
+        std: np.ndarray = None,
+    ) -> Dict[str, np.ndarray]:
+        summary = {
+            "index": np.asarray(index),
+            "data": data,
+            "cell_numbers": np.asarray([str(c) for c in cell_numbers]),
+            **cls.build_levels(data),
+        }
+        if std is not None:
+            summary["std"] = np.asarray(std)
+
+        # Note: write to a temporary file and replace,
+        #   so that readers never see a partially written summary.
+        summary_path = cls.get_summary_path(dirpath)
+        tmp_path = f"{summary_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **summary)
+        os.replace(tmp_path, summary_path)
+
+        return summary
+
+    @classmethod
+    def load_summary(cls, dirpath: str) -> Optional[np.lib.npyio.NpzFile]:
+        summary_path = cls.get_summary_path(dirpath)
+        return np.load(summary_path) if os.path.exists(summary_path) else None
+
+    @classmethod
+    def decimate(
+        cls,
+        summary,
+        n_points: int,
+        cell_numbers: List[str] = None,
+        xmin: float = None,
+        xmax: float = None,
+    ) -> Dict[str, Dict[str, dict]]:
+        """
+        Returns {"data": {cell: {x: value}}, "std": {...}, "xrange": [x, ...]}
+          of the cells, decimated to about n_points per cell within [xmin, xmax].
+        *The points selected (min/max) differ by cell,
+          and xrange is the union of the x of all cells.
+        """
+        # Note: NpzFile reads an array on each access, so read it once.
+        index = summary["index"]
+        data = summary["data"]
+        all_cell_numbers = list(summary["cell_numbers"])
+        cell_numbers = all_cell_numbers if cell_numbers is None else cell_numbers
+        rows = [all_cell_numbers.index(str(c)) for c in cell_numbers]
+
+        start = 0 if xmin is None else int(np.searchsorted(index, xmin, "left"))
+        stop = (
+            len(index) if xmax is None else int(np.searchsorted(index, xmax, "right"))
+        )
+
+        # Note: each bucket contributes 2 points (min and max).
+        bucket_size = max(1, -(-(stop - start) // max(1, n_points // 2)))
+
+        level = 0
+        while (
+            f"min_index_{level + 1}" in summary
+            and cls.LEVEL_FACTOR ** (level + 1) <= bucket_size
+        ):
+            level += 1
+
+        level_size = cls.LEVEL_FACTOR**level
+        inner_start = -(-start // level_size) * level_size
+        inner_stop = (stop // level_size) * level_size
+        if level == 0 or inner_start >= inner_stop:
+            inner_start = inner_stop = stop
+        extrema = []
+
+        # the range aligned to the level buckets is read from the level
+        if inner_start < inner_stop:
+            level_slice = slice(inner_start // level_size, inner_stop // level_size)
+            for kind, func in [("min", np.argmin), ("max", np.argmax)]:
+                _, positions = cls.__bucket_extrema(
+                    summary[f"{kind}_value_{level}"][rows, level_slice],
+                    summary[f"{kind}_index_{level}"][rows, level_slice],
+                    -(-bucket_size // level_size),
+                    func,
+                )
+                extrema.append(positions)
+
+        # and the rest (range edges) from the raw data
+        for edge_start, edge_stop in [(start, inner_start), (inner_stop, stop)]:
+            if edge_start >= edge_stop:
+                continue
+            values = data[rows, edge_start:edge_stop]
+            positions = np.broadcast_to(
+                np.arange(edge_start, edge_stop, dtype=np.int64), values.shape
+            )
+            for func in [np.argmin, np.argmax]:
+                extrema.append(
+                    cls.__bucket_extrema(values, positions, bucket_size, func)[1]
+                )
+
+        std = summary["std"] if "std" in summary else None
+        decimated = {"data": {}, "std": {} if std is not None else None, "xrange": []}
+        all_selected = []
+
+        for i, (row, cell) in enumerate(zip(rows, cell_numbers)):
+            if not extrema:
+                decimated["data"][str(cell)] = {}
+                continue
+            selected = np.unique(np.concatenate([x[i] for x in extrema]))
+            all_selected.append(selected)
+
+            keys = [str(x) for x in index[selected].tolist()]
+            decimated["data"][str(cell)] = dict(zip(keys, data[row, selected].tolist()))
+            if std is not None:
+                decimated["std"][str(cell)] = dict(
+                    zip(keys, std[row, selected].tolist())
+                )
+
+        if all_selected:
+            decimated["xrange"] = [
+                str(x) for x in index[np.unique(np.concatenate(all_selected))].tolist()
+            ]
+
+        return decimated
@@ -140,11 +140,27 @@ class OutputPath:
     data_shape: Optional[list] = field(default_factory=list)
 
 
+@dataclass
+class NodeRunMetrics:
+    """
+    Runtime metrics of a node run (measured in the node process).
+    """
+
+    started_at: str
+    wall_time: float  # sec
+    cpu_user: float  # sec
+    cpu_system: float  # sec
+    max_rss: Optional[int] = None  # bytes (peak of the node process)
+    read_bytes: Optional[int] = None
+    write_bytes: Optional[int] = None
+
+
 @dataclass
 class Message:
     status: str
     message: str
     outputPaths: Dict[str, OutputPath] = None
+    metrics: Optional[NodeRunMetrics] = None
 
 
 @dataclass
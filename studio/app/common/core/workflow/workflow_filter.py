@@ -18,8 +18,6 @@ from studio.app.common.core.workflow.workflow_writer import WorkflowConfigWriter
 from studio.app.const import ORIGINAL_DATA_EXT
 from studio.app.dir_path import DIRPATH
 from studio.app.optinist.core.nwb.nwb import NWBDATASET
-from studio.app.optinist.core.nwb.nwb_creater import overwrite_nwb
-from studio.app.optinist.dataclass import FluoData, IscellData, RoiData
 
 
 class WorkflowNodeDataFilter:
@@ -101,7 +99,7 @@ class WorkflowNodeDataFilter:
     def _backup_original_data(self):
         logger = AppLogger.get_logger()
         logger.info(f"Backing up data to {ORIGINAL_DATA_EXT} before applying filter")
-        shutil.copyfile(self.pkl_filepath, self.original_pkl_filepath)
+        PickleWriter.copy(self.pkl_filepath, self.original_pkl_filepath)
 
         # Back up NWB files in node directory
         nwb_files = glob(join_filepath([self.node_dirpath, "[!tmp_]*.nwb"]))
@@ -127,8 +125,7 @@ class WorkflowNodeDataFilter:
         logger.info("Recovering original data after filter removed")
 
         # Restore original pickle file
-        os.remove(self.pkl_filepath)
-        shutil.move(self.original_pkl_filepath, self.pkl_filepath)
+        PickleWriter.move(self.original_pkl_filepath, self.pkl_filepath)
 
         # Trigger snakemake re-run next node by update modification time
         os.utime(
@@ -165,6 +162,11 @@ class WorkflowNodeDataFilter:
         os.rename(self.original_fluorescence_dirpath, self.fluorescence_dirpath)
 
     def _save_json(self, output_info, node_dirpath):
+        # Note: pynwb and the dataclasses are imported on use
+        #   (this module is also imported by the API server at startup).
+        from studio.app.optinist.core.nwb.nwb_creater import overwrite_nwb
+        from studio.app.optinist.dataclass import FluoData, RoiData
+
         for k, v in output_info.items():
             if isinstance(v, (FluoData, RoiData)):
                 v.save_json(node_dirpath)
@@ -196,6 +198,8 @@ class WorkflowNodeDataFilter:
         type: str,
         output_dir,
     ) -> dict:
+        from studio.app.optinist.dataclass import FluoData, IscellData, RoiData
+
         logger = AppLogger.get_logger()
 
         # Deep copy all mutable data to avoid in-place modification
@@ -0,0 +1,141 @@
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+from datetime import datetime
+from typing import Optional, Tuple
+
+from psutil import AccessDenied, Process
+
+from studio.app.common.core.logger import AppLogger
+from studio.app.common.core.utils.filepath_creater import join_filepath
+from studio.app.common.core.workflow.workflow import NodeRunMetrics
+from studio.app.const import DATE_FORMAT
+
+try:
+    import resource
+except ModuleNotFoundError:  # Windows
+    resource = None
+
+logger = AppLogger.get_logger()
+
+
+class WorkflowNodeMetrics:
+    """
+    Runtime metrics of a node run, measured in the node process (Runner.run)
+      and saved beside the node pickle (METRICS_FILE):
+      - wall_time, cpu_user, cpu_system: since the start of the measurement
+        (cpu times include the finished child processes)
+      - max_rss: peak RSS of the node process (since its exec, on linux)
+      - read_bytes, write_bytes: bytes passed to read/write calls
+        since the start of the measurement (memory-mapped reads are not counted)
+    """
+
+    METRICS_FILE = "metrics.json"
+
+    def __init__(self):
+        self.process = Process(os.getpid())
+        self.started_at = datetime.now().strftime(DATE_FORMAT)
+        self.__start_time = time.perf_counter()
+        self.__start_cpu_times = self.process.cpu_times()
+        self.__start_io_counters = self.__get_io_counters()
+
+    @classmethod
+    def get_metrics_file_path(cls, node_dirpath: str) -> str:
+        return join_filepath([node_dirpath, cls.METRICS_FILE])
+
+    @classmethod
+    def read(cls, node_dirpath: str) -> Optional[NodeRunMetrics]:
+        try:
+            with open(cls.get_metrics_file_path(node_dirpath)) as f:
+                return NodeRunMetrics(**json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError, TypeError):
+            return None
+
+    def measure(self) -> NodeRunMetrics:
+        cpu_times = self.process.cpu_times()
+        io_counters = self.__get_io_counters()
+        if io_counters is not None and self.__start_io_counters is not None:
+            read_bytes, write_bytes = (
+                end - start for end, start in zip(io_counters, self.__start_io_counters)
+            )
+        else:
+            read_bytes, write_bytes = None, None
+
+        return NodeRunMetrics(
+            started_at=self.started_at,
+            wall_time=round(time.perf_counter() - self.__start_time, 3),
+            cpu_user=round(
+                self.__get_cpu_time(cpu_times, "user")
+                - self.__get_cpu_time(self.__start_cpu_times, "user"),
+                3,
+            ),
+            cpu_system=round(
+                self.__get_cpu_time(cpu_times, "system")
+                - self.__get_cpu_time(self.__start_cpu_times, "system"),
+                3,
+            ),
+            max_rss=self.get_peak_rss(),
+            read_bytes=read_bytes,
+            write_bytes=write_bytes,
+        )
+
+    def save(self, node_dirpath: str) -> Optional[NodeRunMetrics]:
+        try:
+            metrics = self.measure()
+
+            # Note: write to a temporary file and replace,
+            #   so that readers never see a partially written record.
+            path = self.get_metrics_file_path(node_dirpath)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(asdict(metrics), f)
+            os.replace(tmp_path, path)
+
+            return metrics
+        except Exception as e:
+            # Note: the metrics are only records, the node run itself is not failed.
+            logger.warning(f"Failed to save node metrics: {e}")
+            return None
+
+    @staticmethod
+    def __get_cpu_time(cpu_times, name: str) -> float:
+        # Note: children_* are not available on macOS and Windows.
+        return getattr(cpu_times, name) + getattr(cpu_times, f"children_{name}", 0.0)
+
+    def __get_io_counters(self) -> Optional[Tuple[int, int]]:
+        try:
+            io_counters = self.process.io_counters()
+        except (AttributeError, AccessDenied):  # not supported on macOS
+            return None
+
+        # Note: read_chars/write_chars (linux) count the bytes including
+        #   page cache hits, as read_bytes/write_bytes do on Windows.
+        return (
+            getattr(io_counters, "read_chars", io_counters.read_bytes),
+            getattr(io_counters, "write_chars", io_counters.write_bytes),
+        )
+
+    @staticmethod
+    def get_peak_rss() -> Optional[int]:
+        """
+        Peak RSS (bytes) of the current process.
+        """
+        # Note: ru_maxrss is kept across exec on linux, and would be the peak
+        #   of the parent process (eg. snakemake) if it is larger,
+        #   while VmHWM is reset at exec.
+        try:
+            with open("/proc/self/status") as f:
+                for line in f:
+                    if line.startswith("VmHWM:"):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+
+        if resource is None:
+            return getattr(Process(os.getpid()).memory_info(), "peak_wset", None)
+
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Note: ru_maxrss is in bytes on macOS, and in kilobytes on linux.
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
@@ -1,12 +1,38 @@
+import copy
+import os
+from typing import Dict, Tuple
+
 from studio.app.common.core.logger import AppLogger
 from studio.app.common.core.utils.config_handler import ConfigReader
 from studio.app.common.core.utils.filepath_finder import find_param_filepath
 
 logger = AppLogger.get_logger()
 
+# Cache default params per params file (performance consideration)
+#   {filepath: (mtime, params)}
+_global_default_params_cache: Dict[str, Tuple[float, dict]] = {}
+
+
+def get_default_params(name) -> dict:
+    """
+    Default params of the algorithm (or core config), parsed once per file version.
+    *Returns a copy, which the caller may change.
+    """
+    filepath = find_param_filepath(name)
+    if filepath is None or not os.path.exists(filepath):
+        return {}
+
+    mtime = os.path.getmtime(filepath)
+    cached = _global_default_params_cache.get(filepath)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, ConfigReader.read(filepath))
+        _global_default_params_cache[filepath] = cached
+
+    return copy.deepcopy(cached[1])
+
 
 def get_typecheck_params(message_params, name):
-    default_params = ConfigReader.read(find_param_filepath(name))
+    default_params = get_default_params(name)
     if message_params != {} and message_params is not None:
         return check_types(nest2dict(message_params), default_params)
     return default_params
@@ -0,0 +1,132 @@
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+from psutil import AccessDenied, NoSuchProcess, Process, ZombieProcess
+
+from studio.app.common.core.logger import AppLogger
+from studio.app.common.core.utils.filepath_creater import join_filepath
+from studio.app.dir_path import DIRPATH
+
+logger = AppLogger.get_logger()
+
+
+class WorkflowProcessStatus:
+    """
+    Per-experiment record of the workflow executor process,
+      written by the executor itself:
+      - identity (pid and create_time) of the executor process
+      - identities and cmdlines of its child processes (eg. conda env create)
+      - heartbeat time, refreshed every HEARTBEAT_INTERVAL seconds
+
+    Watchers check the liveness with this record (O(1)),
+      instead of scanning all processes on the host.
+    """
+
+    PROCESS_STATUS_FILE = "process_status.json"
+    HEARTBEAT_INTERVAL = 5  # sec
+    HEARTBEAT_TIMEOUT = 60  # sec
+
+    def __init__(self, workspace_id: str, unique_id: str):
+        self.workspace_id = workspace_id
+        self.unique_id = unique_id
+        self.process = Process(os.getpid())
+        self.__stop_event = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def get_process_status_file_path(cls, workspace_id: str, unique_id: str) -> str:
+        return join_filepath(
+            [DIRPATH.OUTPUT_DIR, workspace_id, unique_id, cls.PROCESS_STATUS_FILE]
+        )
+
+    @classmethod
+    def read(cls, workspace_id: str, unique_id: str) -> Optional[dict]:
+        try:
+            with open(cls.get_process_status_file_path(workspace_id, unique_id)) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    @classmethod
+    def clear(cls, workspace_id: str, unique_id: str) -> None:
+        """
+        Remove the record of the previous run (before the workflow is run again).
+        """
+        path = cls.get_process_status_file_path(workspace_id, unique_id)
+        if os.path.exists(path):
+            os.remove(path)
+
+    @classmethod
+    def get_alive_process(cls, pid: int, create_time: float) -> Optional[Process]:
+        """
+        Returns the process, if it is still the recorded one (not a reused pid).
+        """
+        try:
+            process = Process(pid)
+            if abs(process.create_time() - create_time) > 1e-3:
+                return None
+            return process
+        except (NoSuchProcess, AccessDenied, ZombieProcess):
+            return None
+
+    @classmethod
+    def is_alive(cls, record: dict) -> bool:
+        if record.get("finished"):
+            return False
+        if time.time() - record["heartbeat"] > cls.HEARTBEAT_TIMEOUT:
+            return False
+        return cls.get_alive_process(record["pid"], record["create_time"]) is not None
+
+    def __write(self, finished: bool = False):
+        children = []
+        try:
+            for child in self.process.children(recursive=True):
+                try:
+                    children.append(
+                        {
+                            "pid": child.pid,
+                            "create_time": child.create_time(),
+                            "cmdline": " ".join(child.cmdline()).replace("\\", "/"),
+                        }
+                    )
+                except (NoSuchProcess, AccessDenied, ZombieProcess):
+                    continue
+        except NoSuchProcess:
+            pass
+
+        record = {
+            "pid": self.process.pid,
+            "create_time": self.process.create_time(),
+            "heartbeat": time.time(),
+            "finished": finished,
+            "children": children,
+        }
+
+        # Note: write to a temporary file and replace,
+        #   so that readers never see a partially written record.
+        path = self.get_process_status_file_path(self.workspace_id, self.unique_id)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(record, f)
+        os.replace(tmp_path, path)
+
+    def __heartbeat(self):
+        while not self.__stop_event.wait(self.HEARTBEAT_INTERVAL):
+            try:
+                self.__write()
+            except Exception as e:
+                logger.warning(f"Failed to write workflow process status: {e}")
+
+    def start(self):
+        self.__write()
+        self.__thread = threading.Thread(target=self.__heartbeat, daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        self.__stop_event.set()
+        if self.__thread is not None:
+            self.__thread.join()
+        self.__write(finished=True)
@@ -7,7 +7,7 @@ from abc import ABCMeta, abstractmethod
 from dataclasses import asdict
 from datetime import datetime
 from glob import glob
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from fastapi import HTTPException, status
 from psutil import AccessDenied, NoSuchProcess, Process, ZombieProcess, process_iter
@@ -31,7 +31,11 @@ from studio.app.common.core.workflow.workflow import (
     OutputPath,
     ProcessType,
 )
-from studio.app.common.dataclass import BaseData
+from studio.app.common.core.workflow.workflow_node_metrics import WorkflowNodeMetrics
+from studio.app.common.core.workflow.workflow_process_status import (
+    WorkflowProcessStatus,
+)
+from studio.app.common.core.workflow.workflow_scheduler import WorkflowScheduler
 from studio.app.common.schemas.workflow import (
     WorkflowErrorInfo,
     WorkflowPIDFileData,
@@ -330,11 +334,12 @@ class NodeResult(BaseNodeResult):
             update_config_function.outputPaths = message.outputPaths
         update_config_function.success = message.status
 
-        # TODO: Set started_at on the node
-        #   At the moment, there is insufficient data to obtain an accurate started_at,
-        #  so set it to None.
-        #   separate modification is required to record running info for each node.
-        update_config_function.started_at = None
+        # Set the runtime metrics recorded by the node process
+        #   (None, if the node was not run. eg. workflow error)
+        update_config_function.metrics = message.metrics
+        update_config_function.started_at = (
+            message.metrics.started_at if message.metrics else None
+        )
 
         now = datetime.now().strftime(DATE_FORMAT)
         update_config_function.finished_at = now
@@ -429,6 +434,7 @@ class NodeResult(BaseNodeResult):
             status=NodeRunStatus.SUCCESS.value,
             message=f"{self.algo_name} success",
             outputPaths=self.output_paths(),
+            metrics=WorkflowNodeMetrics.read(self.node_dirpath),
         )
 
     def error(self, message: str = None) -> Message:
@@ -440,9 +446,16 @@ class NodeResult(BaseNodeResult):
                     "\n".join(self.info) if isinstance(self.info, list) else self.info
                 )
 
-        return Message(status=NodeRunStatus.ERROR.value, message=message)
+        return Message(
+            status=NodeRunStatus.ERROR.value,
+            message=message,
+            metrics=WorkflowNodeMetrics.read(self.node_dirpath),
+        )
 
     def output_paths(self) -> dict:
+        # Note: the dataclasses (and matplotlib) are imported on use.
+        from studio.app.common.dataclass import BaseData
+
         output_paths: Dict[str, OutputPath] = {}
         for k, v in self.info.items():
             if isinstance(v, BaseData):
@@ -504,6 +517,10 @@ class WorkflowMonitor:
                 create_time=expt_started_time.timestamp(),
             )
 
+            # The workflow waiting in the scheduler queue has no process yet.
+            if WorkflowScheduler.is_queued(self.workspace_id, self.unique_id):
+                return WorkflowProcessInfo(process=None, pid_data=pid_data)
+
         process_data: WorkflowProcessInfo = None
 
         # Find the process corresponding to the pid in pid_data
@@ -528,61 +545,22 @@ class WorkflowMonitor:
         # If the target process does not exist,
         # check for the existence of the `conda env create` command process.
         except NoSuchProcess:
-            # ATTENTION:
-            # It should be a warning, but since it matches frequently,
-            # it is temporarily set to debug.
-            # logger.debug(f"No workflow process found. {pid_data}")
-
-            # Search for the existence of a conda command process ("conda env create")
-            conda_process = None
-            for proc in process_iter(["pid", "name"]):
-                try:
-                    # Targeting specific programs for backlog (for performance)
-                    proc_name = proc.info.get("name")
-                    if not any(v in proc_name for v in self.PROCESS_SEARCH_NAMES):
-                        continue
-
-                    # Get cmdline info
-                    # Note:
-                    #   Since "cmdline" is not specified in `process_iter`
-                    #   (for performance), the cmdline is obtained using "proc.as_dict".
-                    cmdline = proc.as_dict(attrs=["cmdline"]).get("cmdline")
-                    cmdline = " ".join(cmdline) if cmdline else ""
-                    cmdline = cmdline.replace("\\", "/")
-
-                    if re.search(self.PROCESS_CONDA_CMDLINE, cmdline):
-                        conda_ps_create_elapsed = int(time.time() - proc.create_time())
-                        logger.info(
-                            f"Found conda process. [{proc}] [{cmdline}] "
-                            f"[{conda_ps_create_elapsed} sec]",
-                        )
-                        conda_process = Process(proc.pid)
-
-                        # Check elapsed time for process startup
-                        #
-                        # ATTENTION:
-                        # The conda command process is a separate process from
-                        #   the snakemake process (although it is a child process),
-                        #   so it is difficult to identify the process with certainty.
-                        # Therefore, the process start time is used here to determine
-                        #   the process by estimation.
-                        if conda_ps_create_elapsed < self.PROCESS_CONDA_WAIT_TIMEOUT:
-                            process_data = WorkflowProcessInfo(
-                                process=conda_process, pid_data=pid_data
-                            )
-                        else:
-                            logger.warning(
-                                "This conda command is "
-                                "probably an irrelevant process.."
-                                f"[{conda_process}] [{conda_ps_create_elapsed} sec]"
-                            )
-                    else:
-                        continue  # skip that process
-
-                except AccessDenied:
-                    continue  # skip that process
-                except ZombieProcess:
-                    continue  # skip that process
+            process_status = WorkflowProcessStatus.read(
+                self.workspace_id, self.unique_id
+            )
+            if process_status is not None:
+                # Note: the executor records its process status (with heartbeats),
+                #   so the liveness is checked without scanning all processes.
+                if not WorkflowProcessStatus.is_alive(process_status):
+                    return None
+                process_data = self.__search_recorded_conda_process(
+                    process_status, pid_data
+                )
+                if process_data is None:
+                    # executor is alive, but no algo function is running now
+                    return WorkflowProcessInfo(process=None, pid_data=pid_data)
+            else:
+                process_data = self.__search_conda_process(pid_data)
 
         # Rescue action when process not found
         if process_data is None:
@@ -596,6 +574,91 @@ class WorkflowMonitor:
 
         return process_data
 
+    def __search_recorded_conda_process(
+        self, process_status: dict, pid_data: WorkflowPIDFileData
+    ) -> Optional[WorkflowProcessInfo]:
+        """
+        Search the `conda env create` process in the recorded child processes.
+        """
+        for child in process_status.get("children", []):
+            if not re.search(self.PROCESS_CONDA_CMDLINE, child["cmdline"]):
+                continue
+
+            conda_process = WorkflowProcessStatus.get_alive_process(
+                child["pid"], child["create_time"]
+            )
+            if conda_process is not None:
+                return WorkflowProcessInfo(process=conda_process, pid_data=pid_data)
+
+        return None
+
+    def __search_conda_process(
+        self, pid_data: WorkflowPIDFileData
+    ) -> Optional[WorkflowProcessInfo]:
+        """
+        Search the `conda env create` process in all processes on the host.
+        *For workflows run without the process status record.
+        """
+        process_data: WorkflowProcessInfo = None
+
+        # ATTENTION:
+        # It should be a warning, but since it matches frequently,
+        # it is temporarily set to debug.
+        # logger.debug(f"No workflow process found. {pid_data}")
+
+        # Search for the existence of a conda command process ("conda env create")
+        conda_process = None
+        for proc in process_iter(["pid", "name"]):
+            try:
+                # Targeting specific programs for backlog (for performance)
+                proc_name = proc.info.get("name")
+                if not any(v in proc_name for v in self.PROCESS_SEARCH_NAMES):
+                    continue
+
+                # Get cmdline info
+                # Note:
+                #   Since "cmdline" is not specified in `process_iter`
+                #   (for performance), the cmdline is obtained using "proc.as_dict".
+                cmdline = proc.as_dict(attrs=["cmdline"]).get("cmdline")
+                cmdline = " ".join(cmdline) if cmdline else ""
+                cmdline = cmdline.replace("\\", "/")
+
+                if re.search(self.PROCESS_CONDA_CMDLINE, cmdline):
+                    conda_ps_create_elapsed = int(time.time() - proc.create_time())
+                    logger.info(
+                        f"Found conda process. [{proc}] [{cmdline}] "
+                        f"[{conda_ps_create_elapsed} sec]",
+                    )
+                    conda_process = Process(proc.pid)
+
+                    # Check elapsed time for process startup
+                    #
+                    # ATTENTION:
+                    # The conda command process is a separate process from
+                    #   the snakemake process (although it is a child process),
+                    #   so it is difficult to identify the process with certainty.
+                    # Therefore, the process start time is used here to determine
+                    #   the process by estimation.
+                    if conda_ps_create_elapsed < self.PROCESS_CONDA_WAIT_TIMEOUT:
+                        process_data = WorkflowProcessInfo(
+                            process=conda_process, pid_data=pid_data
+                        )
+                    else:
+                        logger.warning(
+                            "This conda command is "
+                            "probably an irrelevant process.."
+                            f"[{conda_process}] [{conda_ps_create_elapsed} sec]"
+                        )
+                else:
+                    continue  # skip that process
+
+            except AccessDenied:
+                continue  # skip that process
+            except ZombieProcess:
+                continue  # skip that process
+
+        return process_data
+
     def cancel_run(self):
         """
         The algorithm function of this workflow is being executed at the line:
@@ -627,6 +690,13 @@ class WorkflowMonitor:
             HTTPException: if pid_filepath or last_script_file does not exist
         """
 
+        # The workflow waiting in the scheduler queue is just removed from the queue.
+        if WorkflowScheduler.cancel(self.workspace_id, self.unique_id):
+            SmkStatusLogger.get_logger(self.workspace_id, self.unique_id).error(
+                "Workflow was cancelled before it started."
+            )
+            return True
+
         current_process = self.search_process()
         if current_process is None:
             raise HTTPException(
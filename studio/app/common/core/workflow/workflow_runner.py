@@ -1,6 +1,6 @@
 import uuid
 from dataclasses import asdict
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from studio.app.common.core.experiment.experiment_writer import ExptConfigWriter
 from studio.app.common.core.rules.runner import Runner
@@ -28,6 +28,10 @@ from studio.app.common.core.workflow.workflow import (
     RunItem,
 )
 from studio.app.common.core.workflow.workflow_params import get_typecheck_params
+from studio.app.common.core.workflow.workflow_process_status import (
+    WorkflowProcessStatus,
+)
+from studio.app.common.core.workflow.workflow_scheduler import WorkflowScheduler
 from studio.app.common.core.workflow.workflow_writer import WorkflowConfigWriter
 
 
@@ -45,6 +49,7 @@ class WorkflowRunner:
         self.runItem = runItem
         self.nodeDict = self.runItem.nodeDict
         self.edgeDict = self.runItem.edgeDict
+        self.mem_mb = None
 
         WorkflowConfigWriter(
             self.workspace_id,
@@ -62,13 +67,16 @@ class WorkflowRunner:
         ).write()
 
         Runner.clear_pid_file(self.workspace_id, self.unique_id)
+        # Note: the finished record of the previous run must not be taken
+        #   for this run, until its executor starts recording.
+        WorkflowProcessStatus.clear(self.workspace_id, self.unique_id)
 
     @staticmethod
     def create_workflow_unique_id() -> str:
         new_unique_id = str(uuid.uuid4())[:8]
         return new_unique_id
 
-    def run_workflow(self, background_tasks):
+    def run_workflow(self, user_id: Optional[int] = None):
         # Operate remote storage data.
         if RemoteStorageController.is_available():
             # Check for remote-sync-lock-file
@@ -84,6 +92,7 @@ class WorkflowRunner:
         )
         snakemake_params = SmkParamReader.read(snakemake_params)
         snakemake_params.forcerun = self.runItem.forceRunList
+        snakemake_params.mem_mb = self.mem_mb
 
         # delete dependencies for nodes
         if len(snakemake_params.forcerun) > 0:
@@ -123,12 +132,26 @@ class WorkflowRunner:
                 RemoteSyncAction.UPLOAD,
             )
 
-        background_tasks.add_task(
-            snakemake_execute, self.workspace_id, self.unique_id, snakemake_params
+        # Note: the nodes of the workflow run within the cores granted by the scheduler.
+        snakemake_params.cores = min(
+            snakemake_params.cores, WorkflowScheduler.MAX_CORES
+        )
+
+        WorkflowScheduler.submit(
+            user_id,
+            self.workspace_id,
+            self.unique_id,
+            snakemake_params.cores,
+            snakemake_execute,
+            self.workspace_id,
+            self.unique_id,
+            snakemake_params,
+            memory_mb=snakemake_params.mem_mb,
         )
 
     def set_smk_config(self):
         rules, last_output = self.rulefile()
+        self.mem_mb = self.set_memory_allowance(rules)
 
         nwb_template = get_typecheck_params(self.runItem.nwbParam, "nwb")
 
@@ -142,6 +165,23 @@ class WorkflowRunner:
             self.workspace_id, self.unique_id, asdict(flow_config)
         )
 
+    def set_memory_allowance(self, rules: Dict[str, Rule]) -> int:
+        """
+        Memory allowance of the workflow, shared by its running nodes.
+        *It holds at least the largest node, within the scheduler budget.
+        """
+        mem_mb = min(
+            max(
+                [WorkflowScheduler.WORKFLOW_MEMORY_MB]
+                + [rule.resources["mem_mb"] for rule in rules.values()]
+            ),
+            WorkflowScheduler.MAX_MEMORY_MB,
+        )
+        for rule in rules.values():
+            rule.resources["mem_mb"] = min(rule.resources["mem_mb"], mem_mb)
+
+        return mem_mb
+
     def rulefile(self) -> Dict[str, Rule]:
         endNodeList = self.get_endNodeList()
 
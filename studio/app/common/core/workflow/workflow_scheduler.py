@@ -0,0 +1,308 @@
+import itertools
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import psutil
+from pydantic import BaseSettings, Field
+
+from studio.app.common.core.logger import AppLogger
+from studio.app.common.core.metrics import Counter, Gauge, Histogram
+from studio.app.common.schemas.workflow import WorkflowQueueStatus
+from studio.app.dir_path import DIRPATH
+
+logger = AppLogger.get_logger()
+
+
+class WorkflowSchedulerConfig(BaseSettings):
+    WORKFLOW_MAX_CORES: int = Field(
+        default=os.cpu_count() or 1, env="WORKFLOW_MAX_CORES"
+    )
+    WORKFLOW_MAX_MEMORY_MB: int = Field(
+        default=int(psutil.virtual_memory().total / 1024**2 * 0.8),
+        env="WORKFLOW_MAX_MEMORY_MB",
+    )
+    # estimated memory usage of a workflow
+    WORKFLOW_MEMORY_MB: int = Field(default=4096, env="WORKFLOW_MEMORY_MB")
+
+    class Config:
+        env_file = f"{DIRPATH.CONFIG_DIR}/.env"
+        env_file_encoding = "utf-8"
+
+
+WORKFLOW_SCHEDULER_CONFIG = WorkflowSchedulerConfig()
+
+WORKFLOW_SUBMITTED = Counter(
+    "optinist_workflow_submitted_total",
+    "Workflows submitted to the scheduler.",
+)
+WORKFLOW_QUEUE_WAIT = Histogram(
+    "optinist_workflow_queue_wait_seconds",
+    "Time the workflows waited in the scheduler queue before starting.",
+)
+
+
+@dataclass
+class ScheduledWorkflow:
+    user_key: str
+    workspace_id: str
+    unique_id: str
+    cores: int
+    memory_mb: int
+    func: Callable
+    args: Tuple = field(default_factory=tuple)
+    seq: int = 0
+    submitted_at: float = field(default_factory=time.time)
+
+
+class WorkflowScheduler:
+    """
+    Local (per server process) scheduler of workflow runs.
+
+    Workflows are queued per user, and started while their cores and memory
+      fit in the budgets (WORKFLOW_MAX_CORES, WORKFLOW_MAX_MEMORY_MB).
+    The next workflow is taken from the user with the fewest running workflows
+      (then the user least recently started, then the oldest submission),
+      and it is not overtaken by smaller ones, so that large workflows
+      are never starved.
+    Nodes of a workflow are scheduled by snakemake within the granted cores.
+    """
+
+    MAX_CORES = WORKFLOW_SCHEDULER_CONFIG.WORKFLOW_MAX_CORES
+    MAX_MEMORY_MB = WORKFLOW_SCHEDULER_CONFIG.WORKFLOW_MAX_MEMORY_MB
+    WORKFLOW_MEMORY_MB = WORKFLOW_SCHEDULER_CONFIG.WORKFLOW_MEMORY_MB
+
+    __lock = threading.Lock()
+    __seq = itertools.count()
+    __started_count = 0
+    __last_started: Dict[str, int] = {}
+    __queues: Dict[str, List[ScheduledWorkflow]] = {}
+    __running: Dict[Tuple[str, str], ScheduledWorkflow] = {}
+
+    @classmethod
+    def submit(
+        cls,
+        user_key: str,
+        workspace_id: str,
+        unique_id: str,
+        cores: int,
+        func: Callable,
+        *args,
+        memory_mb: int = None,
+    ) -> ScheduledWorkflow:
+        workflow = ScheduledWorkflow(
+            user_key=str(user_key),
+            workspace_id=workspace_id,
+            unique_id=unique_id,
+            cores=max(1, min(cores, cls.MAX_CORES)),
+            memory_mb=min(memory_mb or cls.WORKFLOW_MEMORY_MB, cls.MAX_MEMORY_MB),
+            func=func,
+            args=args,
+        )
+
+        WORKFLOW_SUBMITTED.inc()
+        with cls.__lock:
+            workflow.seq = next(cls.__seq)
+            cls.__queues.setdefault(workflow.user_key, []).append(workflow)
+            cls.__dispatch()
+
+        return workflow
+
+    @classmethod
+    def cancel(cls, workspace_id: str, unique_id: str) -> bool:
+        """
+        Remove the workflow from the queue (running workflows are not affected).
+        """
+        with cls.__lock:
+            for user_key, queue in cls.__queues.items():
+                for workflow in queue:
+                    if (workflow.workspace_id, workflow.unique_id) == (
+                        workspace_id,
+                        unique_id,
+                    ):
+                        queue.remove(workflow)
+                        if not queue:
+                            cls.__queues.pop(user_key)
+                        return True
+        return False
+
+    @classmethod
+    def is_queued(cls, workspace_id: str, unique_id: str) -> bool:
+        status = cls.get_status(workspace_id, unique_id)
+        return status is not None and status.status == "queued"
+
+    @classmethod
+    def get_status(
+        cls, workspace_id: str, unique_id: str
+    ) -> Optional[WorkflowQueueStatus]:
+        with cls.__lock:
+            workflow = cls.__running.get((workspace_id, unique_id))
+            if workflow is not None:
+                return WorkflowQueueStatus(
+                    status="running",
+                    position=0,
+                    cores=workflow.cores,
+                    memory_mb=workflow.memory_mb,
+                )
+
+            for position, workflow in enumerate(cls.__get_queue_order(), start=1):
+                if (workflow.workspace_id, workflow.unique_id) == (
+                    workspace_id,
+                    unique_id,
+                ):
+                    return WorkflowQueueStatus(
+                        status="queued",
+                        position=position,
+                        cores=workflow.cores,
+                        memory_mb=workflow.memory_mb,
+                    )
+
+        return None
+
+    @classmethod
+    def get_usage(cls) -> Tuple[int, int]:
+        """
+        Returns (cores, memory_mb) used by the running workflows.
+        """
+        with cls.__lock:
+            return cls.__get_usage()
+
+    @classmethod
+    def get_counts(cls) -> Tuple[int, int]:
+        """
+        Returns (queued, running) numbers of the workflows.
+        """
+        with cls.__lock:
+            return (
+                sum(len(queue) for queue in cls.__queues.values()),
+                len(cls.__running),
+            )
+
+    @classmethod
+    def __get_usage(cls) -> Tuple[int, int]:
+        return (
+            sum(w.cores for w in cls.__running.values()),
+            sum(w.memory_mb for w in cls.__running.values()),
+        )
+
+    @classmethod
+    def __get_queue_order(cls) -> List[ScheduledWorkflow]:
+        """
+        Order in which the queued workflows will be started.
+        """
+        running_counts: Dict[str, int] = {}
+        for workflow in cls.__running.values():
+            running_counts[workflow.user_key] = (
+                running_counts.get(workflow.user_key, 0) + 1
+            )
+
+        last_started = dict(cls.__last_started)
+        started_count = cls.__started_count
+        heads = {user_key: 0 for user_key in cls.__queues}
+        order = []
+        while heads:
+            user_key = min(
+                heads,
+                key=lambda k: (
+                    running_counts.get(k, 0),
+                    last_started.get(k, -1),
+                    cls.__queues[k][heads[k]].seq,
+                ),
+            )
+            order.append(cls.__queues[user_key][heads[user_key]])
+            running_counts[user_key] = running_counts.get(user_key, 0) + 1
+            last_started[user_key] = started_count
+            started_count += 1
+            heads[user_key] += 1
+            if heads[user_key] == len(cls.__queues[user_key]):
+                heads.pop(user_key)
+
+        return order
+
+    @classmethod
+    def __dispatch(cls):
+        """
+        Start the queued workflows which fit in the budgets.
+        *Called with the lock held.
+        """
+        while cls.__queues:
+            workflow = cls.__get_queue_order()[0]
+            cores, memory_mb = cls.__get_usage()
+            if (
+                cores + workflow.cores > cls.MAX_CORES
+                or memory_mb + workflow.memory_mb > cls.MAX_MEMORY_MB
+            ):
+                break
+
+            queue = cls.__queues[workflow.user_key]
+            queue.remove(workflow)
+            if not queue:
+                cls.__queues.pop(workflow.user_key)
+            cls.__running[(workflow.workspace_id, workflow.unique_id)] = workflow
+            cls.__last_started[workflow.user_key] = cls.__started_count
+            cls.__started_count += 1
+            WORKFLOW_QUEUE_WAIT.observe(time.time() - workflow.submitted_at)
+
+            # Note: the number of threads is bounded by the budgets
+            #   (each running workflow uses at least 1 core).
+            threading.Thread(
+                target=cls.__run,
+                args=(workflow,),
+                name=f"workflow-{workflow.unique_id}",
+            ).start()
+
+    @classmethod
+    def __run(cls, workflow: ScheduledWorkflow):
+        logger.info(
+            "start scheduled workflow. [%s/%s] [cores: %s] [memory: %sMB]",
+            workflow.workspace_id,
+            workflow.unique_id,
+            workflow.cores,
+            workflow.memory_mb,
+        )
+        try:
+            workflow.func(*workflow.args)
+        except Exception as e:
+            logger.error(e, exc_info=True)
+        finally:
+            with cls.__lock:
+                cls.__running.pop((workflow.workspace_id, workflow.unique_id), None)
+                cls.__dispatch()
+
+
+# Note: the gauges are read from the scheduler at the scrape.
+for name, documentation, function in [
+    (
+        "optinist_workflow_queued",
+        "Workflows waiting in the scheduler queue.",
+        lambda: WorkflowScheduler.get_counts()[0],
+    ),
+    (
+        "optinist_workflow_running",
+        "Workflows running (started by the scheduler).",
+        lambda: WorkflowScheduler.get_counts()[1],
+    ),
+    (
+        "optinist_workflow_cores_used",
+        "Cores granted to the running workflows.",
+        lambda: WorkflowScheduler.get_usage()[0],
+    ),
+    (
+        "optinist_workflow_cores_max",
+        "Core budget of the workflows (WORKFLOW_MAX_CORES).",
+        lambda: WorkflowScheduler.MAX_CORES,
+    ),
+    (
+        "optinist_workflow_memory_used_mb",
+        "Memory granted to the running workflows.",
+        lambda: WorkflowScheduler.get_usage()[1],
+    ),
+    (
+        "optinist_workflow_memory_max_mb",
+        "Memory budget of the workflows (WORKFLOW_MAX_MEMORY_MB).",
+        lambda: WorkflowScheduler.MAX_MEMORY_MB,
+    ),
+]:
+    Gauge(name, documentation).set_function(function)
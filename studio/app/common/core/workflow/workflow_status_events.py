@@ -0,0 +1,56 @@
+import json
+import os
+import time
+from typing import List, Tuple
+
+from studio.app.common.core.utils.filepath_creater import join_filepath
+from studio.app.dir_path import DIRPATH
+
+
+class WorkflowStatusEvents:
+    """
+    Node status transitions, appended by the Runner as they happen,
+      so that watchers only need to read the new events
+      instead of observing the whole workflow.
+    """
+
+    EVENTS_FILE = "node_status_events.jsonl"
+
+    @classmethod
+    def get_events_file_path(cls, workspace_id: str, unique_id: str) -> str:
+        return join_filepath(
+            [DIRPATH.OUTPUT_DIR, workspace_id, unique_id, cls.EVENTS_FILE]
+        )
+
+    @classmethod
+    def emit(cls, workspace_id: str, unique_id: str, node_id: str, status: str):
+        event = {"node_id": node_id, "status": status, "time": time.time()}
+
+        # Note: each event is written by a single append of one line,
+        #   so events of nodes running in parallel are not interleaved.
+        with open(cls.get_events_file_path(workspace_id, unique_id), "a") as f:
+            f.write(json.dumps(event) + "\n")
+
+    @classmethod
+    def read(
+        cls, workspace_id: str, unique_id: str, offset: int = 0
+    ) -> Tuple[List[dict], int]:
+        """
+        Returns the events written after offset (bytes), and the next offset.
+        """
+        events_file_path = cls.get_events_file_path(workspace_id, unique_id)
+        try:
+            if os.path.getsize(events_file_path) <= offset:
+                return [], offset
+
+            with open(events_file_path, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return [], offset
+
+        # Note: a line being written is read at the next call.
+        complete = data[: data.rfind(b"\n") + 1]
+        events = [json.loads(line) for line in complete.splitlines() if line]
+
+        return events, offset + len(complete)
@@ -0,0 +1,143 @@
+import asyncio
+import time
+from typing import AsyncIterator, Dict, Optional, Set, Tuple
+
+from studio.app.common.core.experiment.experiment_reader import ExptConfigReader
+from studio.app.common.core.logger import AppLogger
+from studio.app.common.core.workflow.workflow import Message, NodeRunStatus
+from studio.app.common.core.workflow.workflow_result import NodeResult, WorkflowResult
+from studio.app.common.core.workflow.workflow_status_events import WorkflowStatusEvents
+from studio.app.common.core.workspace.workspace_data_capacity_services import (
+    WorkspaceDataCapacityService,
+)
+
+logger = AppLogger.get_logger()
+
+
+class WorkflowStatusStream:
+    """
+    Push channel of node status of a workflow.
+
+    One watcher task per workflow (shared by all its subscribers) follows
+      the status events written by the Runner, and observes the workflow
+      (WorkflowResult.observe) only when a node has finished.
+    The process liveness is checked every PROCESS_CHECK_INTERVAL seconds
+      while no event arrives.
+    """
+
+    EVENTS_POLL_INTERVAL = 0.5  # sec
+    PROCESS_CHECK_INTERVAL = 10  # sec
+
+    __watchers: Dict[Tuple[str, str], "WorkflowStatusStream"] = {}
+
+    def __init__(self, workspace_id: str, unique_id: str):
+        self.workspace_id = workspace_id
+        self.unique_id = unique_id
+        self.queues: Set[asyncio.Queue] = set()
+        self.messages: Dict[str, Message] = {}
+        self.task: Optional[asyncio.Task] = None
+
+    @classmethod
+    async def subscribe(
+        cls, workspace_id: str, unique_id: str
+    ) -> AsyncIterator[Dict[str, Message]]:
+        """
+        Yields {node_id: Message} of each status transition,
+          until all nodes of the workflow have finished.
+        """
+        key = (workspace_id, unique_id)
+        watcher = cls.__watchers.get(key)
+        if watcher is None:
+            watcher = cls.__watchers[key] = cls(workspace_id, unique_id)
+            watcher.task = asyncio.create_task(watcher.__watch())
+
+        queue = asyncio.Queue()
+        watcher.queues.add(queue)
+        try:
+            # messages published before subscribing
+            if watcher.messages:
+                yield dict(watcher.messages)
+
+            while True:
+                messages = await queue.get()
+                if messages is None:
+                    break
+                yield messages
+        finally:
+            watcher.queues.discard(queue)
+            if not watcher.queues and cls.__watchers.get(key) is watcher:
+                watcher.task.cancel()
+                cls.__watchers.pop(key)
+
+    def __publish(self, messages: Optional[Dict[str, Message]]):
+        if messages:
+            self.messages.update(messages)
+        for queue in self.queues:
+            queue.put_nowait(messages)
+
+    def __get_pending_node_ids(self) -> Set[str]:
+        expt_config = ExptConfigReader.read(self.workspace_id, self.unique_id)
+        return {
+            node_id
+            for node_id, expt_function in {
+                **expt_config.function,
+                **expt_config.procs,
+            }.items()
+            if not NodeResult.is_node_already_finished(expt_function)
+        }
+
+    async def __watch(self):
+        try:
+            pending_node_ids = self.__get_pending_node_ids()
+            offset = 0
+            checked_at = time.time()
+
+            while pending_node_ids:
+                events, offset = WorkflowStatusEvents.read(
+                    self.workspace_id, self.unique_id, offset
+                )
+                running = {
+                    e["node_id"]: Message(status=e["status"], message="")
+                    for e in events
+                    if e["status"] == NodeRunStatus.RUNNING.value
+                    and e["node_id"] in pending_node_ids
+                }
+                has_finished = any(
+                    e["status"] != NodeRunStatus.RUNNING.value
+                    and e["node_id"] in pending_node_ids
+                    for e in events
+                )
+
+                if running:
+                    self.__publish(running)
+
+                if has_finished or (
+                    time.time() - checked_at > self.PROCESS_CHECK_INTERVAL
+                ):
+                    # Note: observe also checks the workflow process
+                    #   and updates the experiment config of finished nodes.
+                    messages = await WorkflowResult(
+                        self.workspace_id, self.unique_id
+                    ).observe(list(pending_node_ids))
+                    checked_at = time.time()
+
+                    if messages:
+                        pending_node_ids -= messages.keys()
+                        self.__publish(messages)
+
+                await asyncio.sleep(self.EVENTS_POLL_INTERVAL)
+
+            await asyncio.to_thread(
+                WorkspaceDataCapacityService.update_experiment_data_usage,
+                self.workspace_id,
+                self.unique_id,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(e, exc_info=True)
+        finally:
+            key = (self.workspace_id, self.unique_id)
+            if __class__.__watchers.get(key) is self:
+                __class__.__watchers.pop(key)
+            self.__publish(None)
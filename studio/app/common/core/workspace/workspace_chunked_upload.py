@@ -0,0 +1,219 @@
+import asyncio
+import json
+import os
+from typing import Optional
+
+from studio.app.common.core.logger import AppLogger
+from studio.app.common.core.storage.remote_storage_controller import (
+    RemoteStorageController,
+    RemoteStorageSimpleWriter,
+)
+from studio.app.common.core.utils.filepath_creater import (
+    create_directory,
+    join_filepath,
+)
+from studio.app.dir_path import DIRPATH
+
+logger = AppLogger.get_logger()
+
+
+class ChunkedUploadOffsetError(Exception):
+    def __init__(self, filename: str, offset: int):
+        self.filename = filename
+        self.offset = offset
+
+        message = f"Chunk offset mismatch, expected offset: {offset} [{filename}]"
+        super().__init__(message)
+
+
+class WorkspaceChunkedUpload:
+    """
+    Resumable upload of an input file, sent as sequential chunks.
+
+    Each chunk is written to a local part file and, when remote storage
+      is available, pushed as a part of a multipart upload concurrently.
+    The upload state (offset, remote upload_id and parts) is persisted
+      after each chunk, so that an interrupted upload can be resumed
+      from the last received offset.
+    """
+
+    UPLOAD_DIRNAME = ".upload"
+
+    # Note: S3 rejects multipart parts smaller than 5MiB (except the last part).
+    MIN_CHUNK_BYTES = 5 * 1024 * 1024
+
+    def __init__(self, workspace_id: str, filename: str, remote_bucket_name: str):
+        self.workspace_id = workspace_id
+        self.filename = filename
+        self.remote_bucket_name = remote_bucket_name
+
+        workspace_dir = join_filepath([DIRPATH.INPUT_DIR, workspace_id])
+        upload_dir = join_filepath([workspace_dir, self.UPLOAD_DIRNAME])
+        self.filepath = join_filepath([workspace_dir, filename])
+        self.part_path = join_filepath([upload_dir, f"{filename}.part"])
+        self.state_path = join_filepath([upload_dir, f"{filename}.json"])
+
+        self.__state = self.__read_state()
+
+    def __read_state(self) -> Optional[dict]:
+        try:
+            with open(self.state_path) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def __save_state(self):
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.__state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def __clear_state(self):
+        for path in [self.state_path, self.part_path]:
+            if os.path.exists(path):
+                os.remove(path)
+        self.__state = None
+
+    @property
+    def status(self) -> dict:
+        state = self.__state or {"total": 0, "offset": 0}
+        return {
+            "file_path": self.filename,
+            "total": state["total"],
+            "offset": state["offset"],
+            "completed": False,
+        }
+
+    def __write_local(self, offset: int, data: bytes):
+        mode = "r+b" if os.path.exists(self.part_path) else "wb"
+        with open(self.part_path, mode) as f:
+            f.seek(offset)
+            f.write(data)
+            # Note: drop any bytes left over from a chunk that was
+            #   written locally but not recorded in the state.
+            f.truncate()
+
+    async def __start(self, total: int):
+        create_directory(os.path.dirname(self.state_path))
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
+
+        upload_id = None
+        if RemoteStorageController.is_available():
+            async with RemoteStorageSimpleWriter(
+                self.remote_bucket_name
+            ) as remote_storage_controller:
+                upload_id = (
+                    await remote_storage_controller.create_input_data_multipart_upload(
+                        self.workspace_id, self.filename
+                    )
+                )
+
+        self.__state = {
+            "total": total,
+            "offset": 0,
+            "upload_id": upload_id,
+            "parts": [],
+        }
+        self.__save_state()
+
+    async def __upload_remote_part(self, part_number: int, data: bytes):
+        async with RemoteStorageSimpleWriter(
+            self.remote_bucket_name
+        ) as remote_storage_controller:
+            return await remote_storage_controller.upload_input_data_part(
+                self.workspace_id,
+                self.filename,
+                self.__state["upload_id"],
+                part_number,
+                data,
+            )
+
+    async def __complete(self):
+        logger.info(
+            "complete chunked upload. [%s] [%s bytes]",
+            self.filepath,
+            self.__state["total"],
+        )
+
+        os.replace(self.part_path, self.filepath)
+
+        if self.__state["upload_id"] is not None:
+            async with RemoteStorageSimpleWriter(
+                self.remote_bucket_name
+            ) as remote_storage_controller:
+                await remote_storage_controller.complete_input_data_multipart_upload(
+                    self.workspace_id,
+                    self.filename,
+                    self.__state["upload_id"],
+                    self.__state["parts"],
+                )
+
+        self.__clear_state()
+
+    async def write_chunk(self, offset: int, total: int, data: bytes) -> dict:
+        """
+        Write the chunk at offset, and complete the upload with the last chunk.
+        *Chunks must be sent in order; the next expected offset is in status.
+
+        Returns:
+            status dict ("completed" is True when the file has been completed)
+        """
+        is_last_chunk = offset + len(data) >= total
+        if not is_last_chunk and len(data) < self.MIN_CHUNK_BYTES:
+            raise ValueError(
+                f"Chunk must be at least {self.MIN_CHUNK_BYTES} bytes "
+                f"except for the last chunk [{self.filename}]"
+            )
+
+        if offset == 0 and (
+            self.__state is None
+            or self.__state["offset"] > 0
+            or self.__state["total"] != total
+        ):
+            # (re)start the upload from the beginning
+            if self.__state is not None:
+                await self.abort()
+            await self.__start(total)
+        elif self.__state is None or offset != self.__state["offset"]:
+            raise ChunkedUploadOffsetError(self.filename, self.status["offset"])
+        elif total != self.__state["total"]:
+            raise ValueError(f"Upload total size changed: {total} [{self.filename}]")
+
+        # Note: the local write and the remote part upload run concurrently,
+        #   so the remote push does not wait for the whole file.
+        tasks = [asyncio.to_thread(self.__write_local, offset, data)]
+        if self.__state["upload_id"] is not None:
+            part_number = len(self.__state["parts"]) + 1
+            tasks.append(self.__upload_remote_part(part_number, data))
+        results = await asyncio.gather(*tasks)
+
+        if self.__state["upload_id"] is not None:
+            self.__state["parts"].append(results[1])
+        self.__state["offset"] = offset + len(data)
+        self.__save_state()
+
+        if is_last_chunk:
+            await self.__complete()
+            return {
+                "file_path": self.filename,
+                "total": total,
+                "offset": total,
+                "completed": True,
+            }
+
+        return self.status
+
+    async def abort(self):
+        """
+        Discard the partially uploaded file (local and remote).
+        """
+        if self.__state is not None and self.__state.get("upload_id") is not None:
+            async with RemoteStorageSimpleWriter(
+                self.remote_bucket_name
+            ) as remote_storage_controller:
+                await remote_storage_controller.abort_input_data_multipart_upload(
+                    self.workspace_id, self.filename, self.__state["upload_id"]
+                )
+
+        self.__clear_state()
@@ -0,0 +1,152 @@
+import json
+import os
+from typing import Dict, List, Optional
+
+from studio.app.common.core.utils.filelock_handler import FileLockUtils
+from studio.app.common.core.utils.filepath_creater import (
+    create_directory,
+    join_filepath,
+)
+from studio.app.dir_path import DIRPATH
+
+
+class WorkspaceFileIndex:
+    """
+    Persisted index of the workspace input directory tree.
+
+    Each directory entry holds its mtime and the names of its
+      sub-directories and files ("" is the workspace root).
+    Entries are refreshed lazily when the directory mtime changes,
+      and refreshed directly by the upload/delete/download handlers.
+    """
+
+    # Note: the index is kept in its own hidden directory,
+    #   so that saving it does not change the mtime of the workspace root.
+    INDEX_DIRNAME = ".file_index"
+    INDEX_FILENAME = "file_index.json"
+    FILE_LOCK_TIMEOUT = 10
+
+    def __init__(self, workspace_id: str):
+        self.workspace_id = workspace_id
+        self.root_dir = join_filepath([DIRPATH.INPUT_DIR, workspace_id])
+        self.index_path = join_filepath(
+            [self.root_dir, self.INDEX_DIRNAME, self.INDEX_FILENAME]
+        )
+
+        self.__dirs: Dict[str, dict] = self.__read()
+        self.__modified = False
+
+        # Note: results are kept only for the lifetime of this instance
+        #   (eg. one tree request), as the directories may change afterwards.
+        self.__has_files_cache: Dict[tuple, bool] = {}
+
+    def __read(self) -> Dict[str, dict]:
+        try:
+            with open(self.index_path) as f:
+                return json.load(f)["dirs"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return {}
+
+    def save(self):
+        if not self.__modified:
+            return
+
+        # Note: write to a temporary file and replace,
+        #   so that readers never see a partially written index.
+        create_directory(os.path.dirname(self.index_path))
+        with FileLockUtils.lock(
+            self.index_path, timeout=self.FILE_LOCK_TIMEOUT, name="workspace_file_index"
+        ):
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"dirs": self.__dirs}, f)
+            os.replace(tmp_path, self.index_path)
+
+        self.__modified = False
+
+    def __abspath(self, dirname: str) -> str:
+        if not dirname:
+            return self.root_dir
+
+        # Note: dirname may be given by the client,
+        #   and must not refer to directories outside the workspace.
+        if os.path.isabs(dirname) or ".." in dirname.replace("\\", "/").split("/"):
+            raise ValueError(f"Invalid directory name: {dirname}")
+
+        return join_filepath([self.root_dir, dirname])
+
+    def __scan_dir(self, dirname: str, mtime: int) -> dict:
+        dirs, files = [], []
+        with os.scandir(self.__abspath(dirname)) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if not (dirname == "" and entry.name == self.INDEX_DIRNAME):
+                        dirs.append(entry.name)
+                elif entry.is_file():
+                    files.append(entry.name)
+
+        entry = {"mtime": mtime, "dirs": sorted(dirs), "files": sorted(files)}
+        self.__dirs[dirname] = entry
+        self.__modified = True
+
+        return entry
+
+    def list_dir(self, dirname: str = "") -> Optional[dict]:
+        """
+        Returns the index entry of the directory ({"dirs": [...], "files": [...]}),
+          rescanning it only if its mtime has changed.
+        Raises ValueError if dirname is not a relative path inside the workspace.
+        """
+        dirname = dirname or ""
+        try:
+            mtime = os.stat(self.__abspath(dirname)).st_mtime_ns
+        except FileNotFoundError:
+            if self.__dirs.pop(dirname, None) is not None:
+                self.__modified = True
+            return None
+
+        entry = self.__dirs.get(dirname)
+        if entry is None or entry["mtime"] != mtime:
+            entry = self.__scan_dir(dirname, mtime)
+
+        return entry
+
+    def has_files(self, dirname: str, file_types: List[str]) -> bool:
+        """
+        Whether the directory contains (recursively) files of the file_types.
+        *Hidden files and directories are not searched (same as glob "**").
+        """
+        cache_key = (dirname, tuple(file_types))
+        if cache_key in self.__has_files_cache:
+            return self.__has_files_cache[cache_key]
+
+        entry = self.list_dir(dirname)
+        found = entry is not None and (
+            any(
+                name.endswith(tuple(file_types)) and not name.startswith(".")
+                for name in entry["files"]
+            )
+            or any(
+                self.has_files(join_filepath([dirname, d]), file_types)
+                for d in entry["dirs"]
+                if not d.startswith(".")
+            )
+        )
+        self.__has_files_cache[cache_key] = found
+
+        return found
+
+    def update_file(self, relative_path: str):
+        """
+        Refreshes the entry of the directory containing the added/removed file.
+        """
+        dirname = os.path.dirname(relative_path)
+        abspath = self.__abspath(dirname)
+
+        if os.path.isdir(abspath):
+            self.__scan_dir(dirname, os.stat(abspath).st_mtime_ns)
+        else:
+            self.list_dir(dirname)
+        self.__has_files_cache.clear()
+
+        self.save()
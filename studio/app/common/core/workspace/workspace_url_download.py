@@ -0,0 +1,178 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import requests
+import urllib3
+from requests.models import Response
+
+from studio.app.common.core.logger import AppLogger
+from studio.app.common.core.utils.filepath_creater import (
+    create_directory,
+    join_filepath,
+)
+from studio.app.dir_path import DIRPATH
+
+logger = AppLogger.get_logger()
+
+
+class WorkspaceUrlDownload:
+    """
+    Download of an input file from url, run in a background executor.
+
+    The progress is kept in a status file under the workspace,
+      so that it can be read from any worker process.
+    The response is streamed with adaptive chunk sizes, and an interrupted
+      transfer is resumed with a Range request when the server supports it.
+    """
+
+    DOWNLOAD_DIRNAME = ".download"
+
+    MIN_CHUNK_BYTES = 64 * 1024
+    MAX_CHUNK_BYTES = 8 * 1024 * 1024
+    # Note: the chunk size is doubled while a chunk is read faster than this.
+    TARGET_CHUNK_SECONDS = 0.1
+    STATUS_INTERVAL_SECONDS = 0.5
+    MAX_RETRIES = 3
+    # Note: the resume offset counts the bytes on the wire (as Range does),
+    #   so the transfer is requested without content encoding.
+    REQUEST_HEADERS = {"Accept-Encoding": "identity"}
+
+    __executor = ThreadPoolExecutor(
+        max_workers=int(os.environ.get("DOWNLOAD_MAX_WORKERS", 4)),
+        thread_name_prefix="url_download",
+    )
+
+    def __init__(self, workspace_id: str, file_name: str):
+        self.workspace_id = workspace_id
+        self.file_name = file_name
+
+        workspace_dir = join_filepath([DIRPATH.INPUT_DIR, workspace_id])
+        download_dir = join_filepath([workspace_dir, self.DOWNLOAD_DIRNAME])
+        self.filepath = join_filepath([workspace_dir, file_name])
+        self.part_path = join_filepath([download_dir, f"{file_name}.part"])
+        self.status_path = join_filepath([download_dir, f"{file_name}.json"])
+
+    @property
+    def status(self) -> Optional[dict]:
+        try:
+            with open(self.status_path) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def __save_status(self, total: int = 0, current: int = 0, error: str = None):
+        create_directory(os.path.dirname(self.status_path))
+
+        # Note: write to a temporary file and replace,
+        #   so that readers never see a partially written status.
+        tmp_path = f"{self.status_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"total": total, "current": current, "error": error}, f)
+        os.replace(tmp_path, self.status_path)
+
+    def submit(self, res: Response, on_complete=None):
+        """
+        Start the download of the (already opened) response in the executor.
+        """
+        self.__save_status(total=int(res.headers.get("content-length", 0)))
+        return __class__.__executor.submit(self.run, res, on_complete)
+
+    def run(self, res: Response, on_complete=None):
+        create_directory(os.path.dirname(self.part_path))
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
+
+        url = res.url
+        total = int(res.headers.get("content-length", 0))
+        current = 0
+        retries = 0
+
+        try:
+            while True:
+                try:
+                    current = self.__stream(res, total, current)
+                    break
+                except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+                    retries += 1
+                    if retries > self.MAX_RETRIES:
+                        raise e
+
+                    # resume from the bytes already written
+                    # Note: an encoded response (the server ignored the
+                    #   request headers) is decoded, and so cannot be resumed.
+                    current = (
+                        os.path.getsize(self.part_path)
+                        if os.path.exists(self.part_path) and not self.__is_encoded(res)
+                        else 0
+                    )
+                    logger.warning(
+                        "resume download. [%s] [%s bytes] [%s]", url, current, e
+                    )
+                    res = self.__resume(url, current)
+                    if res.status_code != 206:
+                        # Range not supported: restart from the beginning
+                        current = 0
+
+            os.replace(self.part_path, self.filepath)
+            self.__save_status(total=total or current, current=current)
+        except Exception as e:
+            logger.error(e, exc_info=True)
+            self.__save_status(total=total, current=current, error=str(e))
+            return
+
+        if on_complete is not None:
+            on_complete()
+
+    def __resume(self, url: str, offset: int) -> Response:
+        headers = dict(self.REQUEST_HEADERS)
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        res = requests.get(url, stream=True, headers=headers)
+        res.raise_for_status()
+        return res
+
+    @staticmethod
+    def __is_encoded(res: Response) -> bool:
+        return res.headers.get("content-encoding", "identity") != "identity"
+
+    def __stream(self, res: Response, total: int, current: int) -> int:
+        chunk_size = self.MIN_CHUNK_BYTES
+        saved_at = time.time()
+        decode_content = self.__is_encoded(res)
+        content_length = int(res.headers.get("content-length", 0))
+
+        with res, open(self.part_path, "r+b" if current else "wb") as f:
+            f.seek(current)
+            f.truncate()
+
+            while True:
+                started_at = time.time()
+                data = res.raw.read(chunk_size, decode_content=decode_content)
+                if not data:
+                    break
+                f.write(data)
+                current += len(data)
+
+                elapsed = time.time() - started_at
+                if elapsed < self.TARGET_CHUNK_SECONDS and len(data) == chunk_size:
+                    chunk_size = min(chunk_size * 2, self.MAX_CHUNK_BYTES)
+                elif elapsed > self.TARGET_CHUNK_SECONDS * 4:
+                    chunk_size = max(chunk_size // 2, self.MIN_CHUNK_BYTES)
+
+                if time.time() - saved_at > self.STATUS_INTERVAL_SECONDS:
+                    self.__save_status(total=total, current=current)
+                    saved_at = time.time()
+
+            # Note: raw.tell() is the count of bytes read from the wire.
+            received = res.raw.tell()
+
+        if content_length and received < content_length:
+            raise requests.ConnectionError(
+                f"Connection closed at {received}/{content_length} bytes"
+                f" [{self.file_name}]"
+            )
+
+        return current
@@ -0,0 +1,85 @@
+import inspect
+import os
+from typing import Dict, Optional
+
+from studio.app.common.core.utils.filepath_finder import (
+    clear_filepath_cache,
+    find_condaenv_filepath,
+)
+from studio.app.dir_path import DIRPATH
+
+
+class WrapperRegistry:
+    """
+    Per-process registry of the wrappers (wrapper_dict), built on first use:
+      - wrappers by path (eg. "suite2p/suite2p_roi")
+      - function signatures of the wrappers
+      - conda env filepaths by conda_name
+
+    Call clear() to rebuild it (eg. after conda env files are added).
+
+    Note: the wrappers (and the algorithm libraries they import) are imported
+      on first use, not when this module is imported.
+    """
+
+    __wrappers: Dict[str, dict] = None
+    __signatures: Dict[str, inspect.Signature] = {}
+    __conda_env_filepaths: Dict[str, Optional[str]] = {}
+
+    @classmethod
+    def get_wrapper_dict(cls) -> dict:
+        """
+        Nested wrapper_dict (eg. {"suite2p": {"suite2p_roi": {...}}}).
+        """
+        from studio.app.wrappers import wrapper_dict
+
+        return wrapper_dict
+
+    @classmethod
+    def get_wrappers(cls) -> Dict[str, dict]:
+        if cls.__wrappers is None:
+            cls.__wrappers = cls.__flatten(cls.get_wrapper_dict(), "")
+        return cls.__wrappers
+
+    @classmethod
+    def get_wrapper(cls, wrapper_path: str) -> dict:
+        """
+        Raises KeyError, if the wrapper does not exist.
+        """
+        return cls.get_wrappers()[wrapper_path]
+
+    @classmethod
+    def get_signature(cls, wrapper_path: str) -> inspect.Signature:
+        if wrapper_path not in cls.__signatures:
+            cls.__signatures[wrapper_path] = inspect.signature(
+                cls.get_wrapper(wrapper_path)["function"]
+            )
+        return cls.__signatures[wrapper_path]
+
+    @classmethod
+    def get_conda_env_filepath(cls, conda_name: str) -> Optional[str]:
+        if conda_name not in cls.__conda_env_filepaths:
+            conda_env_filepath = f"{DIRPATH.CONDAENV_DIR}/envs/{conda_name}"
+            if not os.path.exists(conda_env_filepath):
+                conda_env_filepath = find_condaenv_filepath(conda_name)
+            cls.__conda_env_filepaths[conda_name] = conda_env_filepath
+
+        return cls.__conda_env_filepaths[conda_name]
+
+    @classmethod
+    def clear(cls):
+        cls.__wrappers = None
+        cls.__signatures.clear()
+        cls.__conda_env_filepaths.clear()
+        clear_filepath_cache()
+
+    @classmethod
+    def __flatten(cls, root_dict: dict, parent_path: str) -> Dict[str, dict]:
+        wrappers = {}
+        for key, value in root_dict.items():
+            path = f"{parent_path}/{key}" if parent_path else key
+            if isinstance(value, dict) and "function" not in value:
+                wrappers.update(cls.__flatten(value, path))
+            else:
+                wrappers[path] = value
+        return wrappers
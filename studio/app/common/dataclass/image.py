@@ -11,7 +11,15 @@ from studio.app.common.core.utils.filepath_creater import (
     create_directory,
     join_filepath,
 )
+from studio.app.common.core.utils.image_pyramid import (
+    build_image_pyramid,
+    get_pyramid_level_path,
+    get_thumbnail_path,
+    save_image_thumbnail,
+    save_pyramid_meta,
+)
 from studio.app.common.core.utils.json_writer import JsonWriter
+from studio.app.common.core.utils.memmap_handler import MemmapReader
 from studio.app.common.core.workflow.workflow import OutputPath, OutputType
 from studio.app.common.dataclass.base import BaseData
 from studio.app.common.dataclass.utils import create_images_list
@@ -31,9 +39,20 @@ class ImageData(BaseData):
 
         self.json_path = None
         self.meta = meta
+        self.mmap_path = None
 
         if data is None:
             self.path = None
+        elif MemmapReader.is_memmap_file(data):
+            # Keep the memmap as file-backed source of the movie,
+            #   and write the tiff for viewers frame by frame.
+            _dir = join_filepath([output_dir, "tiff", file_name])
+            create_directory(_dir)
+
+            _path = join_filepath([_dir, f"{file_name}.tif"])
+            self.save_memmap_as_tiff(data, _path)
+            self.path = [_path]
+            self.mmap_path = data
         elif isinstance(data, str):
             self.path = data
         elif isinstance(data, list) and isinstance(data[0], str):
@@ -49,6 +68,15 @@ class ImageData(BaseData):
             del data
             gc.collect()
 
+    @staticmethod
+    def save_memmap_as_tiff(mmap_path: str, tiff_path: str):
+        # Note: Frames are written as one contiguous series,
+        #   so the tiff itself can be memory-mapped by readers.
+        with tifffile.TiffWriter(tiff_path, bigtiff=True) as tif:
+            for frames in MemmapReader.iter_frames(mmap_path):
+                for frame in frames:
+                    tif.write(frame, contiguous=True, photometric="minisblack")
+
     def split_image(self, output_dir: str, n_files: int = 2):
         assert n_files > 1, "n_files should be greater than 1"
 
@@ -74,6 +102,17 @@ class ImageData(BaseData):
 
         return save_paths
 
+    @property
+    def memmap(self) -> Optional[np.memmap]:
+        """
+        Read-only file-backed view of the movie, if it is kept as memmap.
+        """
+        mmap_path = getattr(self, "mmap_path", None)
+        if mmap_path is None or not os.path.isfile(mmap_path):
+            return None
+
+        return MemmapReader.read(mmap_path)
+
     @property
     def data(self):
         if isinstance(self.path, list):
@@ -82,14 +121,37 @@ class ImageData(BaseData):
             return np.array(imageio.volread(self.path))
 
     def save_json(self, json_dir):
-        if self.data.ndim < 3:
+        data = self.memmap
+        if data is None:
+            data = self.data
+
+        if data.ndim < 3:
             self.json_path = join_filepath([json_dir, f"{self.file_name}.json"])
-            JsonWriter.write_as_split(self.json_path, create_images_list(self.data))
+            JsonWriter.write_as_split(self.json_path, create_images_list(data))
             JsonWriter.write_plot_meta(json_dir, self.file_name, self.meta)
 
+            # downsampled levels, served for small viewports
+            levels = build_image_pyramid(data)
+            for level, level_data in enumerate(levels, 1):
+                JsonWriter.write_as_split(
+                    get_pyramid_level_path(self.json_path, level),
+                    create_images_list(level_data),
+                )
+            save_pyramid_meta(self.json_path, [data.shape, *[x.shape for x in levels]])
+            save_image_thumbnail(get_thumbnail_path(self.json_path), data)
+        elif data.size > 0:
+            save_image_thumbnail(
+                get_thumbnail_path(join_filepath([json_dir, self.file_name])),
+                data[(0,) * (data.ndim - 2)],
+            )
+
     @property
     def output_path(self) -> OutputPath:
-        if self.data.ndim >= 3:
+        data = self.memmap
+        if data is None:
+            data = self.data
+
+        if data.ndim >= 3:
             # self.path will be a list if self.data got into else statement on __init__
             if isinstance(self.path, list) and isinstance(self.path[0], str):
                 _path = self.path[0]
@@ -98,7 +160,7 @@ class ImageData(BaseData):
             return OutputPath(
                 path=_path,
                 type=OutputType.IMAGE,
-                max_index=len(self.data),
+                max_index=len(data),
             )
         else:
             return OutputPath(
@@ -8,6 +8,7 @@ from studio.app.common.core.utils.filepath_creater import (
     join_filepath,
 )
 from studio.app.common.core.utils.json_writer import JsonWriter
+from studio.app.common.core.utils.timeseries_decimator import TimeSeriesDecimator
 from studio.app.common.core.workflow.workflow import OutputPath, OutputType
 from studio.app.common.dataclass.base import BaseData
 from studio.app.common.schemas.outputs import PlotMetaData
@@ -80,6 +81,15 @@ class TimeSeriesData(BaseData):
 
             JsonWriter.write(join_filepath([self.json_path, f"{str(cell_i)}.json"]), df)
 
+        # multi-resolution summary for the decimated plot data
+        TimeSeriesDecimator.save_summary(
+            self.json_path,
+            self.index,
+            self.data,
+            self.cell_numbers,
+            np.asarray(self.std) if self.std is not None else None,
+        )
+
     @property
     def output_path(self) -> OutputPath:
         return OutputPath(
@@ -1,22 +1,12 @@
-import copy
-
-import numpy as np
+from studio.app.common.core.utils.image_pyramid import save_plot_thumbnail
 
 
 def create_images_list(data):
     assert len(data.shape) == 2, "data is error"
 
-    save_data = copy.deepcopy(data)
-    data = data[np.newaxis, :, :]
-    save_data = save_data[np.newaxis, :, :]
-
-    images = []
-    for _img in save_data:
-        images.append(_img.tolist())
-
-    return images
+    # Note: tolist() already returns a copy, so the array is not copied before.
+    return [data.tolist()]
 
 
 def save_thumbnail(plot_file):
-    # Note: In the barebone-studio version, it does nothing.
-    pass
+    save_plot_thumbnail(plot_file)
@@ -4,9 +4,9 @@ from typing import Dict, List, ValuesView
 from fastapi import APIRouter
 
 from studio.app.common.core.snakemake.smk_utils import SmkInternalUtils
+from studio.app.common.core.wrapper_registry import WrapperRegistry
 from studio.app.common.schemas.algolist import Algo, AlgoList, Arg, Return
 from studio.app.const import NOT_DISPLAY_ARGS_LIST
-from studio.app.wrappers import wrapper_dict
 
 router = APIRouter()
 
@@ -22,7 +22,7 @@ class NestDictGetter:
                     value, cls._parent_key(parent_key, key)
                 )
             else:
-                sig = inspect.signature(value["function"])
+                sig = WrapperRegistry.get_signature(cls._parent_key(parent_key, key))
                 returns_list = None
                 if sig.return_annotation is not inspect._empty:
                     returns_list = cls._return_list(sig.return_annotation.items())
@@ -99,4 +99,4 @@ async def get_algolist() -> Dict[str, Algo]:
         }
     """
 
-    return NestDictGetter.get_nest_dict(wrapper_dict, "")
+    return NestDictGetter.get_nest_dict(WrapperRegistry.get_wrapper_dict(), "")
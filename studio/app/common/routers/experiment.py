@@ -1,15 +1,17 @@
 import os
 from dataclasses import asdict
-from glob import glob
-from typing import Dict
+from typing import Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import FileResponse
+from fastapi_pagination import LimitOffsetPage
+from fastapi_pagination.iterables import paginate
 from sqlmodel import Session
 
 from studio.app.common.core.auth.auth_dependencies import get_user_remote_bucket_name
 from studio.app.common.core.experiment.experiment import ExptConfig, ExptExtConfig
-from studio.app.common.core.experiment.experiment_reader import ExptConfigReader
+from studio.app.common.core.experiment.experiment_index import ExptConfigIndex
 from studio.app.common.core.experiment.experiment_services import ExperimentService
 from studio.app.common.core.experiment.experiment_writer import ExptDataWriter
 from studio.app.common.core.logger import AppLogger
@@ -26,6 +28,7 @@ from studio.app.common.core.workspace.workspace_dependencies import (
     is_workspace_owner,
 )
 from studio.app.common.db.database import get_db
+from studio.app.common.schemas.base import SortDirection, SortOptions
 from studio.app.common.schemas.experiment import CopyItem, DeleteItem, RenameItem
 
 router = APIRouter(prefix="/experiments", tags=["experiments"])
@@ -33,6 +36,53 @@ router = APIRouter(prefix="/experiments", tags=["experiments"])
 logger = AppLogger.get_logger()
 
 
+def _create_ext_config(
+    workspace_id: str, config: ExptConfig, is_remote_storage_available: bool
+) -> ExptExtConfig:
+    # NOTE: Include procs in the function and respond
+    #   (for display on the frontend Record screen)
+    if config.procs:
+        config.function.update(config.procs)
+
+    # extend config to ExptExtConfig
+    config = ExptExtConfig(**asdict(config))
+
+    # Operate remote storage.
+    if is_remote_storage_available:
+        # check remote synced status.
+        config.is_remote_synced = RemoteSyncStatusFileUtil.check_sync_status_success(
+            workspace_id, config.unique_id
+        )
+    else:
+        # Always flag as synchronized if remote storage is unused.
+        config.is_remote_synced = True
+
+    return config
+
+
+async def _get_experiment_index(
+    workspace_id: str, remote_bucket_name: str
+) -> ExptConfigIndex:
+    expt_index = ExptConfigIndex(workspace_id).refresh()
+
+    # NOTE: If remote_storage is available and no experiment exists,
+    # assume that data may exist in remote_storage and execute download of metadata.
+    if RemoteStorageController.is_available() and not expt_index.search(
+        valid_only=False
+    ):
+        async with RemoteStorageSimpleReader(
+            remote_bucket_name
+        ) as remote_storage_controller:
+            await remote_storage_controller.download_all_experiments_metas(
+                [workspace_id]
+            )
+
+        # search EXPERIMENT_YMLs, again
+        expt_index.refresh()
+
+    return expt_index
+
+
 @router.get(
     "/{workspace_id}",
     response_model=Dict[str, ExptExtConfig],
@@ -42,59 +92,60 @@ async def get_experiments(
     workspace_id: str,
     remote_bucket_name: str = Depends(get_user_remote_bucket_name),
 ):
-    # search EXPERIMENT_YMLs
-    exp_config = {}
-    config_paths = glob(ExptConfigReader.get_config_yaml_wild_path(workspace_id))
-
+    expt_index = await _get_experiment_index(workspace_id, remote_bucket_name)
     is_remote_storage_available = RemoteStorageController.is_available()
 
-    # NOTE: If remote_storage is available and config_paths does not exist,
-    # assume that data may exist in remote_storage and execute download of metadata.
-    if is_remote_storage_available and not config_paths:
-        async with RemoteStorageSimpleReader(
-            remote_bucket_name
-        ) as remote_storage_controller:
-            await remote_storage_controller.download_all_experiments_metas(
-                [workspace_id]
-            )
+    return {
+        unique_id: _create_ext_config(workspace_id, config, is_remote_storage_available)
+        for unique_id, config in expt_index.get_configs().items()
+    }
 
-        # search EXPERIMENT_YMLs, again
-        exp_config = {}
-        config_paths = glob(ExptConfigReader.get_config_yaml_wild_path(workspace_id))
-
-    for path in config_paths:
-        try:
-            config = ExptConfigReader.read_from_path(path)
-
-            # NOTE: Include procs in the function and respond
-            #   (for display on the frontend Record screen)
-            if config.procs:
-                config.function.update(config.procs)
-
-            # Operate remote storage.
-            if is_remote_storage_available:
-                # check remote synced status.
-                is_remote_synced = RemoteSyncStatusFileUtil.check_sync_status_success(
-                    workspace_id, config.unique_id
-                )
-
-                # extend config to ExptExtConfig
-                config = ExptExtConfig(**asdict(config))
-                config.is_remote_synced = is_remote_synced
-            else:
-                # extend config to ExptExtConfig
-                # Always flag as synchronized if remote storage is unused.
-                config = ExptExtConfig(**asdict(config))
-                config.is_remote_synced = True
-
-            if ExptConfigReader.validate_experiment_config(config):
-                exp_config[config.unique_id] = config
-
-        except Exception as e:
-            logger.error(e, exc_info=True)
-            pass
-
-    return exp_config
+
+@router.get(
+    "/page/{workspace_id}",
+    response_model=LimitOffsetPage[ExptExtConfig],
+    dependencies=[Depends(is_workspace_available)],
+    description="""
+- list experiments, paged and sorted on the server
+- sort: started_at (default, newest first), finished_at, name, unique_id or success
+- name: partial match filter, success: status filter (eg. "success", "error")
+""",
+)
+async def get_experiments_page(
+    workspace_id: str,
+    name: Optional[str] = None,
+    success: Optional[str] = None,
+    sortOptions: SortOptions = Depends(),
+    remote_bucket_name: str = Depends(get_user_remote_bucket_name),
+):
+    expt_index = await _get_experiment_index(workspace_id, remote_bucket_name)
+    is_remote_storage_available = RemoteStorageController.is_available()
+
+    # Note: sorted by the newest experiments unless the sort column is given.
+    sort_field, sort_direction = sortOptions.sort[:2]
+    try:
+        unique_ids = expt_index.search(
+            name=name,
+            success=success,
+            sort_field=sort_field or "started_at",
+            desc=sort_field is None or sort_direction == SortDirection.desc,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # Note: only the experiments of the page are built as response.
+    # Note: returned encoded, as the page model (pydantic) of the dataclass items
+    #   is not re-validated by the response_model as is.
+    return jsonable_encoder(
+        paginate(
+            unique_ids,
+            total=len(unique_ids),
+            transformer=lambda page_ids: [
+                _create_ext_config(workspace_id, config, is_remote_storage_available)
+                for config in expt_index.get_configs(page_ids).values()
+            ],
+        )
+    )
 
 
 @router.patch(
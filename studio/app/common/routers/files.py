@@ -1,20 +1,18 @@
 import json
 import os
 import shutil
-from glob import glob
 from pathlib import PurePath
-from typing import Dict, List
+from typing import List
 from urllib.parse import urlparse
 
 import requests
 import tifffile
 from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile
-from requests.models import Response
 from sqlmodel import Session
-from tqdm import tqdm
 
 from studio.app.common.core.auth.auth_dependencies import get_user_remote_bucket_name
 from studio.app.common.core.logger import AppLogger
+from studio.app.common.core.metrics import Counter
 from studio.app.common.core.storage.remote_storage_controller import (
     RemoteStorageController,
     RemoteStorageSimpleWriter,
@@ -24,6 +22,10 @@ from studio.app.common.core.utils.filepath_creater import (
     create_directory,
     join_filepath,
 )
+from studio.app.common.core.workspace.workspace_chunked_upload import (
+    ChunkedUploadOffsetError,
+    WorkspaceChunkedUpload,
+)
 from studio.app.common.core.workspace.workspace_data_capacity_services import (
     WorkspaceDataCapacityService,
 )
@@ -31,8 +33,11 @@ from studio.app.common.core.workspace.workspace_dependencies import (
     is_workspace_available,
     is_workspace_owner,
 )
-from studio.app.common.db.database import get_db
+from studio.app.common.core.workspace.workspace_file_index import WorkspaceFileIndex
+from studio.app.common.core.workspace.workspace_url_download import WorkspaceUrlDownload
+from studio.app.common.db.database import get_db, session_scope
 from studio.app.common.schemas.files import (
+    ChunkedUploadStatus,
     DownloadFileRequest,
     DownloadStatus,
     FilePath,
@@ -45,78 +50,91 @@ router = APIRouter(prefix="/files", tags=["files"])
 
 logger = AppLogger.get_logger()
 
+FILE_UPLOAD_BYTES = Counter(
+    "optinist_file_upload_bytes_total",
+    "Bytes of the input files uploaded to the workspaces.",
+    ["method"],
+)
+
 
 class DirTreeGetter:
     @classmethod
     def get_tree(
-        cls, workspace_id, file_types: List[str], dirname: str = None
+        cls,
+        workspace_id,
+        file_types: List[str],
+        dirname: str = None,
+        recursive: bool = True,
+        file_index: WorkspaceFileIndex = None,
     ) -> List[TreeNode]:
+        """
+        Build the tree from the workspace file index.
+        *If recursive is False, only the nodes directly under dirname are returned
+          (sub-directory nodes are returned with empty nodes).
+        """
         nodes: List[TreeNode] = []
 
-        if dirname is None:
-            absolute_dirpath = join_filepath([DIRPATH.INPUT_DIR, workspace_id])
-        else:
-            absolute_dirpath = join_filepath([DIRPATH.INPUT_DIR, workspace_id, dirname])
+        is_root_call = file_index is None
+        if is_root_call:
+            file_index = WorkspaceFileIndex(workspace_id)
 
-        if not os.path.exists(absolute_dirpath):
+        entry = file_index.list_dir(dirname)
+        if entry is None:
             return nodes
 
-        sorted_listdir = sorted(
-            os.listdir(absolute_dirpath),
-            key=lambda x: (not os.path.isdir(join_filepath([absolute_dirpath, x])), x),
-        )
-
         IMAGE_SHAPE_DICT = (
             get_image_shape_dict(workspace_id)
             if file_types == ACCEPT_FILE_EXT.TIFF_EXT.value
             else {}
         )
 
-        for node_name in sorted_listdir:
-            if dirname is None:
-                relative_path = node_name
-            else:
-                relative_path = join_filepath([dirname, node_name])
-
-            search_dirpath = join_filepath([absolute_dirpath, node_name])
-
-            if os.path.isfile(search_dirpath) and node_name.endswith(tuple(file_types)):
-                shape = IMAGE_SHAPE_DICT.get(relative_path, {}).get("shape")
-                if shape is None and file_types == ACCEPT_FILE_EXT.TIFF_EXT.value:
-                    shape = update_image_shape(workspace_id, relative_path)
-                nodes.append(
-                    TreeNode(
-                        path=relative_path,
-                        name=node_name,
-                        isdir=False,
-                        nodes=[],
-                        shape=shape,
-                    )
-                )
-            elif (
-                os.path.isdir(search_dirpath)
-                and len(cls.accept_files(search_dirpath, file_types)) > 0
-            ):
+        for node_name in entry["dirs"]:
+            relative_path = (
+                node_name if dirname is None else join_filepath([dirname, node_name])
+            )
+            if file_index.has_files(relative_path, file_types):
                 nodes.append(
                     TreeNode(
                         path=node_name,
                         name=node_name,
                         isdir=True,
-                        nodes=cls.get_tree(workspace_id, file_types, relative_path),
+                        nodes=(
+                            cls.get_tree(
+                                workspace_id,
+                                file_types,
+                                relative_path,
+                                file_index=file_index,
+                            )
+                            if recursive
+                            else []
+                        ),
                     )
                 )
 
-        return nodes
+        for node_name in entry["files"]:
+            if not node_name.endswith(tuple(file_types)):
+                continue
 
-    @classmethod
-    def accept_files(cls, path: str, file_types: List[str]):
-        files_list = []
-        for file_type in file_types:
-            files_list.extend(
-                glob(join_filepath([path, "**", f"*{file_type}"]), recursive=True)
+            relative_path = (
+                node_name if dirname is None else join_filepath([dirname, node_name])
+            )
+            shape = IMAGE_SHAPE_DICT.get(relative_path, {}).get("shape")
+            if shape is None and file_types == ACCEPT_FILE_EXT.TIFF_EXT.value:
+                shape = update_image_shape(workspace_id, relative_path)
+            nodes.append(
+                TreeNode(
+                    path=relative_path,
+                    name=node_name,
+                    isdir=False,
+                    nodes=[],
+                    shape=shape,
+                )
             )
 
-        return files_list
+        if is_root_call:
+            file_index.save()
+
+        return nodes
 
 
 def get_image_shape_dict(workspace_id):
@@ -158,22 +176,30 @@ def update_image_shape(workspace_id, relative_file_path):
     response_model=List[TreeNode],
     dependencies=[Depends(is_workspace_available)],
 )
-async def get_files(workspace_id: str, file_type: str = None):
+async def get_files(
+    workspace_id: str,
+    file_type: str = None,
+    dirname: str = None,
+    recursive: bool = True,
+):
     if file_type == FILETYPE.IMAGE:
-        return DirTreeGetter.get_tree(workspace_id, ACCEPT_FILE_EXT.TIFF_EXT.value)
+        file_types = ACCEPT_FILE_EXT.TIFF_EXT.value
     elif file_type == FILETYPE.CSV:
-        return DirTreeGetter.get_tree(workspace_id, ACCEPT_FILE_EXT.CSV_EXT.value)
+        file_types = ACCEPT_FILE_EXT.CSV_EXT.value
     elif file_type == FILETYPE.HDF5:
-        return DirTreeGetter.get_tree(workspace_id, ACCEPT_FILE_EXT.HDF5_EXT.value)
+        file_types = ACCEPT_FILE_EXT.HDF5_EXT.value
     elif file_type == FILETYPE.MICROSCOPE:
-        return DirTreeGetter.get_tree(
-            workspace_id, ACCEPT_FILE_EXT.MICROSCOPE_EXT.value
-        )
+        file_types = ACCEPT_FILE_EXT.MICROSCOPE_EXT.value
     elif file_type == FILETYPE.MATLAB:
-        return DirTreeGetter.get_tree(workspace_id, ACCEPT_FILE_EXT.MATLAB_EXT.value)
+        file_types = ACCEPT_FILE_EXT.MATLAB_EXT.value
     else:
         return []
 
+    try:
+        return DirTreeGetter.get_tree(workspace_id, file_types, dirname, recursive)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 
 @router.post(
     "/{workspace_id}/shape/{filepath}",
@@ -207,7 +233,9 @@ async def create_file(
 
     with open(filepath, "wb") as f:
         shutil.copyfileobj(file.file, f)
+        FILE_UPLOAD_BYTES.inc(f.tell(), method="file")
 
+    WorkspaceFileIndex(workspace_id).update_file(filename)
     update_image_shape(workspace_id, filename)
 
     if WorkspaceDataCapacityService.is_available():
@@ -226,7 +254,76 @@ async def create_file(
     return {"file_path": filename}
 
 
-DOWNLOAD_STATUS: Dict[str, DownloadStatus] = {}
+@router.get(
+    "/{workspace_id}/upload/{filename}/status",
+    response_model=ChunkedUploadStatus,
+    dependencies=[Depends(is_workspace_owner)],
+)
+async def get_chunked_upload_status(
+    workspace_id: str,
+    filename: str,
+    remote_bucket_name: str = Depends(get_user_remote_bucket_name),
+):
+    return WorkspaceChunkedUpload(workspace_id, filename, remote_bucket_name).status
+
+
+@router.post(
+    "/{workspace_id}/upload/{filename}/chunk",
+    response_model=ChunkedUploadStatus,
+    dependencies=[Depends(is_workspace_owner)],
+)
+async def create_file_chunk(
+    workspace_id: str,
+    filename: str,
+    offset: int,
+    total: int,
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    remote_bucket_name: str = Depends(get_user_remote_bucket_name),
+):
+    """
+    Resumable upload: the file is sent as sequential chunks,
+      starting from the offset returned by the upload status.
+    """
+    create_directory(join_filepath([DIRPATH.INPUT_DIR, workspace_id]))
+
+    upload = WorkspaceChunkedUpload(workspace_id, filename, remote_bucket_name)
+    try:
+        data = await file.read()
+        status = await upload.write_chunk(offset, total, data)
+    except ChunkedUploadOffsetError as e:
+        raise HTTPException(status_code=409, detail=upload.status) from e
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    FILE_UPLOAD_BYTES.inc(len(data), method="chunk")
+
+    if status["completed"]:
+        WorkspaceFileIndex(workspace_id).update_file(filename)
+        update_image_shape(workspace_id, filename)
+
+        if WorkspaceDataCapacityService.is_available():
+            background_tasks.add_task(
+                WorkspaceDataCapacityService.update_workspace_data_usage,
+                db,
+                workspace_id,
+            )
+
+    return status
+
+
+@router.delete(
+    "/{workspace_id}/upload/{filename}",
+    response_model=bool,
+    dependencies=[Depends(is_workspace_owner)],
+)
+async def abort_chunked_upload(
+    workspace_id: str,
+    filename: str,
+    remote_bucket_name: str = Depends(get_user_remote_bucket_name),
+):
+    await WorkspaceChunkedUpload(workspace_id, filename, remote_bucket_name).abort()
+    return True
 
 
 @router.delete(
@@ -245,6 +342,7 @@ async def delete_file(
         raise HTTPException(status_code=404, detail="File not found.")
     try:
         os.remove(filepath)
+        WorkspaceFileIndex(workspace_id).update_file(filename)
 
         if WorkspaceDataCapacityService.is_available():
             background_tasks.add_task(
@@ -265,11 +363,12 @@ async def delete_file(
     dependencies=[Depends(is_workspace_available)],
 )
 async def get_download_status(workspace_id: str, file_name: str):
-    filepath = join_filepath([DIRPATH.INPUT_DIR, workspace_id, file_name])
-    try:
-        return DOWNLOAD_STATUS[filepath]
-    except:  # noqa
+    # Note: the status is read from the shared status file,
+    #   as the download may run in another worker process.
+    status = WorkspaceUrlDownload(workspace_id, file_name).status
+    if status is None:
         raise HTTPException(status_code=404)
+    return DownloadStatus(**status)
 
 
 @router.post(
@@ -279,8 +378,6 @@ async def get_download_status(workspace_id: str, file_name: str):
 async def download_file(
     workspace_id: str,
     file: DownloadFileRequest,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
 ):
     path = PurePath(urlparse(file.url).path)
     if path.suffix not in ACCEPT_FILE_EXT.ALL_EXT.value:
@@ -289,37 +386,23 @@ async def download_file(
     create_directory(join_filepath([DIRPATH.INPUT_DIR, workspace_id]))
 
     try:
-        res = requests.get(file.url, stream=True)
+        res = requests.get(
+            file.url, stream=True, headers=WorkspaceUrlDownload.REQUEST_HEADERS
+        )
         res.raise_for_status()
     except Exception as e:
         raise HTTPException(status_code=422, detail=str(e))
-    background_tasks.add_task(download, db, res, path.name, workspace_id)
-    background_tasks.add_task(update_image_shape, workspace_id, path.name)
-    return {"file_name": path.name}
 
+    WorkspaceUrlDownload(workspace_id, path.name).submit(
+        res, on_complete=lambda: on_download_complete(workspace_id, path.name)
+    )
+    return {"file_name": path.name}
 
-def download(
-    db: Session, res: Response, file_name: str, workspace_id: str, chunk_size=1024
-):
-    total = int(res.headers.get("content-length", 0))
-    filepath = join_filepath([DIRPATH.INPUT_DIR, workspace_id, file_name])
-    current = 0
 
-    try:
-        with open(filepath, "wb") as file, tqdm(
-            desc=filepath,
-            total=total,
-            unit="iB",
-            unit_scale=True,
-            unit_divisor=1024,
-        ) as bar:
-            for data in res.iter_content(chunk_size=chunk_size):
-                size = file.write(data)
-                current += size
-                DOWNLOAD_STATUS[filepath] = DownloadStatus(total=total, current=current)
-                bar.update(size)
-    except Exception as e:
-        DOWNLOAD_STATUS[filepath] = DownloadStatus(error=str(e))
+def on_download_complete(workspace_id: str, file_name: str):
+    WorkspaceFileIndex(workspace_id).update_file(file_name)
+    update_image_shape(workspace_id, file_name)
 
     if WorkspaceDataCapacityService.is_available():
-        WorkspaceDataCapacityService.update_workspace_data_usage(db, workspace_id)
+        with session_scope() as db:
+            WorkspaceDataCapacityService.update_workspace_data_usage(db, workspace_id)
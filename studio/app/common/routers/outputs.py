@@ -2,21 +2,35 @@ import os
 from glob import glob
 from typing import Optional
 
+import numpy as np
 import pandas as pd
-from fastapi import APIRouter
+import tifffile
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
 
+from studio.app.common.core.metrics import Histogram
+from studio.app.common.core.utils.csv_cache import CsvCache
 from studio.app.common.core.utils.file_reader import JsonReader, Reader
-from studio.app.common.core.utils.filepath_creater import (
-    create_directory,
-    join_filepath,
+from studio.app.common.core.utils.filepath_creater import join_filepath
+from studio.app.common.core.utils.image_pyramid import (
+    get_pyramid_level,
+    get_thumbnail_path,
+    select_image_pyramid_level,
 )
-from studio.app.common.core.utils.json_writer import JsonWriter, save_tiff2json
+from studio.app.common.core.utils.json_writer import get_tiff2json_path, save_tiff2json
+from studio.app.common.core.utils.timeseries_decimator import TimeSeriesDecimator
 from studio.app.common.schemas.outputs import JsonTimeSeriesData, OutputData
 from studio.app.const import ACCEPT_FILE_EXT, ORIGINAL_DATA_EXT
 from studio.app.dir_path import DIRPATH
 
 router = APIRouter(prefix="/outputs", tags=["outputs"])
 
+OUTPUT_CONVERSION_DURATION = Histogram(
+    "optinist_output_conversion_seconds",
+    "Duration of the conversions of the data files for the viewers.",
+    ["kind"],
+)
+
 
 def get_initial_timeseries_data(dirpath) -> JsonTimeSeriesData:
     plot_meta_path = f"{dirpath}.plot-meta.json"
@@ -30,6 +44,58 @@ def get_initial_timeseries_data(dirpath) -> JsonTimeSeriesData:
     )
 
 
+def get_timeseries_summary(dirpath):
+    """
+    Returns the summary saved with the timeseries,
+      or builds (and saves) it from the json files (outputs saved without summary).
+    """
+    summary = TimeSeriesDecimator.load_summary(dirpath)
+    if summary is not None:
+        return summary
+
+    paths = glob(join_filepath([dirpath, "*.json"]))
+    cell_numbers = [os.path.splitext(os.path.basename(x))[0] for x in paths]
+    json_datas = [JsonReader.read_as_timeseries(x) for x in paths]
+    if not json_datas:
+        return None
+
+    data = np.array([list(x.data.values()) for x in json_datas], dtype=float)
+    std = (
+        np.array([list(x.std.values()) for x in json_datas], dtype=float)
+        if json_datas[0].std is not None
+        else None
+    )
+
+    # Note: saved once, so that the next requests do not read all the json files.
+    return TimeSeriesDecimator.save_summary(
+        dirpath,
+        pd.to_numeric(pd.Index(json_datas[0].xrange)).values,
+        data,
+        cell_numbers,
+        std,
+    )
+
+
+def get_decimated_timeseries_data(
+    dirpath, n_points, cell_numbers=None, xmin=None, xmax=None
+) -> JsonTimeSeriesData:
+    return_data = get_initial_timeseries_data(dirpath)
+
+    summary = get_timeseries_summary(dirpath)
+    if summary is None:
+        return return_data
+
+    decimated = TimeSeriesDecimator.decimate(
+        summary, n_points, cell_numbers, xmin, xmax
+    )
+    return_data.data = decimated["data"]
+    if decimated["std"] is not None:
+        return_data.std = decimated["std"]
+    return_data.xrange = decimated["xrange"]
+
+    return return_data
+
+
 @router.get("/inittimedata/{dirpath:path}", response_model=JsonTimeSeriesData)
 async def get_inittimedata(
     dirpath: str,
@@ -89,11 +155,21 @@ async def get_timedata(
     dirpath: str,
     index: int,
     isFull: Optional[bool] = None,
+    n_points: Optional[int] = None,
+    xmin: Optional[float] = None,
+    xmax: Optional[float] = None,
 ):
+    """
+    If n_points is specified, the series (within [xmin, xmax])
+      is returned decimated to about n_points (min/max of each bucket).
+    """
     full_json_dirpath = dirpath + ORIGINAL_DATA_EXT
     if isFull and os.path.exists(full_json_dirpath):
         dirpath = full_json_dirpath
 
+    if n_points is not None:
+        return get_decimated_timeseries_data(dirpath, n_points, [index], xmin, xmax)
+
     json_data = JsonReader.read_as_timeseries(
         join_filepath([dirpath, f"{str(index)}.json"])
     )
@@ -109,7 +185,15 @@ async def get_timedata(
 
 
 @router.get("/alltimedata/{dirpath:path}", response_model=JsonTimeSeriesData)
-async def get_alltimedata(dirpath: str):
+async def get_alltimedata(
+    dirpath: str,
+    n_points: Optional[int] = None,
+    xmin: Optional[float] = None,
+    xmax: Optional[float] = None,
+):
+    if n_points is not None:
+        return get_decimated_timeseries_data(dirpath, n_points, None, xmin, xmax)
+
     return_data = get_initial_timeseries_data(dirpath)
 
     for i, path in enumerate(glob(join_filepath([dirpath, "*.json"]))):
@@ -142,7 +226,12 @@ async def get_image(
     start_index: Optional[int] = 0,
     end_index: Optional[int] = 10,
     isFull: Optional[bool] = None,
+    max_size: Optional[int] = None,
 ):
+    """
+    If max_size (viewport size in pixels) is specified, the image is returned
+      from the coarsest downsampled level still covering max_size.
+    """
     filename, ext = os.path.splitext(os.path.basename(filepath))
 
     if filename == "cell_roi" and isFull:
@@ -160,25 +249,70 @@ async def get_image(
                 filename,
             ]
         )
-        json_filepath = join_filepath(
-            [save_dirpath, f"{filename}_{str(start_index)}_{str(end_index)}.json"]
+        level = 0
+        if max_size:
+            with tifffile.TiffFile(filepath) as tif:
+                shape = tif.pages[0].shape
+            if len(shape) == 2:
+                level = get_pyramid_level(shape, max_size)
+
+        json_filepath = get_tiff2json_path(
+            save_dirpath, filename, start_index, end_index, level
         )
         if not os.path.exists(json_filepath):
-            save_tiff2json(filepath, save_dirpath, start_index, end_index)
+            with OUTPUT_CONVERSION_DURATION.time(kind="tiff2json"):
+                save_tiff2json(filepath, save_dirpath, start_index, end_index, level)
     else:
-        json_filepath = filepath
+        json_filepath = select_image_pyramid_level(filepath, max_size)
 
     return JsonReader.read_as_output(json_filepath)
 
 
+@router.get("/thumbnail/{filepath:path}")
+async def get_thumbnail(filepath: str):
+    thumbnail_path = get_thumbnail_path(filepath)
+    if not os.path.exists(thumbnail_path):
+        raise HTTPException(status_code=404, detail="Thumbnail not found.")
+
+    return FileResponse(thumbnail_path, media_type="image/png")
+
+
 @router.get("/csv/{filepath:path}", response_model=OutputData)
-async def get_csv(filepath: str, workspace_id: str):
+async def get_csv(
+    filepath: str,
+    workspace_id: str,
+    start_row: Optional[int] = None,
+    end_row: Optional[int] = None,
+    start_column: Optional[int] = None,
+    end_column: Optional[int] = None,
+    transpose: bool = False,
+):
+    """
+    Returns the rows [start_row, end_row) and columns [start_column, end_column)
+      of the csv (of the transposed table if transpose), the whole table by default.
+    The parsed csv is cached (CsvCache), and the ranges are read from the cache.
+    """
     filepath = join_filepath([DIRPATH.INPUT_DIR, workspace_id, filepath])
+    if not os.path.isfile(filepath):
+        raise HTTPException(status_code=404, detail="File not found.")
 
     filename, _ = os.path.splitext(os.path.basename(filepath))
     save_dirpath = join_filepath([os.path.dirname(filepath), filename])
-    create_directory(save_dirpath)
-    json_filepath = join_filepath([save_dirpath, f"{filename}.json"])
 
-    JsonWriter.write_as_split(json_filepath, pd.read_csv(filepath, header=None))
-    return JsonReader.read_as_output(json_filepath)
+    if CsvCache.is_cached(filepath, save_dirpath):
+        table = CsvCache.read(filepath, save_dirpath)
+    else:
+        with OUTPUT_CONVERSION_DURATION.time(kind="csv2cache"):
+            table = CsvCache.read(filepath, save_dirpath)
+
+    rows, columns = slice(start_row, end_row), slice(start_column, end_column)
+    n_rows, n_columns = table.shape[::-1] if transpose else table.shape
+
+    return OutputData(
+        data=table.get_values(rows, columns, transpose),
+        columns=list(range(n_columns)[columns]),
+        index=list(range(n_rows)[rows]),
+        meta=JsonReader.read_as_plot_meta(
+            join_filepath([save_dirpath, f"{filename}.plot-meta.json"])
+        ),
+    )
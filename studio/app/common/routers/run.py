@@ -1,8 +1,14 @@
+import json
 from typing import Dict, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 
-from studio.app.common.core.auth.auth_dependencies import get_user_remote_bucket_name
+from studio.app.common.core.auth.auth_dependencies import (
+    get_current_user,
+    get_user_remote_bucket_name,
+)
 from studio.app.common.core.logger import AppLogger
 from studio.app.common.core.storage.remote_storage_controller import (
     RemoteStorageLockError,
@@ -19,6 +25,8 @@ from studio.app.common.core.workflow.workflow_result import (
     WorkflowResult,
 )
 from studio.app.common.core.workflow.workflow_runner import WorkflowRunner
+from studio.app.common.core.workflow.workflow_scheduler import WorkflowScheduler
+from studio.app.common.core.workflow.workflow_status_stream import WorkflowStatusStream
 from studio.app.common.core.workspace.workspace_data_capacity_services import (
     WorkspaceDataCapacityService,
 )
@@ -26,6 +34,8 @@ from studio.app.common.core.workspace.workspace_dependencies import (
     is_workspace_available,
     is_workspace_owner,
 )
+from studio.app.common.schemas.users import User
+from studio.app.common.schemas.workflow import WorkflowQueueStatus
 
 router = APIRouter(prefix="/run", tags=["run"])
 
@@ -40,14 +50,14 @@ logger = AppLogger.get_logger()
 async def run(
     workspace_id: str,
     runItem: RunItem,
-    background_tasks: BackgroundTasks,
     remote_bucket_name: str = Depends(get_user_remote_bucket_name),
+    current_user: User = Depends(get_current_user),
 ):
     try:
         unique_id = WorkflowRunner.create_workflow_unique_id()
         WorkflowRunner(
             remote_bucket_name, workspace_id, unique_id, runItem
-        ).run_workflow(background_tasks)
+        ).run_workflow(current_user.id if current_user else None)
 
         logger.info("run snakemake")
 
@@ -83,12 +93,12 @@ async def run_id(
     workspace_id: str,
     uid: str,
     runItem: RunItem,
-    background_tasks: BackgroundTasks,
     remote_bucket_name: str = Depends(get_user_remote_bucket_name),
+    current_user: User = Depends(get_current_user),
 ):
     try:
         WorkflowRunner(remote_bucket_name, workspace_id, uid, runItem).run_workflow(
-            background_tasks
+            current_user.id if current_user else None
         )
 
         logger.info("run snakemake")
@@ -152,6 +162,43 @@ async def run_result(
         )
 
 
+@router.get(
+    "/events/{workspace_id}/{uid}",
+    dependencies=[Depends(is_workspace_available)],
+)
+async def run_events(workspace_id: str, uid: str):
+    """
+    Server-Sent Events of node status transitions ({node_id: Message}).
+    *`/run/result` polling remains available as a fallback.
+    """
+
+    async def event_stream():
+        async for messages in WorkflowStatusStream.subscribe(workspace_id, uid):
+            yield f"event: status\ndata: {json.dumps(jsonable_encoder(messages))}\n\n"
+        yield "event: end\ndata: {}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(
+    "/queue/{workspace_id}/{uid}",
+    response_model=WorkflowQueueStatus,
+    dependencies=[Depends(is_workspace_available)],
+)
+async def run_queue_status(workspace_id: str, uid: str):
+    queue_status = WorkflowScheduler.get_status(workspace_id, uid)
+    if queue_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Workflow is not scheduled.",
+        )
+    return queue_status
+
+
 @router.post(
     "/cancel/{workspace_id}/{uid}",
     response_model=bool,
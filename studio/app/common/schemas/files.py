@@ -29,3 +29,11 @@ class DownloadStatus:
     total: int = 0
     current: int = 0
     error: Optional[str] = None
+
+
+@dataclass
+class ChunkedUploadStatus:
+    file_path: str
+    total: int = 0
+    offset: int = 0
+    completed: bool = False
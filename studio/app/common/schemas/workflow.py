@@ -57,3 +57,11 @@ class WorkflowProcessInfo:
 class WorkflowErrorInfo:
     has_error: bool
     error_log: str
+
+
+@dataclass
+class WorkflowQueueStatus:
+    status: str  # "queued" or "running"
+    position: int  # 1-based position in the queue (0 while running)
+    cores: int
+    memory_mb: int
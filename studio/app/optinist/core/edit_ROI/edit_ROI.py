@@ -301,11 +301,7 @@ class EditROI:
         self.__save_json(info)
         self.__update_whole_nwb(info)
 
-        (
-            os.remove(self.tmp_pickle_file_path)
-            if os.path.exists(self.tmp_pickle_file_path)
-            else None
-        )
+        PickleWriter.remove(self.tmp_pickle_file_path)
 
         # Operate remote storage data.
         if RemoteStorageController.is_available():
@@ -357,11 +353,7 @@ class EditROI:
             ),
         }
         self.__save_json(info)
-        (
-            os.remove(self.tmp_pickle_file_path)
-            if os.path.exists(self.tmp_pickle_file_path)
-            else None
-        )
+        PickleWriter.remove(self.tmp_pickle_file_path)
 
     def __update_whole_nwb(self, output_info):
         smk_config = SmkConfigReader.read(
@@ -2,7 +2,6 @@ import os
 import time
 from typing import List, Union
 
-from filelock import FileLock
 from pynwb.spec import NWBGroupSpec, NWBNamespaceBuilder
 
 from studio.app.common.core.utils.filelock_handler import FileLockUtils
@@ -37,8 +36,7 @@ def export_spec_files(
     # Note:
     # Considering calls from multi-process exclusive processing
     # is performed (using FileLock)
-    lock_path = FileLockUtils.get_lockfile_path(ns_path)
-    with FileLock(lock_path, timeout=10):
+    with FileLockUtils.lock(ns_path, timeout=10, name="nwb_namespace"):
         flle_update_elapsed_time = (
             (time.time() - os.path.getmtime(ns_path)) if os.path.exists(ns_path) else 0
         )
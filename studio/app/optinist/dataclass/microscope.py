@@ -1,5 +1,10 @@
+import json
 import os
 
+from studio.app.common.core.utils.filepath_creater import (
+    create_directory,
+    join_filepath,
+)
 from studio.app.common.dataclass.base import BaseData
 from studio.app.optinist.microscopes.IsxdReader import IsxdReader
 from studio.app.optinist.microscopes.ND2Reader import ND2Reader
@@ -8,13 +13,31 @@ from studio.app.optinist.microscopes.ThorlabsReader import ThorlabsReader
 
 
 class MicroscopeData(BaseData):
+    OME_METADATA_DIRNAME = ".ome_metadata"
+
     def __init__(self, path: str, file_name="microscope"):
         super().__init__(file_name)
         self.path = path
         self.json_path = None
+        self._reader = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+
+        # Note: the loaded reader holds library handles, which are not picklable.
+        state["_reader"] = None
+
+        return state
 
     @property
     def reader(self):
+        """
+        Reader loaded from the microscope file.
+        *The file is loaded only once per instance, and the reader is reused.
+        """
+        if getattr(self, "_reader", None) is not None:
+            return self._reader
+
         ext = os.path.splitext(self.path)[1]
         if ext == ".nd2":
             reader = ND2Reader()
@@ -30,7 +53,52 @@ class MicroscopeData(BaseData):
             raise Exception(f"Unsupported file type: {ext}")
 
         reader.load(self.path)
+        self._reader = reader
+
         return reader
 
+    @property
+    def ome_metadata_path(self) -> str:
+        # Note: the cache is kept in a hidden directory beside the file,
+        #   which is not listed in the file tree.
+        return join_filepath(
+            [
+                os.path.dirname(self.path),
+                self.OME_METADATA_DIRNAME,
+                f"{os.path.basename(self.path)}.json",
+            ]
+        )
+
+    @property
+    def ome_metadata(self) -> dict:
+        """
+        OME metadata values of the microscope file.
+        *Cached on disk (keyed by the mtime and size of the file),
+          so that the file is not loaded only to read the metadata.
+        """
+        stat = os.stat(self.path)
+        key = {"mtime": stat.st_mtime_ns, "size": stat.st_size}
+
+        cache_path = self.ome_metadata_path
+        try:
+            with open(cache_path) as f:
+                cache = json.load(f)
+            if cache["key"] == key:
+                return cache["ome_metadata"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            pass
+
+        ome_metadata = self.reader.ome_metadata.get_ome_values()
+
+        # Note: write to a temporary file and replace,
+        #   so that readers never see a partially written cache.
+        create_directory(os.path.dirname(cache_path))
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"key": key, "ome_metadata": ome_metadata}, f, indent=4)
+        os.replace(tmp_path, cache_path)
+
+        return ome_metadata
+
     def set_data(self, data):
         self.data = data
@@ -1,4 +1,5 @@
 import gc
+import os
 from typing import Dict, List, Optional
 
 import imageio
@@ -10,6 +11,7 @@ from studio.app.common.core.utils.filepath_creater import (
     join_filepath,
 )
 from studio.app.common.core.utils.json_writer import JsonWriter
+from studio.app.common.core.utils.memmap_handler import MemmapReader
 from studio.app.common.core.workflow.workflow import OutputPath, OutputType
 from studio.app.common.dataclass.base import BaseData
 from studio.app.common.dataclass.image import ImageData
@@ -69,6 +71,29 @@ class EditRoiData(BaseData):
         self.merge_roi = []
         self.delete_roi = []
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+
+        # Note: Images backed by a persistent memmap are pickled as a reference,
+        #   instead of serializing the whole movie into the node pickle.
+        images = state.get("images")
+        if (
+            isinstance(images, np.memmap)
+            and MemmapReader.is_memmap_file(images.filename)
+            and os.path.isfile(images.filename)
+        ):
+            state["images"] = None
+            state["images_mmap_path"] = images.filename
+
+        return state
+
+    def __setstate__(self, state):
+        mmap_path = state.pop("images_mmap_path", None)
+        if mmap_path is not None:
+            state["images"] = MemmapReader.read(mmap_path)
+
+        self.__dict__.update(state)
+
     @property
     def temp_merge_roi_list(self) -> list:
         merge_roi = [(k, *v, -1.0) for k, v in self.temp_merge_roi.items()]
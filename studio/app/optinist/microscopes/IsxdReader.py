@@ -137,34 +137,39 @@ class IsxdReader(MicroscopeDataReaderBase):
         # Note: in inscopix sdk, there is no library (ddl) release process.
         pass  # do nothing.
 
-    def _get_image_stacks(self) -> list:
+    def _get_image_stacks_shape(self) -> tuple:
         movie: isx.Movie = None
         (movie,) = self.resource_handles
 
         # Get the number of channels
         channels_count = 1  # NOTE: Fixed to '1'
 
-        # allocate return value buffer (all channel's stack)
-        # *using numpy.ndarray
-        result_channels_stacks = np.empty(
-            [
-                channels_count,
-                movie.timing.num_samples,
-                self.ome_metadata.size_y,
-                self.ome_metadata.size_x,
-            ],
-            dtype=self.ome_metadata.pixel_np_dtype,
+        return (
+            channels_count,
+            movie.timing.num_samples,
+            self.ome_metadata.size_y,
+            self.ome_metadata.size_x,
         )
 
+    def _read_image_block(self, start: int, stop: int) -> np.ndarray:
+        movie: isx.Movie = None
+        (movie,) = self.resource_handles
+
+        channels_count, _, size_y, size_x = self._get_image_stacks_shape()
+
         # get frame data's np.ndarray.dtype
         # Note: Individual support for `isx v1.0.3`
         pixel_np_dtype = self.ome_metadata.pixel_np_dtype
 
-        # loop for each channels
+        # allocate block buffer (frames in [start, stop))
+        block_channels_stacks = np.empty(
+            [channels_count, stop - start, size_y, size_x], dtype=pixel_np_dtype
+        )
+
+        # Note: isx has no API to read multiple frames at once.
         for channel_no in range(channels_count):
-            for i in range(movie.timing.num_samples):
-                single_plane_buffer = movie.get_frame_data(i).astype(pixel_np_dtype)
-                single_plane_buffer = single_plane_buffer.T  # rotate YX->XY
-                result_channels_stacks[channel_no, i] = single_plane_buffer
+            for i in range(start, stop):
+                # rotate YX->XY, and cast into the block buffer
+                block_channels_stacks[channel_no, i - start] = movie.get_frame_data(i).T
 
-        return result_channels_stacks
+        return block_channels_stacks
@@ -2,7 +2,9 @@ import os
 from abc import ABCMeta, abstractmethod
 from ctypes import c_uint8, c_uint16, c_uint32
 from dataclasses import dataclass
+from typing import Iterator, Tuple
 
+import numpy as np
 from numpy import uint8 as np_uint8
 from numpy import uint16 as np_uint16
 from numpy import uint32 as np_uint32
@@ -113,6 +115,9 @@ class OMEDataModel:
 class MicroscopeDataReaderBase(metaclass=ABCMeta):
     """Microscope data reader base class"""
 
+    # Upper bound of bytes held in memory per block by `iter_image_blocks`
+    BLOCK_BYTES = 64 * 1024**2
+
     def __init__(self):
         """
         Initialization
@@ -170,9 +175,68 @@ class MicroscopeDataReaderBase(metaclass=ABCMeta):
         """
         self._load_complete_handler()
 
-    def get_image_stacks(self) -> list:
-        """Return microscope image stacks"""
-        return self._get_image_stacks()
+    def get_image_stacks(self, output_path: str = None) -> np.ndarray:
+        """Return microscope image stacks
+
+        If output_path (.npy) is specified, the stacks are written block by block
+          into a memory-mapped file, and the memmap is returned.
+        """
+        shape = self._get_image_stacks_shape()
+        result_channels_stacks = None
+
+        for start, block in self.iter_image_blocks():
+            if result_channels_stacks is None:
+                result_channels_stacks = self.__allocate_image_stacks(
+                    shape, block.dtype, output_path
+                )
+            result_channels_stacks[:, start : start + block.shape[1]] = block
+
+        if result_channels_stacks is None:
+            result_channels_stacks = self.__allocate_image_stacks(
+                shape, self.ome_metadata.pixel_np_dtype, output_path
+            )
+        if isinstance(result_channels_stacks, np.memmap):
+            result_channels_stacks.flush()
+
+        return self._reshape_image_stacks(result_channels_stacks)
+
+    def iter_image_blocks(
+        self, block_frames: int = None
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yield (start frame, image block) for consecutive frames
+
+        Each block is a (channels, frames, height, width) ndarray
+          of at most `block_frames` frames (default: sized by BLOCK_BYTES).
+        """
+        channels_count, frames_count, height, width = self._get_image_stacks_shape()
+
+        if block_frames is None:
+            frame_bytes = (
+                max(channels_count, 1)
+                * height
+                * width
+                * np.dtype(self.ome_metadata.pixel_np_dtype).itemsize
+            )
+            block_frames = max(1, self.BLOCK_BYTES // max(frame_bytes, 1))
+
+        for start in range(0, frames_count, block_frames):
+            stop = min(start + block_frames, frames_count)
+            block = self._read_image_block(start, stop)
+            if block is None:
+                break
+
+            yield start, block
+
+    @staticmethod
+    def __allocate_image_stacks(
+        shape: tuple, dtype: DTypeLike, output_path: str = None
+    ) -> np.ndarray:
+        if output_path is None:
+            return np.empty(shape, dtype=dtype)
+
+        return np.lib.format.open_memmap(
+            output_path, mode="w+", dtype=dtype, shape=shape
+        )
 
     @abstractmethod
     def _init_library(self) -> dict:
@@ -212,10 +276,25 @@ class MicroscopeDataReaderBase(metaclass=ABCMeta):
         pass
 
     @abstractmethod
-    def _get_image_stacks(self) -> list:
-        """Return microscope image stacks"""
+    def _get_image_stacks_shape(self) -> tuple:
+        """Return (channels, frames, height, width) of image stacks"""
         pass
 
+    @abstractmethod
+    def _read_image_block(self, start: int, stop: int) -> np.ndarray:
+        """Return (channels, stop - start, height, width) block of image stacks
+
+        Return None if the frames could not be read.
+        """
+        pass
+
+    # Note: not @abstractmethod
+    def _reshape_image_stacks(self, stacks: np.ndarray) -> np.ndarray:
+        """Reshape (channels, frames, height, width) stacks to the final format"""
+
+        # Overwrite if necessary processing.
+        return stacks
+
     @property
     def data_file_path(self) -> str:
         return self.__data_file_path
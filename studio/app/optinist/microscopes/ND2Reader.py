@@ -349,41 +349,47 @@ class ND2Reader(MicroscopeDataReaderBase):
 
         self.__dll.Lim_FileClose(handle)
 
-    def _get_image_stacks(self) -> list:
-        """Return microscope image stacks"""
-
+    def _get_image_stacks_shape(self) -> tuple:
         (handle,) = self.resource_handles
 
-        # initialization
-        pic: LIMPICTURE = LIMPICTURE()
+        # Note: In ND2, the number of components is almost the same
+        #  as the number of channels.
+        attributes = self.original_metadata["attributes"]
         seq_count = self.__dll.Lim_FileGetSeqCount(handle)
 
-        # read image attributes
-        attributes = self.__dll.Lim_FileGetAttributes(handle)
-        attributes = json.loads(attributes)
-        image_width = attributes["widthPx"]
-        image_height = attributes["heightPx"]
+        return (
+            int(attributes["componentCount"]),
+            seq_count,
+            attributes["heightPx"],
+            attributes["widthPx"],
+        )
 
-        # Get the number of components in image
-        # *In ND2, the number of components is almost the same
-        #  as the number of channels.
-        image_component_count = int(attributes["componentCount"])
-
-        # allocate return value buffer (all channel's stack)
-        # Note: For speed, the image processing results in the following sections
-        #       will be set directly to this variable (numpy.ndarray).
-        result_channels_stacks = np.empty(
-            [image_component_count, seq_count, image_height, image_width],
-            dtype=self.ome_metadata.pixel_np_dtype,
+    def _read_image_block(self, start: int, stop: int) -> np.ndarray:
+        (handle,) = self.resource_handles
+
+        # initialization
+        pic: LIMPICTURE = LIMPICTURE()
+        (
+            image_component_count,
+            _,
+            image_height,
+            image_width,
+        ) = self._get_image_stacks_shape()
+        pixel_np_dtype = self.ome_metadata.pixel_np_dtype
+
+        # allocate block buffer (all channel's frames in [start, stop))
+        block_channels_stacks = np.empty(
+            [image_component_count, stop - start, image_height, image_width],
+            dtype=pixel_np_dtype,
         )
 
         # loop for each sequence
-        for seq_idx in range(seq_count):
+        for seq_idx in range(start, stop):
             # read image attributes
             if LimCode.LIM_OK != self.__dll.Lim_FileGetImageData(
                 handle, seq_idx, ctypes.byref(pic)
             ):
-                break
+                return None
 
             # calculate pixel byte size
             # Note: pixcel_bytes is assumed to be [1/2/4/6/8]
@@ -391,57 +397,34 @@ class ND2Reader(MicroscopeDataReaderBase):
             if pixcel_bytes not in (1, 2, 4, 6, 8):
                 raise AttributeError(f"Invalid pixcel_bytes: {pixcel_bytes}")
 
-            # # debug print
-            # print(
-            #     f"Picture info: #{seq_idx + 1}",
-            #     pic.uiWidth, pic.uiHeight, bytes, pic.uiComponents,
-            #     pic.uiBitsPerComp, pixcel_bytes,
-            # )
-
-            # Calculate the number of bytes per line (ctypes._CData format)
-            # * Probably the same value as pic.uiWidthBytes,
-            #     but ported based on the logic of the SDK sample code.
-            line_bytes = int(pixcel_bytes * pic.uiWidth / 2)
-            line_ctypes_bytes = self.ome_metadata.pixel_ct_type * line_bytes
-
-            # allocate image plane buffer
-            single_plane_buffer = np.empty(
-                [image_height, image_width, image_component_count],
-                dtype=self.ome_metadata.pixel_np_dtype,
-            )
-
-            # scan image lines
-            for line_idx in range(pic.uiHeight):
-                # Data acquisition for line and conversion to np.ndarray format
-                line_buffer = line_ctypes_bytes.from_address(
-                    pic.pImageData + (line_idx * pic.uiWidthBytes)
-                )
-                line_buffer_array = np.ctypeslib.as_array(line_buffer)
-
-                # mapping to plane buffer
-                single_plane_buffer[line_idx] = line_buffer_array.reshape(
-                    image_width, image_component_count
+            # Map the whole picture buffer at once (rows are uiWidthBytes apart),
+            #   and cut out the pixels of each line.
+            # Note: The pixel values of each component are adjacent to each other,
+            #     one pixel at a time.
+            #   Image: [px1: [c1][c2]..[cN]]..[pxN: [c1][c2]..[cN]]
+            picture_buffer = np.ctypeslib.as_array(
+                (ctypes.c_uint8 * (pic.uiWidthBytes * pic.uiHeight)).from_address(
+                    pic.pImageData
                 )
+            )
+            single_plane_buffer = (
+                picture_buffer.view(pixel_np_dtype)
+                .reshape(pic.uiHeight, -1)[:, : image_width * image_component_count]
+                .reshape(image_height, image_width, image_component_count)
+            )
 
-            # extract image data for each channel(component)
-            for component_idx in range(pic.uiComponents):
-                channel_idx = component_idx
-
-                # A frame image is cut out from a raw frame image
-                #     in units of channel(component).
-                # Note: The pixel values of each component are adjacent to each other,
-                #     one pixel at a time.
-                #   Image: [px1: [c1][c2]..[cN]]..[pxN: [c1][c2]..[cN]]
-                channel_plane_buffer = single_plane_buffer[:, :, component_idx]
+            # construct return value (each channel's frames)
+            block_channels_stacks[:, seq_idx - start] = single_plane_buffer.transpose(
+                2, 0, 1
+            )
 
-                # construct return value (each channel's stack)
-                result_channels_stacks[channel_idx, seq_idx] = channel_plane_buffer
+        return block_channels_stacks
 
+    def _reshape_image_stacks(self, stacks: np.ndarray) -> np.ndarray:
         # reshape operation.
         # Note: For 4D data(XYZT), reshape 3D format(XY(Z|T)) to 4D format(XYZT)
         if self.ome_metadata.size_z > 1 and self.ome_metadata.size_t > 1:
-            raw_result_channels_stacks = result_channels_stacks
-            result_channels_stacks = raw_result_channels_stacks.reshape(
+            stacks = stacks.reshape(
                 self.ome_metadata.size_c,
                 self.ome_metadata.size_t,
                 self.ome_metadata.size_z,
@@ -449,4 +432,4 @@ class ND2Reader(MicroscopeDataReaderBase):
                 self.ome_metadata.size_x,
             )
 
-        return result_channels_stacks
+        return stacks
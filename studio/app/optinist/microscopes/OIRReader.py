@@ -370,8 +370,13 @@ class OIRReader(MicroscopeDataReaderBase):
         ida.ReleaseAccessor(ctypes.byref(hAccessor))
         ida.Terminate()
 
-    def _get_image_stacks(self) -> list:
-        """Return microscope image stacks"""
+    def _load_complete_handler(self):
+        # Frame loop information is built on first access
+        self.__frame_loop_info = None
+
+    def __get_frame_loop_info(self) -> dict:
+        if self.__frame_loop_info is not None:
+            return self.__frame_loop_info
 
         (hAccessor, hFile, hGroup, hArea) = self.resource_handles
 
@@ -391,8 +396,6 @@ class OIRReader(MicroscopeDataReaderBase):
         # Axes Information
         axis_info = AxisInfo(hAccessor, hArea)
 
-        pAxes = (IDA_AXIS_INFO * 3)()
-
         nLLoop = nTLoop = nZLoop = 0
 
         # For Max Loop Values for lambda, z, t
@@ -403,68 +406,93 @@ class OIRReader(MicroscopeDataReaderBase):
         if axis_info.exist("TIMELAPSE"):
             nTLoop = axis_info.get_axis("TIMELAPSE").get_max()
 
-        nLLoop = nLLoop or 1
-        nTLoop = nTLoop or 1
-        nZLoop = nZLoop or 1
-
         # Retrieve all imaged area
         rect.width = area_image_size.get_x()
         rect.height = area_image_size.get_y()
 
-        # Get the number of channels
+        self.__frame_loop_info = {
+            "rect": rect,
+            "imaging_roi": imaging_roi,
+            "channel_info": channel_info,
+            "axis_info": axis_info,
+            # Note: sequential frame index runs through nLLoop/nZLoop/nTLoop
+            "loops": (nLLoop or 1, nZLoop or 1, nTLoop or 1),
+        }
+
+        return self.__frame_loop_info
+
+    def _get_image_stacks_shape(self) -> tuple:
+        frame_loop_info = self.__get_frame_loop_info()
+        rect = frame_loop_info["rect"]
+
+        return (
+            frame_loop_info["channel_info"].get_num_of_channel(),
+            int(np.prod(frame_loop_info["loops"])),
+            rect.height,
+            rect.width,
+        )
+
+    def _read_image_block(self, start: int, stop: int) -> np.ndarray:
+        (hAccessor, hFile, hGroup, hArea) = self.resource_handles
+
+        frame_loop_info = self.__get_frame_loop_info()
+        rect = frame_loop_info["rect"]
+        imaging_roi = frame_loop_info["imaging_roi"]
+        channel_info = frame_loop_info["channel_info"]
+        axis_info = frame_loop_info["axis_info"]
         channels_count = channel_info.get_num_of_channel()
 
-        # allocate return value buffer (all channel's stack)
-        # *using numpy.ndarray
-        result_channels_stacks = np.empty(
-            [channels_count, (nLLoop * nTLoop * nZLoop), rect.height, rect.width],
+        pAxes = (IDA_AXIS_INFO * 3)()
+
+        # allocate block buffer (all channel's frames in [start, stop))
+        block_channels_stacks = np.empty(
+            [channels_count, stop - start, rect.height, rect.width],
             dtype=self.ome_metadata.pixel_np_dtype,
         )
 
-        # Retrieve Image data and TimeStamp frame-by-frame
-        for channel_no in range(channels_count):
-            # Sequential index through nLLoop/nZLoop/nTLoop
-            serial_loops_index = 0
-
-            for i in range(nLLoop):
-                for j in range(nZLoop):
-                    for k in range(nTLoop):
-                        nAxisCount = lib.set_frame_axis_index(
-                            i, j, k, imaging_roi, axis_info, pAxes, 0
-                        )
-
-                        # Create Frame Manager
-                        frame_manager = FrameManager(
-                            hAccessor,
-                            hArea,
-                            channel_info.get_channel_id(channel_no),
-                            pAxes,
-                            nAxisCount,
-                        )
-
-                        # Get Image Body
-                        buffer_pointer = frame_manager.get_image_body(rect)
-                        ctypes_buffer_ptr = buffer_pointer[1]
-
-                        # Obtain image data in ndarray format
-                        single_plane_buffer = np.ctypeslib.as_array(ctypes_buffer_ptr)
-
-                        # construct return value (each channel's stack)
-                        result_channels_stacks[
-                            channel_no, serial_loops_index
-                        ] = single_plane_buffer
-                        serial_loops_index += 1
-
-                        frame_manager.release_image_body()
+        # Retrieve Image data frame-by-frame
+        for serial_loops_index in range(start, stop):
+            i, j, k = map(
+                int, np.unravel_index(serial_loops_index, frame_loop_info["loops"])
+            )
+            nAxisCount = lib.set_frame_axis_index(
+                i, j, k, imaging_roi, axis_info, pAxes, 0
+            )
+
+            for channel_no in range(channels_count):
+                # Create Frame Manager
+                frame_manager = FrameManager(
+                    hAccessor,
+                    hArea,
+                    channel_info.get_channel_id(channel_no),
+                    pAxes,
+                    nAxisCount,
+                )
+
+                # Get Image Body
+                buffer_pointer = frame_manager.get_image_body(rect)
+                ctypes_buffer_ptr = buffer_pointer[1]
+
+                # Obtain image data in ndarray format
+                single_plane_buffer = np.ctypeslib.as_array(ctypes_buffer_ptr)
+
+                # construct return value (each channel's frames)
+                block_channels_stacks[
+                    channel_no, serial_loops_index - start
+                ] = single_plane_buffer
+
+                frame_manager.release_image_body()
+
+        return block_channels_stacks
 
+    def _reshape_image_stacks(self, stacks: np.ndarray) -> np.ndarray:
         # reshape/transpose operation.
         # Note: To be performed for 4D data
         # TODO: Need to test
         if self.ome_metadata.size_z > 1 and self.ome_metadata.size_t > 1:
             # 1. For OIR 4D data(XYTZ), reshape 3D format(XY(T*Z)) to 4D format(XYTZ)
             # 2. For OIR 4D data(XYTZ), transpose to 4D format(XYZT)
-            raw_result_channels_stacks = result_channels_stacks
-            result_channels_stacks = raw_result_channels_stacks.reshape(
+            stacks = stacks.reshape(
                 self.ome_metadata.size_c,
                 self.ome_metadata.size_z,
                 self.ome_metadata.size_t,
@@ -474,4 +502,4 @@ class OIRReader(MicroscopeDataReaderBase):
                 0, 2, 1, 3, 4
             )  # transpose Z<->T
 
-        return result_channels_stacks
+        return stacks
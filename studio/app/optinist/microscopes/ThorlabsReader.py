@@ -6,6 +6,7 @@ import zipfile
 from datetime import datetime
 from glob import glob
 
+import numpy as np
 import tifffile
 import xmltodict
 
@@ -242,18 +243,27 @@ class ThorlabsReader(MicroscopeDataReaderBase):
     def _release_resources(self) -> None:
         self.__cleanup_raw_extracted_path()
 
-    def _get_image_stacks(self) -> list:
+    def _get_image_stacks_shape(self) -> tuple:
         handle_tiff = None
         (handle_tiff,) = self.resource_handles
 
-        # get return value buffer (all channel's stack)
-        # *numpy.ndarray
-        result_channels_stacks = handle_tiff.asarray()
+        # Note: OME-TIFF series is stored in XYCT order (pages: T -> C)
+        series_shape = handle_tiff.series[0].shape
+        frames_count = series_shape[0]
+        channels_count = int(np.prod(series_shape[1:-2]))
 
-        # reshape/transpose operation.
-        raw_result_channels_stacks = result_channels_stacks
-        result_channels_stacks = raw_result_channels_stacks.transpose(
-            1, 0, 2, 3
-        )  # transpose to XYCT -> XYTC
+        return (channels_count, frames_count) + tuple(series_shape[-2:])
+
+    def _read_image_block(self, start: int, stop: int) -> np.ndarray:
+        handle_tiff = None
+        (handle_tiff,) = self.resource_handles
 
-        return result_channels_stacks
+        channels_count, _, height, width = self._get_image_stacks_shape()
+
+        # read only the pages of frames in [start, stop)
+        raw_block = handle_tiff.asarray(
+            key=range(start * channels_count, stop * channels_count), series=0
+        ).reshape(stop - start, channels_count, height, width)
+
+        # reshape/transpose operation.
+        return raw_block.transpose(1, 0, 2, 3)  # transpose to XYCT -> XYTC
@@ -0,0 +1,127 @@
+import logging
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+import pytest
+import tifffile
+
+# add sys.path for conda env
+sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/../../../../../")
+
+from studio.app.optinist.microscopes.IsxdReader import IsxdReader  # NOQA
+from studio.app.optinist.microscopes.ND2Reader import ND2Reader  # NOQA
+from studio.app.optinist.microscopes.OIRReader import OIRReader  # NOQA
+from studio.app.optinist.microscopes.ThorlabsReader import ThorlabsReader  # NOQA
+
+TEST_DIR_PATH = os.path.dirname(os.path.abspath(__file__))
+TEST_DATA_DIR = TEST_DIR_PATH + "/test_data"
+TEST_OUTPUT_DIR = TEST_DIR_PATH + "/test_output/reader_blocks"
+
+SAMPLE_DATA = [
+    (ND2Reader, TEST_DATA_DIR + "/nikon/pia_volume_area1.nd2"),
+    (OIRReader, TEST_DATA_DIR + "/olympus/olympus-xyt005_0001.oir"),
+    (IsxdReader, TEST_DATA_DIR + "/inscopix/oist_short_example_preprocessed.isxd"),
+]
+
+
+def create_thorlabs_data(data_dir: str, size_t: int, size_c: int, size_yx: tuple):
+    """
+    Write a synthetic ThorImageLS directory (OME-TIFF + Experiment.xml)
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    size_y, size_x = size_yx
+    stacks = np.random.randint(0, 4096, (size_t, size_c) + size_yx).astype(np.uint16)
+
+    channels = "".join(
+        f'<Channel ID="Channel:0:{c}" SamplesPerPixel="1"/>' for c in range(size_c)
+    )
+    ome_xml = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<OME xmlns="http://www.openmicroscopy.org/Schemas/OME/2010-06">'
+        '<Image ID="Image:0" Name="synthetic" AcquiredDate="2024-01-01T00:00:00">'
+        '<Pixels ID="Pixels:0" DimensionOrder="XYCZT" Type="uint16" '
+        f'SizeX="{size_x}" SizeY="{size_y}" SizeC="{size_c}" SizeZ="1" '
+        f'SizeT="{size_t}" PhysicalSizeX="1.0" PhysicalSizeY="1.0">'
+        f'{channels}<TiffData IFD="0" PlaneCount="{size_t * size_c}"/>'
+        "</Pixels></Image></OME>"
+    )
+    tifffile.imwrite(
+        f"{data_dir}/ChanA_0001.tif",
+        stacks.reshape((-1,) + size_yx),
+        description=ome_xml,
+        metadata=None,
+    )
+    with open(f"{data_dir}/{ThorlabsReader.METADATA_EXPERIMENT_FILENAME}", "w") as f:
+        f.write(
+            '<?xml version="1.0"?>'
+            '<ThorImageExperiment><LSM frameRate="30.0"/></ThorImageExperiment>'
+        )
+
+    # (ch, t, y, x)
+    return stacks.transpose(1, 0, 2, 3)
+
+
+def get_image_stacks_peak(data_reader, output_path: str = None):
+    tracemalloc.start()
+    stacks = data_reader.get_image_stacks(output_path=output_path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return stacks, peak
+
+
+def test_thorlabs_reader_blocks():
+    data_dir = f"{TEST_OUTPUT_DIR}/thorlabs_synthetic"
+    expected = create_thorlabs_data(data_dir, size_t=1000, size_c=2, size_yx=(64, 64))
+
+    data_reader = ThorlabsReader()
+    data_reader.load(data_dir)
+    data_reader.BLOCK_BYTES = expected.nbytes // 20
+
+    blocks = list(data_reader.iter_image_blocks(block_frames=300))
+    assert [start for start, _ in blocks] == [0, 300, 600, 900]
+    np.testing.assert_array_equal(
+        np.concatenate([block for _, block in blocks], axis=1), expected
+    )
+
+    stacks, peak_in_memory = get_image_stacks_peak(data_reader)
+    np.testing.assert_array_equal(stacks, expected)
+    del stacks
+
+    output_path = f"{TEST_OUTPUT_DIR}/thorlabs_synthetic.npy"
+    stacks, peak = get_image_stacks_peak(data_reader, output_path)
+    assert isinstance(stacks, np.memmap)
+    np.testing.assert_array_equal(stacks, expected)
+    np.testing.assert_array_equal(np.load(output_path, mmap_mode="r"), expected)
+
+    print(
+        f"[thorlabs] stacks: {expected.nbytes / 1024**2:.1f} MiB, "
+        f"peak (in memory): {peak_in_memory / 1024**2:.1f} MiB, "
+        f"peak (memmap): {peak / 1024**2:.1f} MiB"
+    )
+    assert peak < expected.nbytes / 4
+
+
+@pytest.mark.parametrize("reader_class, data_path", SAMPLE_DATA)
+def test_sample_reader_blocks(reader_class, data_path):
+    if not os.path.isfile(data_path) or not reader_class.is_available():
+        logging.warning(f"{reader_class.__name__} sample data is not available.")
+        return
+
+    data_reader = reader_class()
+    data_reader.load(data_path)
+
+    expected, peak_in_memory = get_image_stacks_peak(data_reader)
+
+    os.makedirs(TEST_OUTPUT_DIR, exist_ok=True)
+    output_path = f"{TEST_OUTPUT_DIR}/{os.path.basename(data_path)}.npy"
+    stacks, peak = get_image_stacks_peak(data_reader, output_path)
+    np.testing.assert_array_equal(stacks, expected)
+
+    print(
+        f"[{reader_class.__name__}] stacks: {expected.nbytes / 1024**2:.1f} MiB, "
+        f"peak (in memory): {peak_in_memory / 1024**2:.1f} MiB, "
+        f"peak (memmap): {peak / 1024**2:.1f} MiB"
+    )
@@ -1,6 +1,5 @@
-from typing import List
+from typing import TYPE_CHECKING, List
 
-import h5py
 import numpy as np
 from fastapi import APIRouter
 
@@ -8,12 +7,18 @@ from studio.app.common.core.utils.filepath_creater import join_filepath
 from studio.app.dir_path import DIRPATH
 from studio.app.optinist.schemas.hdf5 import HDF5Node
 
+# Note: h5py is imported on use (this router is imported by the API server).
+if TYPE_CHECKING:
+    import h5py
+
 router = APIRouter()
 
 
 class HDF5Getter:
     @classmethod
     def get(cls, filepath) -> List[HDF5Node]:
+        import h5py
+
         cls.hdf5_list = []
         with h5py.File(filepath, "r") as f:
             f.visititems(cls.get_ds_dictionaries)
@@ -21,7 +26,9 @@ class HDF5Getter:
         return cls.hdf5_list
 
     @classmethod
-    def get_ds_dictionaries(cls, path: str, node: h5py.Dataset):
+    def get_ds_dictionaries(cls, path: str, node: "h5py.Dataset"):
+        import h5py
+
         if isinstance(node, h5py.Dataset):
             if len(node.shape) != 0:
                 cls.recursive_dir_tree(cls.hdf5_list, path.split("/"), node, "")
@@ -31,7 +38,7 @@ class HDF5Getter:
         cls,
         node_list: List[HDF5Node],
         path_list: List[str],
-        node: h5py.Dataset,
+        node: "h5py.Dataset",
         parent_path: str,
     ):
         name = path_list[0]
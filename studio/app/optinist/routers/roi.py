@@ -6,9 +6,11 @@ from studio.app.common.core.storage.remote_storage_controller import (
     RemoteStorageLockError,
 )
 from studio.app.common.core.workspace.workspace_dependencies import is_workspace_owner
-from studio.app.optinist.core.edit_ROI import EditROI, EditRoiUtils
 from studio.app.optinist.schemas.roi import RoiList, RoiPos, RoiStatus
 
+# Note: EditROI (with pynwb and the dataclasses) is imported on first use,
+#   to keep the API server startup light.
+
 router = APIRouter(prefix="/outputs", tags=["outputs"])
 
 logger = AppLogger.get_logger()
@@ -20,6 +22,8 @@ logger = AppLogger.get_logger()
     dependencies=[Depends(is_workspace_owner)],
 )
 async def status_roi(filepath: str):
+    from studio.app.optinist.core.edit_ROI import EditROI
+
     return EditROI(file_path=filepath).get_status()
 
 
@@ -29,6 +33,8 @@ async def status_roi(filepath: str):
     dependencies=[Depends(is_workspace_owner)],
 )
 async def add_roi(filepath: str, pos: RoiPos):
+    from studio.app.optinist.core.edit_ROI import EditROI
+
     EditROI(file_path=filepath).add(pos)
     return True
 
@@ -39,6 +45,8 @@ async def add_roi(filepath: str, pos: RoiPos):
     dependencies=[Depends(is_workspace_owner)],
 )
 async def merge_roi(filepath: str, roi_list: RoiList):
+    from studio.app.optinist.core.edit_ROI import EditROI
+
     EditROI(file_path=filepath).merge(roi_list.ids)
     return True
 
@@ -49,6 +57,8 @@ async def merge_roi(filepath: str, roi_list: RoiList):
     dependencies=[Depends(is_workspace_owner)],
 )
 async def delete_roi(filepath: str, roi_list: RoiList):
+    from studio.app.optinist.core.edit_ROI import EditROI
+
     EditROI(file_path=filepath).delete(roi_list.ids)
     return True
 
@@ -62,6 +72,8 @@ async def commit_edit(
     filepath: str,
     remote_bucket_name: str = Depends(get_user_remote_bucket_name),
 ):
+    from studio.app.optinist.core.edit_ROI import EditRoiUtils
+
     try:
         EditRoiUtils.execute(filepath, remote_bucket_name)
 
@@ -84,5 +96,7 @@ async def commit_edit(
     dependencies=[Depends(is_workspace_owner)],
 )
 async def cancel_edit(filepath: str):
+    from studio.app.optinist.core.edit_ROI import EditROI
+
     EditROI(file_path=filepath).cancel()
     return True
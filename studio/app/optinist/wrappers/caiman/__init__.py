@@ -10,18 +10,22 @@ caiman_wrapper_dict = {
         "caiman_mc": {
             "function": caiman_mc,
             "conda_name": "caiman",
+            "resources": {"mem_mb": 8000},
         },
         "caiman_cnmf": {
             "function": caiman_cnmf,
             "conda_name": "caiman",
+            "resources": {"mem_mb": 8000},
         },
         "caiman_cnmfe": {
             "function": caiman_cnmfe,
             "conda_name": "caiman",
+            "resources": {"mem_mb": 8000},
         },
         "cnmf_multisession": {
             "function": caiman_cnmf_multisession,
             "conda_name": "caiman",
+            "resources": {"mem_mb": 8000},
         },
     }
 }
@@ -167,14 +167,23 @@ def caiman_cnmf(
     roi_thr = params.pop("roi_thr", None)
     use_online = params.pop("use_online", False)
 
-    file_path = images.path
-    if isinstance(file_path, list):
-        file_path = file_path[0]
-
-    images = images.data
     mmap_paths = []
-    mmap_images, dims, mmap_path = util_get_image_memmap(function_id, images, file_path)
-    mmap_paths.append(mmap_path)
+    mmap_images = images.memmap
+    if mmap_images is not None:
+        # Read the upstream memmap (eg. caiman_mc output) directly, without copy.
+        # *It is owned by the upstream node, so it is not cleaned up here.
+        mmap_path = images.mmap_path
+        dims = mmap_images.shape[1:]
+    else:
+        file_path = images.path
+        if isinstance(file_path, list):
+            file_path = file_path[0]
+
+        images = images.data
+        mmap_images, dims, mmap_path = util_get_image_memmap(
+            function_id, images, file_path
+        )
+        mmap_paths.append(mmap_path)
 
     del images
     gc.collect()
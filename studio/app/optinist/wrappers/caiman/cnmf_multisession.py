@@ -205,14 +205,16 @@ def caiman_cnmf_multisession(
     }
 
     # get mean image
-    file_path = images.path
-    if isinstance(file_path, list):
-        file_path = file_path[0]
-    images = images.data
-    mmap_images, dims, mmap_path = util_get_image_memmap(
-        function_id, images.data, file_path
-    )
-    mmap_paths.append(mmap_path)
+    mmap_images = images.memmap
+    if mmap_images is None:
+        file_path = images.path
+        if isinstance(file_path, list):
+            file_path = file_path[0]
+        images = images.data
+        mmap_images, dims, mmap_path = util_get_image_memmap(
+            function_id, images.data, file_path
+        )
+        mmap_paths.append(mmap_path)
 
     Cn = local_correlations(mmap_images.transpose(1, 2, 0))
     Cn[np.isnan(Cn)] = 0
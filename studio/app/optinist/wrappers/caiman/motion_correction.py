@@ -1,7 +1,13 @@
 import os
+import shutil
 
 from studio.app.common.core.experiment.experiment import ExptOutputPathIds
 from studio.app.common.core.logger import AppLogger
+from studio.app.common.core.utils.filepath_creater import (
+    create_directory,
+    join_filepath,
+)
+from studio.app.common.core.utils.memmap_handler import MemmapReader
 from studio.app.common.dataclass import ImageData
 from studio.app.optinist.core.nwb.nwb import NWBDATASET
 from studio.app.optinist.dataclass import RoiData
@@ -15,7 +21,7 @@ def caiman_mc(
     image: ImageData, output_dir: str, params: dict = None, **kwargs
 ) -> dict(mc_images=ImageData):
     import numpy as np
-    from caiman import load_memmap, save_memmap, stop_server
+    from caiman import save_memmap, stop_server
     from caiman.cluster import setup_cluster
     from caiman.motion_correction import MotionCorrect
     from caiman.source_extraction.cnmf.params import CNMFParams
@@ -64,16 +70,23 @@ def caiman_mc(
     )
     stop_server(dview=dview)
 
-    # now load the file
-    Yr, dims, T = load_memmap(mmap_file_new)
+    # Keep the C-order memmap in the output directory,
+    #   so that downstream nodes (CNMF, viewers) read the movie directly from it.
+    # *The corrected movie is never loaded in memory as a whole.
+    mmap_dir = join_filepath([output_dir, "mmap"])
+    create_directory(mmap_dir)
+    mmap_path = join_filepath([mmap_dir, os.path.basename(mmap_file_new)])
+    shutil.move(mmap_file_new, mmap_path)
 
-    images = np.array(Yr.T.reshape((T,) + dims, order="F"))
+    dims, _, _ = MemmapReader.parse_layout(mmap_path)
+    Yr = MemmapReader.read_yr(mmap_path)
+    meanImg = np.asarray(Yr.mean(axis=1)).reshape(dims, order="F")
 
     # Release variables associated with memmap files when they are no longer needed.
     # *Avoid lock errors when cleaning memmap files.
-    del Yr, dims, T
+    del Yr
 
-    meanImg, rois = __process_images(images)
+    rois = __process_rois(meanImg)
 
     xy_trans_data = (
         (np.array(mc.x_shifts_els), np.array(mc.y_shifts_els))
@@ -81,7 +94,7 @@ def caiman_mc(
         else np.array(mc.shifts_rig)
     )
 
-    mc_images = ImageData(images, output_dir=output_dir, file_name="mc_images")
+    mc_images = ImageData(mmap_path, output_dir=output_dir, file_name="mc_images")
 
     nwbfile = {}
     nwbfile[NWBDATASET.MOTION_CORRECTION] = {
@@ -100,7 +113,7 @@ def caiman_mc(
 
     # Clean up temporary files
     try:
-        __handle_mmap_cleanup(mc, mmap_file_new)
+        __handle_mmap_cleanup(mc)
     except Exception as e:
         logger.error("caiman_mc: Failed to cleanup memmap files.")
         logger.error(e)
@@ -115,11 +128,10 @@ def caiman_mc(
     return info
 
 
-def __process_images(images):
+def __process_rois(meanImg):
     import numpy as np
     from caiman.base.rois import extract_binary_masks_from_structural_channel
 
-    meanImg = images.mean(axis=0)
     rois = (
         extract_binary_masks_from_structural_channel(
             meanImg, gSig=7, expand_method="dilation"
@@ -135,10 +147,10 @@ def __process_images(images):
     rois = np.nanmax(rois, axis=0)
     rois[rois == 0] = np.nan
     rois -= 1
-    return meanImg, rois
+    return rois
 
 
-def __handle_mmap_cleanup(mc, mmap_file_new):
+def __handle_mmap_cleanup(mc):
     # Explicitly gc before deleting memmap file
     # *Avoid lock errors when cleaning memmap files.
     import gc
@@ -148,6 +160,3 @@ def __handle_mmap_cleanup(mc, mmap_file_new):
     for mmap_file in mc.mmap_file:
         if os.path.isfile(mmap_file):
             os.remove(mmap_file)
-
-    if os.path.isfile(mmap_file_new):
-        os.remove(mmap_file_new)
@@ -5,6 +5,7 @@ lccd_wrapper_dict = {
         "lccd_cell_detection": {
             "function": lccd_detect,
             "conda_name": "lccd",
+            "resources": {"mem_mb": 4000},
         },
     }
 }
@@ -54,75 +54,50 @@ def createMatrix(D, triggers, stims, duration):
     # durations: frames before and after trigger to use
 
     num_unit = D.shape[1]
-    num_triggers = len(triggers)
     num_property = len(stims)
     num_timepoints = duration[1] - duration[0]
 
+    if num_property > 3:
+        logger.warn("currently the number of condition category has to be less than 4")
+        return
+
     # X is the reshaped data for each trigger
-    X = np.zeros([num_triggers, num_unit, num_timepoints])
-    for i in range(num_triggers):
-        X[i, :, :] = D[
-            triggers[i] + duration[0] : triggers[i] + duration[1], :
-        ].transpose()
-
-    # df is the table of stimulus conditions
-    # df: number of trigger x ( number of property +1 )
-    # uq_stims = list of unique stimulus for each property
+    # X: num_triggers x num_unit x num_timepoints
+    #   (all trigger windows are gathered by a single fancy indexing)
+    window = np.asarray(triggers)[:, np.newaxis] + np.arange(*duration)
+    if window.size > 0 and (window.min() < 0 or window.max() >= D.shape[0]):
+        raise IndexError("trigger_duration exceeds the range of the neural data")
+    X = D[window].transpose(0, 2, 1)
+
+    # codes: index of the unique stimulus of each property, for each trigger
+    #   (unique stimuli are ordered by first appearance)
     # num_uq_stims = number of unique_stims for each property
-
-    columns = columns = list(map(str, range(num_property)))
-    columns.append("all")
-    df = pd.DataFrame(data=None, index=list(range(num_triggers)), columns=columns)
-    for i in range(num_property):
-        df[columns[i]] = stims[i]
-
-    for i in range(num_triggers):
-        df.iloc[i, num_property] = "_".join(map(str, df.iloc[i, 0:2].values.tolist()))
-
-    uq_list = df["all"].unique()
-    uq_stims = []
+    codes = []
     num_uq_stims = []
     for i in range(num_property):
-        uq_stims.append(list(df.iloc[:, i].unique()))
-        num_uq_stims.append(len(uq_stims[i]))
+        code, uq_stim = pd.factorize(np.asarray(stims[i]))
+        codes.append(code)
+        num_uq_stims.append(len(uq_stim))
 
     #  check number of samples
+    # cond: condition id of each trigger (combination of all properties)
     # n: number of samples for each condition
-    # index: index of the trigger for each condition
+    # rank: order of the trigger among the samples of its condition
     # min_sample: minimum number of samples for a condition
-    n = np.zeros([len(uq_list)], dtype=int)
-    index = []
-    for i in range(len(uq_list)):
-        index.append(list(df[df["all"] == uq_list[i]].index))
-        n[i] = len(index[i])
+    cond = np.ravel_multi_index(codes, num_uq_stims)
+    n = np.bincount(cond)
+    min_sample = int(np.min(n[n > 0]))
 
-    min_sample = int(np.min(n))
+    order = np.argsort(cond, kind="stable")
+    first = np.concatenate([[0], np.cumsum(n)[:-1]])
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order)) - first[cond[order]]
 
-    # re-format the data (number of samples is set to the nun_sample)
+    # re-format the data (number of samples is set to the min_sample)
     X2 = np.zeros([min_sample, num_unit, num_timepoints] + num_uq_stims)
 
-    for i in range(len(index)):
-        stims = list(df.iloc[index[i][0], 0 : df.shape[1] - 1])
-        tgtind = []
-        for j in range(len(stims)):
-            tgtind.append(uq_stims[j].index(stims[j]))
-
-        if num_property == 1:
-            X2[0:min_sample, :, :, tgtind[0]] = X[index[i][0:min_sample], :, :]
-        elif num_property == 2:
-            X2[0:min_sample, :, :, tgtind[0], tgtind[1]] = X[
-                index[i][0:min_sample], :, :
-            ]
-        elif num_property == 3:
-            X2[0:min_sample, :, :, tgtind[0], tgtind[1], tgtind[2]] = X[
-                index[i][0:min_sample], :, :
-            ]
-
-        else:
-            logger.warn(
-                "currently the number of condition category has to be less than 4"
-            )
-            return
+    use = rank < min_sample
+    X2[(rank[use], slice(None), slice(None), *[code[use] for code in codes])] = X[use]
 
     return X2
 
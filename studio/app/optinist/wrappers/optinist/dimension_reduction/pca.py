@@ -3,10 +3,16 @@ from studio.app.common.core.logger import AppLogger
 from studio.app.common.dataclass import BarData, ScatterData
 from studio.app.optinist.core.nwb.nwb import NWBDATASET
 from studio.app.optinist.dataclass import FluoData, IscellData
-from studio.app.optinist.wrappers.optinist.utils import standard_norm
+from studio.app.optinist.wrappers.optinist.utils import param_check, standard_norm
 
 logger = AppLogger.get_logger()
 
+# Data size (number of values) from which IncrementalPCA is used automatically
+INCREMENTAL_PCA_MIN_VALUES = 50_000_000
+
+# Upper bound of bytes of each chunk processed by IncrementalPCA
+INCREMENTAL_PCA_CHUNK_BYTES = 64 * 1024**2
+
 
 def PCA(
     neural_data: FluoData,
@@ -31,17 +37,33 @@ def PCA(
     else:
         X = neural_data
 
+    ind = None
     if iscell is not None:
         iscell = iscell.data
         ind = np.where(iscell > 0)[0]
-        X = X[:, ind]
 
-    # # preprocessing
-    tX = standard_norm(X, IOparams["standard_mean"], IOparams["standard_std"])
+    n_features = X.shape[1] if ind is None else len(ind)
+    incremental_params = param_check(params.get("incremental_pca", {}))
+
+    if __use_incremental_pca(
+        X.shape[0], n_features, params["PCA"], incremental_params.get("use", "auto")
+    ):
+        logger.info("PCA: fit IncrementalPCA by chunks")
+        pca, proj_X = __fit_incremental_pca(
+            X, ind, IOparams, params["PCA"], incremental_params.get("batch_size")
+        )
+        n_samples = pca.n_samples_seen_
+    else:
+        if ind is not None:
+            X = X[:, ind]
+
+        # # preprocessing
+        tX = standard_norm(X, IOparams["standard_mean"], IOparams["standard_std"])
 
-    # calculate PCA
-    pca = PCA(**params["PCA"])
-    proj_X = pca.fit_transform(tX)
+        # calculate PCA
+        pca = PCA(**params["PCA"])
+        proj_X = pca.fit_transform(tX)
+        n_samples = pca.n_samples_
 
     # NWB追加
     nwbfile = {}
@@ -54,7 +76,7 @@ def PCA(
             "singular_values": pca.singular_values_,
             "mean": pca.mean_,
             "n_components": [pca.n_components_],
-            "n_samples": [pca.n_samples_],
+            "n_samples": [n_samples],
             "noise_variance": [pca.noise_variance_],
             "n_features_in": [pca.n_features_in_],
         }
@@ -78,3 +100,61 @@ def PCA(
     }
 
     return info
+
+
+def __use_incremental_pca(n_samples, n_features, pca_params, use="auto") -> bool:
+    """
+    IncrementalPCA supports only an int n_components,
+      so the exact solver is used otherwise.
+    """
+    n_components = pca_params.get("n_components")
+    if not isinstance(n_components, int) or isinstance(n_components, bool):
+        return False
+
+    if use == "auto":
+        return n_samples * n_features >= INCREMENTAL_PCA_MIN_VALUES
+    return bool(use)
+
+
+def __fit_incremental_pca(X, ind, IOparams, pca_params, batch_size=None):
+    """
+    Standardize and fit the matrix chunk by chunk,
+      without making a standardized copy of the whole matrix.
+    """
+    import numpy as np
+    from sklearn.decomposition import IncrementalPCA
+    from sklearn.preprocessing import StandardScaler
+
+    n_samples = X.shape[0]
+    n_features = X.shape[1] if ind is None else len(ind)
+    n_components = pca_params["n_components"]
+
+    if batch_size is None:
+        batch_size = INCREMENTAL_PCA_CHUNK_BYTES // (n_features * 8)
+    # Note: Every chunk must have at least n_components samples.
+    batch_size = min(max(int(batch_size), 2 * n_components), n_samples)
+    chunks = np.array_split(np.arange(n_samples), -(-n_samples // batch_size))
+
+    def get_chunk(index):
+        chunk = X[index[0] : index[-1] + 1]
+        return chunk if ind is None else chunk[:, ind]
+
+    scaler = StandardScaler(
+        with_mean=IOparams["standard_mean"], with_std=IOparams["standard_std"]
+    )
+    for index in chunks:
+        scaler.partial_fit(get_chunk(index))
+
+    pca = IncrementalPCA(
+        n_components=n_components,
+        whiten=pca_params.get("whiten", False),
+        batch_size=batch_size,
+    )
+    for index in chunks:
+        pca.partial_fit(scaler.transform(get_chunk(index)))
+
+    proj_X = np.concatenate(
+        [pca.transform(scaler.transform(get_chunk(index))) for index in chunks]
+    )
+
+    return pca, proj_X
@@ -3,7 +3,12 @@ from studio.app.common.core.logger import AppLogger
 from studio.app.common.dataclass import BarData
 from studio.app.optinist.core.nwb.nwb import NWBDATASET
 from studio.app.optinist.dataclass import BehaviorData, FluoData, IscellData
-from studio.app.optinist.wrappers.optinist.utils import param_check, standard_norm
+from studio.app.optinist.wrappers.optinist.utils import (
+    cross_validation_score,
+    get_n_jobs,
+    param_check,
+    standard_norm,
+)
 
 logger = AppLogger.get_logger()
 
@@ -24,6 +29,9 @@ def LDA(
     function_id = ExptOutputPathIds(output_dir).function_id
     logger.info("start LDA: %s", function_id)
 
+    n_jobs = get_n_jobs(params.get("n_jobs"))
+    logger.info("n_jobs: %s", n_jobs)
+
     neural_data = neural_data.data
     behaviors_data = behaviors_data.data
 
@@ -63,19 +71,9 @@ def LDA(
 
     params["LDA"] = param_check(params["LDA"])
 
-    score = []
-    classifier = []
-    for train_index, test_index in skf.split(tX, Y):
-        clf = LDA(**params["LDA"])
-
-        if tX.shape[0] == 1:
-            clf.fit(tX[train_index].reshape(-1, 1), Y[train_index])
-            score.append(clf.score(tX[test_index].reshape(-1, 1), Y[test_index]))
-            classifier.append(clf)
-        else:
-            clf.fit(tX[train_index, :], Y[train_index])
-            score.append(clf.score(tX[test_index, :], Y[test_index]))
-            classifier.append(clf)
+    score, classifier = cross_validation_score(
+        LDA(**params["LDA"]), tX, Y, skf, n_jobs=n_jobs
+    )
 
     # NWB追加
     nwbfile = {}
@@ -1,3 +1,8 @@
+import os
+
+NODE_CPU_BUDGET_ENV_VAR_NAME = "OPTINIST_NODE_CPU_BUDGET"
+
+
 def standard_norm(X, mean, std):
     from sklearn.preprocessing import StandardScaler
 
@@ -23,3 +28,56 @@ def param_check(params):
         if (params[key] == "") or (params[key] == "None"):
             params[key] = None
     return params
+
+
+def get_n_jobs(n_jobs=None) -> int:
+    """
+    Resolve the number of local workers used by a node.
+    - n_jobs follows the joblib convention (None: 1, -1: all available CPUs)
+    - The result is bounded by the node CPU budget
+      (env var "OPTINIST_NODE_CPU_BUDGET", or the CPUs available to the process)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpu_budget = len(os.sched_getaffinity(0))
+    else:
+        cpu_budget = os.cpu_count() or 1
+
+    if os.environ.get(NODE_CPU_BUDGET_ENV_VAR_NAME):
+        cpu_budget = min(cpu_budget, int(os.environ[NODE_CPU_BUDGET_ENV_VAR_NAME]))
+
+    if n_jobs in (None, "", "None"):
+        n_jobs = 1
+    elif n_jobs < 0:
+        n_jobs = cpu_budget + 1 + n_jobs
+
+    return max(1, min(n_jobs, cpu_budget))
+
+
+def _fit_score_fold(clf, X, Y, train_index, test_index):
+    if X.shape[0] == 1:
+        clf.fit(X[train_index].reshape(-1, 1), Y[train_index])
+        score = clf.score(X[test_index].reshape(-1, 1), Y[test_index])
+    else:
+        clf.fit(X[train_index, :], Y[train_index])
+        score = clf.score(X[test_index, :], Y[test_index])
+
+    return score, clf
+
+
+def cross_validation_score(estimator, X, Y, cv, n_jobs=1):
+    """
+    Fit and score a clone of estimator on each fold of cv.
+    *Folds are independent, so they run on up to n_jobs local workers.
+    """
+    from joblib import Parallel, delayed
+    from sklearn.base import clone
+
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_score_fold)(clone(estimator), X, Y, train_index, test_index)
+        for train_index, test_index in cv.split(X, Y)
+    )
+
+    score = [score for score, _ in results]
+    classifier = [clf for _, clf in results]
+
+    return score, classifier
@@ -1,3 +1,10 @@
+import os
+
+from studio.app.common.core.utils.filepath_creater import (
+    create_directory,
+    join_filepath,
+)
+from studio.app.common.core.utils.memmap_handler import MemmapReader
 from studio.app.common.dataclass.image import ImageData
 from studio.app.optinist.dataclass.microscope import MicroscopeData
 
@@ -6,14 +13,39 @@ def microscope_to_img(
     microscope: MicroscopeData, output_dir: str, params: dict = None, **kwargs
 ) -> dict(microscope_image=ImageData):
     reader = microscope.reader
-    raw_stack = reader.get_image_stacks()  # (ch, t, y, x) or (ch, t, z, y, x)
 
-    ch = params.get("ch", 0)
+    # Note: stacks are streamed block by block into a memory-mapped file,
+    #   so that the whole stacks (all channels) are not held in memory.
+    create_directory(output_dir)
+    stacks_path = join_filepath([output_dir, "microscope_stacks.npy"])
+    try:
+        raw_stack = reader.get_image_stacks(
+            output_path=stacks_path
+        )  # (ch, t, y, x) or (ch, t, z, y, x)
+
+        # Note: the channel is copied block by block into a memmap,
+        #   which ImageData keeps as the file-backed source of the movie.
+        channel_stack = raw_stack[params.get("ch", 0)]
+        mmap_path = MemmapReader.get_filepath(
+            output_dir, "microscope_image", channel_stack.shape
+        )
+        channel_mmap = MemmapReader.read(mmap_path, mode="w+")
+        frame_bytes = channel_mmap[0].size * channel_mmap.itemsize
+        chunk_frames = max(1, MemmapReader.CHUNK_BYTES // frame_bytes)
+        for start in range(0, len(channel_mmap), chunk_frames):
+            stop = start + chunk_frames
+            channel_mmap[start:stop] = channel_stack[start:stop]
+        channel_mmap.flush()
+        del raw_stack, channel_stack, channel_mmap
+    finally:
+        if os.path.exists(stacks_path):
+            os.remove(stacks_path)
+
     image = ImageData(
-        raw_stack[ch],
+        mmap_path,
         output_dir=output_dir,
         file_name="microscope_image",
     )
-    microscope.set_data(image.data)
+    microscope.set_data(image.memmap)
 
     return {"microscope_image": image}
@@ -12,10 +12,12 @@ suite2p_wrapper_dict = {
         "suite2p_registration": {
             "function": suite2p_registration,
             "conda_name": "suite2p",
+            "resources": {"mem_mb": 4000},
         },
         "suite2p_roi": {
             "function": suite2p_roi,
             "conda_name": "suite2p",
+            "resources": {"mem_mb": 4000},
         },
         "suite2p_spike_deconv": {
             "function": suite2p_spike_deconv,
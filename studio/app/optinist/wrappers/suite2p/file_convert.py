@@ -8,6 +8,7 @@ from studio.app.common.core.utils.filepath_creater import (
 )
 from studio.app.common.dataclass import ImageData
 from studio.app.optinist.dataclass import Suite2pData
+from studio.app.optinist.wrappers.suite2p.suite2p_utils import Suite2pUtils
 
 logger = AppLogger.get_logger()
 
@@ -16,37 +17,14 @@ def suite2p_file_convert(
     image: ImageData, output_dir: str, params: dict = None, **kwargs
 ) -> dict(ops=Suite2pData):
     import numpy as np
-    import tifffile
-    from suite2p import default_ops, io
-    from suite2p.io.tiff import open_tiff, use_sktiff_reader
+    from suite2p import default_ops
+    from suite2p.io.utils import init_ops
 
     function_id = ExptOutputPathIds(output_dir).function_id
     logger.info("start suite2p_file_convert: %s", function_id)
 
-    data_path_list = []
-    data_name_list = []
-    for file_path in image.path:
-        use_sktiff = (
-            True
-            if params.get("force_sktiff")
-            else use_sktiff_reader(file_path, batch_size=params.get("batch_size"))
-        )
-
-        tif, _ = open_tiff(file_path, use_sktiff)
-        if use_sktiff:
-            im = tifffile.imread(file_path)
-        else:
-            im = tif.data()
-
-        if im.dtype.type == np.float32:
-            im = (im - im.min()) / (im.max() - im.min())
-            im = (im * np.iinfo(np.int16).max).astype(np.int16)
-
-        file_path = join_filepath([output_dir, os.path.basename(file_path)])
-        tifffile.imwrite(file_path, im)
-
-        data_path_list.append(os.path.dirname(file_path))
-        data_name_list.append(os.path.basename(file_path))
+    data_path_list = [os.path.dirname(file_path) for file_path in image.path]
+    data_name_list = [os.path.basename(file_path) for file_path in image.path]
 
     logger.info(data_path_list)
     logger.info(data_name_list)
@@ -64,7 +42,12 @@ def suite2p_file_convert(
     create_directory(join_filepath([ops["save_path0"], ops["save_folder"]]))
 
     # save ops.npy(parameter) and data.bin
-    ops = io.tiff_to_binary(ops.copy())
+    # NOTE: Frames are streamed from the input tiffs straight into data.bin,
+    #   without writing intermediate tiff copies (single plane, single channel).
+    ops = init_ops(ops)[0]
+    bin_path = ops["raw_file"] if ops.get("keep_movie_raw") else ops["reg_file"]
+    ops.update(Suite2pUtils.tiff_to_binary(image.path, bin_path, ops["batch_size"]))
+    np.save(ops["ops_path"], ops)
 
     info = {
         "meanImg": ImageData(
@@ -10,7 +10,8 @@ logger = AppLogger.get_logger()
 def suite2p_registration(
     ops: Suite2pData, output_dir: str, params: dict = None, **kwargs
 ) -> dict(ops=Suite2pData, mc_images=ImageData):
-    from suite2p import default_ops, io, registration
+    import numpy as np
+    from suite2p import default_ops, registration
 
     function_id = ExptOutputPathIds(output_dir).function_id
     logger.info("start suite2p registration: %s", function_id)
@@ -35,9 +36,13 @@ def suite2p_registration(
     if ops.get("do_regmetrics", True) and ops["nframes"] >= 1500:
         ops = registration.get_pc_metrics(ops)
 
-    mv = io.BinaryFile(
-        Lx=ops["Lx"], Ly=ops["Ly"], read_filename=ops["reg_file"]
-    ).data.copy()
+    # Expose the registered movie from data.bin, without loading it in memory.
+    mv = np.memmap(
+        ops["reg_file"],
+        mode="r",
+        dtype=np.int16,
+        shape=(ops["nframes"], ops["Ly"], ops["Lx"]),
+    )
 
     info = {
         "refImg": ImageData(ops["refImg"], output_dir=output_dir, file_name="refImg"),
@@ -0,0 +1,106 @@
+from typing import Iterator, List
+
+import numpy as np
+import tifffile
+
+
+class Suite2pUtils:
+    """
+    Utility functions for Suite2p
+    """
+
+    @staticmethod
+    def iter_tiff_frames(file_path: str, batch_size: int) -> Iterator[np.ndarray]:
+        """
+        Yields (frames, Ly, Lx) blocks of the tiff, at most `batch_size` frames each.
+        """
+        try:
+            # Uncompressed contiguous tiffs (incl. ImageJ hyperstacks) are sliced
+            #   from a file-backed view.
+            images = tifffile.memmap(file_path, mode="r")
+            if images.ndim < 3:
+                images = images[np.newaxis]
+
+            for ix in range(0, images.shape[0], batch_size):
+                yield np.array(images[ix : ix + batch_size])
+        except ValueError:
+            with tifffile.TiffFile(file_path) as tif:
+                n_pages = len(tif.pages)
+                for ix in range(0, n_pages, batch_size):
+                    im = tif.asarray(key=range(ix, min(ix + batch_size, n_pages)))
+                    if im.ndim < 3:
+                        im = im[np.newaxis]
+                    yield im
+
+    @staticmethod
+    def to_int16(im: np.ndarray, value_range: tuple = None) -> np.ndarray:
+        """
+        Same conversion as suite2p.io.tiff_to_binary.
+        *float32 frames are first normalized by the value range of the whole file.
+        """
+        if im.dtype.type == np.float32:
+            vmin, vmax = value_range
+            im = (im - vmin) / (vmax - vmin)
+            im = im * np.iinfo(np.int16).max
+
+        if im.dtype.type in (np.uint16, np.int32):
+            return (im // 2).astype(np.int16)
+        elif im.dtype.type != np.int16:
+            return im.astype(np.int16)
+        return im
+
+    @classmethod
+    def tiff_to_binary(
+        cls, file_paths: List[str], bin_path: str, batch_size: int = 500
+    ) -> dict:
+        """
+        Streams frames of the tiffs straight into a suite2p binary
+          (single plane, single channel), without intermediate tiff copies.
+
+        Returns the ops fields which suite2p.io.tiff_to_binary sets.
+        """
+        nframes = 0
+        frames_per_file = np.zeros((len(file_paths),), dtype=int)
+        meanImg = None
+
+        with open(bin_path, "wb") as bin_file:
+            for ik, file_path in enumerate(file_paths):
+                value_range = None
+                with tifffile.TiffFile(file_path) as tif:
+                    is_float32 = tif.pages[0].dtype == np.float32
+                if is_float32:
+                    value_range = cls.__get_value_range(file_path, batch_size)
+
+                for im in cls.iter_tiff_frames(file_path, batch_size):
+                    im = cls.to_int16(im, value_range)
+
+                    bin_file.write(bytearray(im))
+                    if meanImg is None:
+                        meanImg = np.zeros(im.shape[1:], np.float32)
+                    meanImg += im.astype(np.float32).sum(axis=0)
+                    nframes += im.shape[0]
+                    frames_per_file[ik] += im.shape[0]
+
+        Ly, Lx = meanImg.shape
+
+        return {
+            "filelist": list(file_paths),
+            "first_tiffs": np.eye(1, len(file_paths), dtype=bool)[0],
+            "frames_per_folder": np.array([nframes], np.int32),
+            "frames_per_file": frames_per_file,
+            "nframes": nframes,
+            "meanImg": meanImg / nframes,
+            "Ly": Ly,
+            "Lx": Lx,
+            "yrange": np.array([0, Ly]),
+            "xrange": np.array([0, Lx]),
+        }
+
+    @classmethod
+    def __get_value_range(cls, file_path: str, batch_size: int) -> tuple:
+        vmin, vmax = np.inf, -np.inf
+        for im in cls.iter_tiff_frames(file_path, batch_size):
+            vmin = min(vmin, im.min())
+            vmax = max(vmax, im.max())
+
+        return np.float32(vmin), np.float32(vmax)
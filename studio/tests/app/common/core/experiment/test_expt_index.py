@@ -0,0 +1,141 @@
+import os
+import shutil
+import time
+from dataclasses import asdict
+from glob import glob
+
+import pytest
+
+from studio.app.common.core.experiment.experiment_index import ExptConfigIndex
+from studio.app.common.core.experiment.experiment_reader import ExptConfigReader
+from studio.app.common.core.experiment.experiment_writer import ExptConfigWriter
+from studio.app.common.core.utils.filepath_creater import join_filepath
+from studio.app.common.core.workflow.workflow import NodeRunStatus
+from studio.app.dir_path import DIRPATH
+
+workspace_id = "expt_index_test"
+workspace_dirpath = join_filepath([DIRPATH.OUTPUT_DIR, workspace_id])
+
+
+def create_experiment(unique_id: str, name: str, started_at: str, success: str):
+    ExptConfigWriter._write_raw(
+        workspace_id,
+        unique_id,
+        {
+            "workspace_id": workspace_id,
+            "unique_id": unique_id,
+            "name": name,
+            "started_at": started_at,
+            "finished_at": None,
+            "success": success,
+            "hasNWB": False,
+            "function": {},
+            "nwb": {},
+            "snakemake": {
+                "use_conda": False,
+                "cores": 1,
+                "forceall": False,
+                "forcetargets": False,
+                "lock": False,
+            },
+        },
+    )
+
+
+@pytest.fixture
+def workspace_dir():
+    shutil.rmtree(workspace_dirpath, ignore_errors=True)
+    yield workspace_dirpath
+    shutil.rmtree(workspace_dirpath, ignore_errors=True)
+
+
+def test_ExptConfigIndex(workspace_dir):
+    create_experiment("a", "Alpha", "2024-01-01 00:00:00", NodeRunStatus.SUCCESS.value)
+    create_experiment("b", "beta", "2024-01-03 00:00:00", NodeRunStatus.ERROR.value)
+    create_experiment("c", "Gamma", "2024-01-02 00:00:00", NodeRunStatus.SUCCESS.value)
+
+    expt_index = ExptConfigIndex(workspace_id).refresh()
+    assert os.path.exists(expt_index.index_path)
+    assert expt_index.search() == ["b", "c", "a"]
+    assert expt_index.search(sort_field="name", desc=False) == ["a", "b", "c"]
+    assert expt_index.search(name="A") == ["b", "c", "a"]
+    assert expt_index.search(success=NodeRunStatus.SUCCESS.value) == ["c", "a"]
+    assert expt_index.get_config("a") == ExptConfigReader.read(workspace_id, "a")
+
+    with pytest.raises(ValueError):
+        expt_index.search(sort_field="unknown")
+
+    # updated, removed and invalid experiments are reflected on refresh
+    ExptConfigWriter._write_raw(
+        workspace_id,
+        "a",
+        {**asdict(ExptConfigReader.read(workspace_id, "a")), "name": "Renamed"},
+    )
+    shutil.rmtree(join_filepath([workspace_dir, "b"]))
+    ExptConfigWriter._write_raw(workspace_id, "d", {"workspace_id": workspace_id})
+
+    expt_index = ExptConfigIndex(workspace_id).refresh()
+    assert expt_index.search() == ["c", "a"]
+    assert expt_index.search(valid_only=False) == ["c", "a"]
+    assert expt_index.get_config("a").name == "Renamed"
+    assert expt_index.get_config("d") is None
+
+
+def test_get_experiments_page(client, workspace_dir):
+    for i in range(5):
+        create_experiment(
+            f"expt_{i}",
+            f"Experiment {i}",
+            f"2024-01-0{i + 1} 00:00:00",
+            NodeRunStatus.SUCCESS.value,
+        )
+
+    response = client.get(
+        f"/experiments/page/{workspace_id}",
+        params={"offset": 1, "limit": 2},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 5
+    assert [item["unique_id"] for item in data["items"]] == ["expt_3", "expt_2"]
+    assert data["items"][0]["is_remote_synced"]
+
+    response = client.get(
+        f"/experiments/page/{workspace_id}",
+        params={"sort": ["name", "asc"], "name": "ment 4"},
+    )
+    assert [item["unique_id"] for item in response.json()["items"]] == ["expt_4"]
+
+    response = client.get(
+        f"/experiments/page/{workspace_id}", params={"sort": ["unknown", "asc"]}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.heavier_processing
+@pytest.mark.parametrize("num_experiments", [100, 1000])
+def test_list_benchmark(workspace_dir, num_experiments):
+    for i in range(num_experiments):
+        create_experiment(
+            f"expt_{i}", f"Experiment {i}", "2024-01-01 00:00:00", "success"
+        )
+
+    start = time.perf_counter()
+    for path in glob(ExptConfigReader.get_config_yaml_wild_path(workspace_id)):
+        ExptConfigReader.read_from_path(path)
+    glob_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ExptConfigIndex(workspace_id).refresh()
+    build_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expt_index = ExptConfigIndex(workspace_id).refresh()
+    expt_index.get_configs(expt_index.search()[:50])
+    page_elapsed = time.perf_counter() - start
+
+    assert page_elapsed < glob_elapsed
+    print(
+        f"{num_experiments} experiments: parse all {glob_elapsed:.3f}s, "
+        f"build index {build_elapsed:.3f}s, indexed page {page_elapsed:.3f}s"
+    )
@@ -0,0 +1,191 @@
+import os
+import pickle
+import shutil
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from studio.app import wrappers
+from studio.app.common.core.rules.runner import Runner
+from studio.app.common.core.snakemake.smk import Rule
+from studio.app.common.core.utils.pickle_handler import PickleReader, PickleWriter
+from studio.app.common.core.workflow.workflow_params import get_typecheck_params
+from studio.app.common.core.wrapper_registry import WrapperRegistry
+from studio.app.dir_path import DIRPATH
+from studio.app.optinist.core.nwb.nwb import NWBDATASET
+from studio.app.optinist.dataclass import FluoData
+
+workspace_id = "default"
+unique_id = "runner_test"
+function_id = "sum3_0"
+
+output_dirpath = f"{DIRPATH.OUTPUT_DIR}/{workspace_id}/{unique_id}"
+input_node_ids = ["input_0", "input_1", "input_2"]
+
+
+def sum3(fluo_0, fluo_1, fluo_2, output_dir, params=None, nwbfile=None):
+    return {"fluo": FluoData(fluo_0.data[:10] + fluo_1.data[:10] + fluo_2.data[:10])}
+
+
+def scale_inplace(fluo_0, fluo_1, fluo_2, output_dir, params=None, nwbfile=None):
+    fluo_0.data[:10] = 5.0
+    return {"fluo": fluo_0}
+
+
+test_wrapper_dict = {
+    "sum3": {"function": sum3},
+    "scale_inplace": {"function": scale_inplace},
+}
+
+
+def create_inputs(n_bytes: int, legacy: bool = False) -> list:
+    shutil.rmtree(output_dirpath, ignore_errors=True)
+    nwb_input = get_typecheck_params({}, "nwb")
+
+    input_paths = []
+    for i, node_id in enumerate(input_node_ids):
+        fluo = FluoData(np.random.rand(100, n_bytes // 8 // 100))
+        info = {
+            f"fluo_{i}": fluo,
+            "nwbfile": {
+                "input": nwb_input,
+                node_id: {NWBDATASET.POSTPROCESS: {node_id: {"data": fluo.data}}},
+            },
+        }
+
+        input_path = f"{output_dirpath}/{node_id}/{node_id}.pkl"
+        if legacy:
+            os.makedirs(os.path.dirname(input_path))
+            with open(input_path, "wb") as f:
+                pickle.dump(info, f)
+        else:
+            PickleWriter.write(input_path, info)
+        input_paths.append(input_path)
+
+    return input_paths
+
+
+def run_rule(input_paths: list, name: str = "sum3") -> str:
+    rule = Rule(
+        input=input_paths,
+        return_arg={
+            f"fluo_{i}:{node_id}": f"fluo_{i}"
+            for i, node_id in enumerate(input_node_ids)
+        },
+        params={},
+        output=f"{output_dirpath}/{function_id}/{name}.pkl",
+        type=name,
+        path=f"runner_test/{name}",
+    )
+    # Note: the output directory is created by snakemake.
+    os.makedirs(os.path.dirname(rule.output), exist_ok=True)
+    Runner.run(rule, [], "")
+
+    return rule.output
+
+
+@pytest.fixture
+def test_wrapper(monkeypatch):
+    monkeypatch.setitem(wrappers.wrapper_dict, "runner_test", test_wrapper_dict)
+    WrapperRegistry.clear()
+    yield
+    monkeypatch.undo()
+    WrapperRegistry.clear()
+
+
+def test_run_multiple_inputs(test_wrapper):
+    input_paths = create_inputs(2 * 1024**2)
+    inputs = [PickleReader.read(path) for path in input_paths]
+
+    output = PickleReader.read(run_rule(input_paths))
+    assert isinstance(output, dict), output
+
+    expected = sum(info[f"fluo_{i}"].data[:10] for i, info in enumerate(inputs))
+    assert np.allclose(output["fluo"].data, expected)
+
+    # arrays of the upstream results in nwbfile are linked, not copied
+    for i, node_id in enumerate(input_node_ids):
+        data = output["nwbfile"][node_id][NWBDATASET.POSTPROCESS][node_id]["data"]
+        assert np.array_equal(data, inputs[i][f"fluo_{i}"].data)
+        assert os.path.samefile(data.filename, inputs[i][f"fluo_{i}"].data.filename)
+    assert "input" in output["nwbfile"]
+    assert os.path.exists(f"{output_dirpath}/{function_id}/sum3.nwb")
+
+    del inputs, output
+    shutil.rmtree(output_dirpath, ignore_errors=True)
+
+
+def test_run_inplace_change(test_wrapper):
+    input_paths = create_inputs(2 * 1024**2)
+    input_data = PickleReader.read(input_paths[0])["fluo_0"].data
+
+    output = PickleReader.read(run_rule(input_paths, name="scale_inplace"))
+    assert isinstance(output, dict), output
+
+    # the input changed (copy-on-write) by the function is saved as changed
+    assert np.all(output["fluo"].data[:10] == 5.0)
+    assert np.array_equal(output["fluo"].data[10:], input_data[10:])
+    assert not os.path.samefile(output["fluo"].data.filename, input_data.filename)
+
+    # the upstream results in nwbfile are kept (and linked) as they were
+    data = output["nwbfile"]["input_0"][NWBDATASET.POSTPROCESS]["input_0"]["data"]
+    assert np.array_equal(data, input_data)
+    assert os.path.samefile(data.filename, input_data.filename)
+
+    del input_data, output, data
+    shutil.rmtree(output_dirpath, ignore_errors=True)
+
+
+RUN_RULE_SCRIPT = """
+import sys, time
+
+sys.path.insert(0, sys.argv[1])
+from test_runner import run_rule, test_wrapper_dict
+from studio.app.common.core.workflow.workflow_node_metrics import WorkflowNodeMetrics
+from studio.app.wrappers import wrapper_dict
+
+wrapper_dict["runner_test"] = test_wrapper_dict
+
+# Note: the peak RSS of this process itself (ru_maxrss is inherited from pytest).
+start_rss = WorkflowNodeMetrics.get_peak_rss()
+start = time.time()
+run_rule(sys.argv[2:])
+elapsed = time.time() - start
+max_rss = WorkflowNodeMetrics.get_peak_rss()
+print(elapsed, (max_rss - start_rss) / 1024**2)
+"""
+
+
+def measure_run_rule(input_paths: list):
+    result = subprocess.run(
+        [sys.executable, "-c", RUN_RULE_SCRIPT, os.path.dirname(__file__)]
+        + input_paths,
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": DIRPATH.ROOT_DIR},
+    )
+    elapsed, max_rss_mb = result.stdout.split()[-2:]
+
+    output = PickleReader.read(f"{output_dirpath}/{function_id}/sum3.pkl")
+    assert isinstance(output, dict), output
+
+    return float(elapsed), float(max_rss_mb)
+
+
+@pytest.mark.heavier_processing
+def test_run_benchmark():
+    n_bytes = int(os.environ.get("RUNNER_BENCHMARK_BYTES", 1024**3))
+
+    legacy_time, legacy_rss = measure_run_rule(create_inputs(n_bytes, legacy=True))
+    new_time, new_rss = measure_run_rule(create_inputs(n_bytes))
+    shutil.rmtree(output_dirpath, ignore_errors=True)
+
+    print(
+        f"Runner.run (3 inputs x {n_bytes / 1024**2:.0f}MB): "
+        f"legacy inputs {legacy_time:.2f}s / +{legacy_rss:.0f}MB rss, "
+        f"new {new_time:.2f}s / +{new_rss:.0f}MB rss"
+    )
+    assert new_rss < legacy_rss
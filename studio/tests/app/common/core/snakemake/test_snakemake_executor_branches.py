@@ -0,0 +1,160 @@
+import os
+import shutil
+import time
+
+import numpy as np
+import pytest
+
+from studio.app.common.core.mode import MODE
+from studio.app.common.core.snakemake.smk import SmkParam
+from studio.app.common.core.snakemake.smk_utils import SmkUtils
+from studio.app.common.core.snakemake.snakemake_executor import snakemake_execute
+from studio.app.common.core.snakemake.snakemake_reader import SmkConfigReader
+from studio.app.common.core.workflow.workflow import (
+    Edge,
+    Node,
+    NodeData,
+    NodePosition,
+    NodeType,
+    RunItem,
+)
+from studio.app.common.core.workflow.workflow_runner import WorkflowRunner
+from studio.app.common.core.workflow.workflow_status_events import WorkflowStatusEvents
+from studio.app.dir_path import DIRPATH
+
+workspace_id = "default"
+unique_id = "smk_exec_branches"
+
+input_node_id = "input_0"
+input_filename = "branches_fluo.csv"
+branches = {
+    "pca_1234": "optinist/dimension_reduction/pca",
+    "tsne_1234": "optinist/dimension_reduction/tsne",
+    "correlation_1234": "optinist/neural_population_analysis/correlation",
+}
+
+output_dirpath = f"{DIRPATH.OUTPUT_DIR}/{workspace_id}/{unique_id}"
+
+
+def create_run_item() -> RunItem:
+    nodeDict = {
+        input_node_id: Node(
+            id=input_node_id,
+            type=NodeType.FLUO,
+            data=NodeData(
+                label=input_filename,
+                param={"setHeader": None, "setIndex": False, "transpose": False},
+                path=input_filename,
+                type="input",
+                fileType="csv",
+            ),
+            position=NodePosition(x=0, y=0),
+            style={},
+        ),
+    }
+    edgeDict = {}
+    for node_id, path in branches.items():
+        nodeDict[node_id] = Node(
+            id=node_id,
+            type=NodeType.ALGO,
+            data=NodeData(label=path.split("/")[-1], param={}, path=path, type=""),
+            position=NodePosition(x=0, y=0),
+            style={},
+        )
+        edgeDict[f"edge_{node_id}"] = Edge(
+            id=f"edge_{node_id}",
+            type="buttonedge",
+            animated=False,
+            source=input_node_id,
+            sourceHandle=f"{input_node_id}--fluo--FluoData",
+            target=node_id,
+            targetHandle=f"{node_id}--neural_data--FluoData",
+            style={},
+        )
+
+    return RunItem(
+        name="branches",
+        nodeDict=nodeDict,
+        edgeDict=edgeDict,
+        snakemakeParam={},
+        nwbParam={},
+        forceRunList=[],
+    )
+
+
+@pytest.fixture
+def fluo_input():
+    input_dirpath = f"{DIRPATH.INPUT_DIR}/{workspace_id}"
+    os.makedirs(input_dirpath, exist_ok=True)
+    input_path = f"{input_dirpath}/{input_filename}"
+    np.savetxt(
+        input_path,
+        np.random.default_rng(0).random((2000, 100)),
+        delimiter=",",
+    )
+    yield input_path
+    os.remove(input_path)
+    shutil.rmtree(output_dirpath, ignore_errors=True)
+
+
+def run_branches(cores: int) -> float:
+    shutil.rmtree(output_dirpath, ignore_errors=True)
+    runner = WorkflowRunner("", workspace_id, unique_id, create_run_item())
+    runner.set_smk_config()
+
+    smk_param = SmkParam(
+        use_conda=False,
+        cores=cores,
+        forceall=True,
+        forcetargets=True,
+        lock=False,
+        mem_mb=runner.mem_mb,
+    )
+
+    start = time.time()
+    snakemake_execute(workspace_id, unique_id, smk_param)
+    elapsed = time.time() - start
+
+    for node_id, path in branches.items():
+        pkl_path = f"{output_dirpath}/{node_id}/{path.split('/')[-1]}.pkl"
+        assert os.path.exists(pkl_path), "Workflow pickle not found"
+
+    return elapsed
+
+
+def test_branch_resources():
+    runner = WorkflowRunner("", workspace_id, unique_id, create_run_item())
+    runner.set_smk_config()
+
+    rules = SmkConfigReader.read(workspace_id, unique_id)["rules"]
+    for rule in rules.values():
+        assert SmkUtils.threads(rule) >= 1
+        assert 0 < SmkUtils.mem_mb(rule) <= runner.mem_mb
+
+    assert SmkUtils.get_wrapper_resources("caiman/caiman_cnmf")["mem_mb"] == 8000
+    assert SmkUtils.get_wrapper_resources("unknown/path") == SmkUtils.DEFAULT_RESOURCES
+
+    shutil.rmtree(output_dirpath, ignore_errors=True)
+
+
+@pytest.mark.heavier_processing
+def test_branches_benchmark(client, fluo_input):
+    # Force running in standalone-mode
+    MODE.reset_mode(is_standalone=True)
+
+    serial_time = run_branches(cores=1)
+    parallel_time = run_branches(cores=len(branches))
+
+    print(
+        f"fan-out workflow ({len(branches)} branches): "
+        f"1 core {serial_time:.1f}s, {len(branches)} cores {parallel_time:.1f}s "
+        f"({os.cpu_count()} cpus)"
+    )
+
+    # all branches are started before the first one has finished
+    events, _ = WorkflowStatusEvents.read(workspace_id, unique_id, 0)
+    statuses = [e["status"] for e in events if e["node_id"] in branches]
+    assert statuses[: len(branches)] == ["running"] * len(branches)
+
+    if os.cpu_count() >= len(branches):
+        assert parallel_time < serial_time
@@ -0,0 +1,139 @@
+import os
+import shutil
+from typing import Dict
+
+import pytest
+
+from studio.app.common.core.metrics import Counter, Gauge, Histogram, MetricsRegistry
+from studio.app.common.core.storage.mock_storage_controller import MockStorageController
+from studio.app.common.core.utils.filepath_creater import join_filepath
+from studio.app.common.core.workspace.workspace_chunked_upload import (
+    WorkspaceChunkedUpload,
+)
+from studio.app.dir_path import DIRPATH
+
+workspace_id = "metrics_test"
+filename = "metrics_upload.tif"
+
+CHUNK_BYTES = 1024
+data = os.urandom(CHUNK_BYTES * 2 + 100)
+
+
+@pytest.fixture
+def mock_storage_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("REMOTE_STORAGE_TYPE", "1")
+    monkeypatch.setattr(MockStorageController, "MOCK_INPUT_DIR", f"{tmp_path}/input")
+    monkeypatch.setattr(MockStorageController, "MOCK_OUTPUT_DIR", f"{tmp_path}/output")
+    monkeypatch.setattr(
+        MockStorageController, "MOCK_MULTIPART_DIR", f"{tmp_path}/multipart"
+    )
+    monkeypatch.setattr(WorkspaceChunkedUpload, "MIN_CHUNK_BYTES", CHUNK_BYTES)
+
+    workspace_dir = join_filepath([DIRPATH.INPUT_DIR, workspace_id])
+    shutil.rmtree(workspace_dir, ignore_errors=True)
+    yield tmp_path
+    shutil.rmtree(workspace_dir, ignore_errors=True)
+
+
+def scrape(client) -> Dict[str, float]:
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == MetricsRegistry.CONTENT_TYPE
+
+    samples = {}
+    for line in response.text.splitlines():
+        if line and not line.startswith("#"):
+            sample, value = line.rsplit(" ", 1)
+            samples[sample] = float(value)
+    return samples
+
+
+def test_metrics_format():
+    registry = MetricsRegistry()
+    counter = Counter("test_total", "Test counter.", ["kind"], registry=registry)
+    histogram = Histogram(
+        "test_seconds", "Test histogram.", buckets=[0.1, 1], registry=registry
+    )
+    gauge = Gauge("test_gauge", "Test gauge.", registry=registry)
+
+    counter.inc(kind='a"b')
+    counter.inc(2, kind='a"b')
+    for value in [0.05, 0.5, 5]:
+        histogram.observe(value)
+    gauge.set_function(lambda: 3)
+
+    lines = registry.generate_latest().splitlines()
+    assert lines[:3] == [
+        "# HELP test_total Test counter.",
+        "# TYPE test_total counter",
+        'test_total{kind="a\\"b"} 3.0',
+    ]
+    assert lines[5:10] == [
+        'test_seconds_bucket{le="0.1"} 1',
+        'test_seconds_bucket{le="1.0"} 2',
+        'test_seconds_bucket{le="+Inf"} 3',
+        "test_seconds_count 3",
+        "test_seconds_sum 5.55",
+    ]
+    assert lines[-1] == "test_gauge 3.0"
+
+    with pytest.raises(ValueError):
+        counter.inc(unknown="a")
+    with pytest.raises(ValueError):
+        Counter("test_total", "Duplicated counter.", registry=registry)
+
+
+def test_metrics_endpoint(client, mock_storage_dir):
+    before = scrape(client)
+
+    # synthetic traffic
+    for _ in range(3):
+        assert client.get("/health").status_code == 200
+    assert client.get(f"/run/queue/{workspace_id}/unknown").status_code == 404
+    for offset in range(0, len(data), CHUNK_BYTES):
+        response = client.post(
+            f"/files/{workspace_id}/upload/{filename}/chunk",
+            params={"offset": offset, "total": len(data)},
+            files={"file": (filename, data[offset : offset + CHUNK_BYTES])},
+        )
+        assert response.status_code == 200
+    assert response.json()["completed"]
+
+    after = scrape(client)
+
+    def delta(sample: str) -> float:
+        return after.get(sample, 0) - before.get(sample, 0)
+
+    # request count and latency per route
+    assert (
+        delta('optinist_http_requests_total{method="GET",route="/health",status="200"}')
+        == 3
+    )
+    assert (
+        delta(
+            'optinist_http_requests_total{method="GET",'
+            'route="/run/queue/{workspace_id}/{uid}",status="404"}'
+        )
+        == 1
+    )
+    assert (
+        delta(
+            'optinist_http_request_duration_seconds_count{method="POST",'
+            'route="/files/{workspace_id}/upload/{filename}/chunk"}'
+        )
+        == 3
+    )
+
+    # files, storage and file lock metrics
+    assert delta('optinist_file_upload_bytes_total{method="chunk"}') == len(data)
+    assert delta(
+        'optinist_remote_storage_transfer_bytes_total{direction="upload"}'
+    ) == len(data)
+    assert (
+        delta('optinist_file_lock_wait_seconds_count{lock="workspace_file_index"}') >= 1
+    )
+
+    # workflow scheduler (queue depth and saturation)
+    assert after["optinist_workflow_queued"] == 0
+    assert after["optinist_workflow_cores_max"] >= 1
+    assert "optinist_workflow_cores_used" in after
@@ -0,0 +1,166 @@
+import time
+from glob import glob
+
+import pytest
+
+from studio.app.common.core.utils.filepath_creater import join_filepath
+from studio.app.common.core.utils.filepath_finder import (
+    find_condaenv_filepath,
+    find_filepath,
+    find_param_filepath,
+)
+from studio.app.common.core.workflow.workflow import (
+    Edge,
+    Node,
+    NodeData,
+    NodePosition,
+    NodeType,
+    RunItem,
+)
+from studio.app.common.core.workflow.workflow_params import get_default_params
+from studio.app.common.core.workflow.workflow_runner import WorkflowRunner
+from studio.app.common.core.wrapper_registry import WrapperRegistry
+from studio.app.dir_path import DIRPATH
+from studio.app.wrappers import wrapper_dict
+
+workspace_id = "default"
+unique_id = "wrapper_registry_test"
+
+wrapper_paths = [
+    "optinist/dimension_reduction/pca",
+    "optinist/dimension_reduction/tsne",
+    "optinist/neural_population_analysis/correlation",
+]
+
+
+def create_run_item(n_nodes: int) -> RunItem:
+    input_node_id = "input_0"
+    nodeDict = {
+        input_node_id: Node(
+            id=input_node_id,
+            type=NodeType.FLUO,
+            data=NodeData(
+                label="fluo.csv",
+                param={},
+                path="fluo.csv",
+                type="input",
+                fileType="csv",
+            ),
+            position=NodePosition(x=0, y=0),
+            style={},
+        ),
+    }
+    edgeDict = {}
+    for i in range(n_nodes):
+        path = wrapper_paths[i % len(wrapper_paths)]
+        node_id = f"{path.split('/')[-1]}_{i}"
+        nodeDict[node_id] = Node(
+            id=node_id,
+            type=NodeType.ALGO,
+            data=NodeData(label=path.split("/")[-1], param={}, path=path, type=""),
+            position=NodePosition(x=0, y=0),
+            style={},
+        )
+        edgeDict[f"edge_{node_id}"] = Edge(
+            id=f"edge_{node_id}",
+            type="buttonedge",
+            animated=False,
+            source=input_node_id,
+            sourceHandle=f"{input_node_id}--fluo--FluoData",
+            target=node_id,
+            targetHandle=f"{node_id}--neural_data--FluoData",
+            style={},
+        )
+
+    return RunItem(
+        name="wrapper_registry",
+        nodeDict=nodeDict,
+        edgeDict=edgeDict,
+        snakemakeParam={},
+        nwbParam={},
+        forceRunList=[],
+    )
+
+
+def test_find_filepath():
+    for category, name in [("params", "suite2p_roi"), ("conda", "suite2p")]:
+        filepaths = glob(
+            join_filepath(
+                [DIRPATH.APP_DIR, "*", "wrappers", "**", category, f"{name}.yaml"]
+            ),
+            recursive=True,
+        )
+        assert find_filepath(name, category) == filepaths[0]
+
+    assert find_param_filepath("suite2p_roi.yaml") == find_filepath(
+        "suite2p_roi", "params"
+    )
+    assert find_condaenv_filepath("unknown") is None
+
+
+def test_wrapper_registry():
+    WrapperRegistry.clear()
+
+    wrapper = WrapperRegistry.get_wrapper("suite2p/suite2p_roi")
+    assert wrapper is wrapper_dict["suite2p"]["suite2p_roi"]
+    with pytest.raises(KeyError):
+        WrapperRegistry.get_wrapper("suite2p/unknown")
+
+    signature = WrapperRegistry.get_signature("suite2p/suite2p_roi")
+    assert "output_dir" in signature.parameters
+    assert WrapperRegistry.get_signature("suite2p/suite2p_roi") is signature
+
+    assert WrapperRegistry.get_conda_env_filepath("suite2p") == find_condaenv_filepath(
+        "suite2p"
+    )
+
+    WrapperRegistry.clear()
+    assert WrapperRegistry.get_signature("suite2p/suite2p_roi") is not signature
+
+
+def test_default_params():
+    params = get_default_params("suite2p_roi")
+    assert params
+
+    # default params are shared by the callers, so a copy is returned
+    params.clear()
+    assert get_default_params("suite2p_roi")
+    assert get_default_params("unknown") == {}
+
+
+def measure(func, n_calls: int):
+    WrapperRegistry.clear()
+
+    start = time.time()
+    func()
+    cold_time = time.time() - start
+
+    start = time.time()
+    for _ in range(n_calls):
+        func()
+    warm_time = (time.time() - start) / n_calls
+
+    return cold_time, warm_time
+
+
+@pytest.mark.heavier_processing
+def test_wrapper_registry_benchmark(client):
+    n_nodes = 30
+    run_item = create_run_item(n_nodes)
+
+    def submit_workflow():
+        runner = WorkflowRunner("", workspace_id, unique_id, run_item)
+        runner.set_smk_config()
+
+    def get_algolist():
+        assert client.get("/algolist").status_code == 200
+
+    submit_cold, submit_warm = measure(submit_workflow, 5)
+    algolist_cold, algolist_warm = measure(get_algolist, 20)
+
+    print(
+        f"workflow submission ({n_nodes} nodes): "
+        f"first {submit_cold * 1000:.1f}ms, then {submit_warm * 1000:.1f}ms / "
+        f"/algolist: first {algolist_cold * 1000:.1f}ms, "
+        f"then {algolist_warm * 1000:.1f}ms"
+    )
@@ -0,0 +1,124 @@
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from studio.app.common.core.utils.csv_cache import CsvCache
+from studio.app.common.core.utils.filepath_creater import join_filepath
+from studio.app.dir_path import DIRPATH
+
+workspace_id = "csv_cache_test"
+filename = "behavior.csv"
+
+workspace_dirpath = join_filepath([DIRPATH.INPUT_DIR, workspace_id])
+csv_filepath = join_filepath([workspace_dirpath, filename])
+cache_root = join_filepath([workspace_dirpath, "behavior"])
+
+
+@pytest.fixture
+def csv_file():
+    os.makedirs(workspace_dirpath, exist_ok=True)
+    with open(csv_filepath, "w") as f:
+        f.write("time,x,label\n0,1.5,a\n1,,b\n2,3.5,\n")
+    yield csv_filepath
+    shutil.rmtree(workspace_dirpath, ignore_errors=True)
+
+
+def test_CsvCache(csv_file):
+    assert not CsvCache.is_cached(csv_file, cache_root)
+    table = CsvCache.read(csv_file, cache_root)
+    assert CsvCache.is_cached(csv_file, cache_root)
+
+    assert table.shape == (4, 3)
+    # the cells of text columns are returned as written in the file
+    assert table.get_values() == [
+        ["time", "x", "label"],
+        ["0", "1.5", "a"],
+        ["1", None, "b"],
+        ["2", "3.5", None],
+    ]
+    assert table.get_values(slice(1, 3), slice(0, 2)) == [["0", "1.5"], ["1", None]]
+    assert table.get_values(slice(0, 2), slice(2, 4), transpose=True) == [
+        ["1", "2"],
+        [None, "3.5"],
+    ]
+    expected = pd.read_csv(csv_file, header=None)
+    assert (
+        table.get_values()
+        == expected.astype(object).where(expected.notna(), None).values.tolist()
+    )
+
+    # changed files are parsed again, and the previous cache is removed
+    os.utime(csv_file, ns=(0, 0))
+    np.savetxt(csv_file, np.arange(6).reshape(2, 3), delimiter=",", fmt="%d")
+    table = CsvCache.read(csv_file, cache_root)
+    assert table.get_values() == [[0, 1, 2], [3, 4, 5]]
+    assert len(os.listdir(join_filepath([cache_root, CsvCache.CACHE_DIRNAME]))) == 1
+
+    # the cells of text columns are not parsed as numbers
+    with open(csv_file, "w") as f:
+        f.write("code\n1\n007\n1.5\n")
+    table = CsvCache.read(csv_file, cache_root)
+    assert table.get_values(transpose=True) == [["code", "1", "007", "1.5"]]
+
+
+def test_get_csv(client, csv_file):
+    np.savetxt(
+        csv_file, np.random.default_rng(0).random((20, 5)), delimiter=",", fmt="%.6f"
+    )
+
+    response = client.get(f"/outputs/csv/{filename}?workspace_id={workspace_id}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["data"] == pd.read_csv(csv_file, header=None).values.tolist()
+
+    response = client.get(
+        f"/outputs/csv/{filename}",
+        params={
+            "workspace_id": workspace_id,
+            "start_row": 2,
+            "end_row": 4,
+            "start_column": 1,
+            "end_column": 3,
+            "transpose": True,
+        },
+    )
+    data = response.json()
+    assert data["index"] == ["2", "3"]
+    assert data["columns"] == ["1", "2"]
+    assert (
+        data["data"] == pd.read_csv(csv_file, header=None).values.T[2:4, 1:3].tolist()
+    )
+
+    response = client.get(f"/outputs/csv/unknown.csv?workspace_id={workspace_id}")
+    assert response.status_code == 404
+
+
+@pytest.mark.heavier_processing
+def test_csv_preview_benchmark(client, csv_file):
+    data = np.random.default_rng(0).random((500_000, 20))
+    header = ",".join(f"column{i}" for i in range(data.shape[1]))
+    np.savetxt(csv_file, data, delimiter=",", fmt="%.6f", header=header, comments="")
+    params = {"workspace_id": workspace_id, "start_row": 0, "end_row": 1000}
+
+    start = time.perf_counter()
+    pd.read_csv(csv_file, header=None)
+    parse_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert client.get(f"/outputs/csv/{filename}", params=params).status_code == 200
+    first_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert client.get(f"/outputs/csv/{filename}", params=params).status_code == 200
+    repeat_elapsed = time.perf_counter() - start
+
+    assert repeat_elapsed < parse_elapsed
+    print(
+        f"{os.path.getsize(csv_file) / 1024 ** 2:.0f}MB csv: "
+        f"parse {parse_elapsed:.2f}s, first preview {first_elapsed:.2f}s, "
+        f"repeat preview {repeat_elapsed:.3f}s"
+    )
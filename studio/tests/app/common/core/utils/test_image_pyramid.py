@@ -0,0 +1,74 @@
+import os
+
+import numpy as np
+from PIL import Image
+
+from studio.app.common.core.utils.file_reader import JsonReader
+from studio.app.common.core.utils.image_pyramid import (
+    build_image_pyramid,
+    downsample_image,
+    get_pyramid_level,
+    get_thumbnail_path,
+    save_image_thumbnail,
+    select_image_pyramid_level,
+)
+from studio.app.common.dataclass.image import ImageData
+from studio.app.dir_path import DIRPATH
+
+output_dir = f"{DIRPATH.OUTPUT_DIR}/default/image_pyramid_test"
+
+
+def test_downsample_image():
+    data = np.arange(4 * 6, dtype=np.uint16).reshape(4, 6)
+
+    downsampled = downsample_image(data, 2)
+    assert downsampled.dtype == np.uint16
+    np.testing.assert_array_equal(
+        downsampled, [[4, 6, 8], [16, 18, 20]]  # rint of the 2x2 block means
+    )
+
+    levels = build_image_pyramid(np.zeros((1000, 600)))
+    assert [x.shape for x in levels] == [(500, 300), (250, 150)]
+    assert get_pyramid_level((1000, 600), 300) == 1
+    assert get_pyramid_level((1000, 600), None) == 0
+
+
+def test_image_data_pyramid():
+    data = np.random.rand(1024, 768).astype(np.float32)
+    image = ImageData(data, output_dir=output_dir, file_name="mean_image")
+    image.save_json(output_dir)
+
+    level0 = JsonReader.read_as_output(image.json_path)
+    assert np.array(level0.data[0]).shape == (1024, 768)
+
+    level_path = select_image_pyramid_level(image.json_path, 300)
+    assert level_path.endswith("mean_image.level1.json")
+    level1 = JsonReader.read_as_output(level_path)
+    np.testing.assert_allclose(
+        level1.data[0], downsample_image(data, 2), rtol=1e-6, atol=1e-6
+    )
+
+    with Image.open(get_thumbnail_path(image.json_path)) as thumbnail:
+        assert max(thumbnail.size) == 128
+
+
+def test_narrow_image():
+    os.makedirs(output_dir, exist_ok=True)
+    for shape in [(1000, 3), (3, 1000), (1000, 1)]:
+        levels = build_image_pyramid(np.zeros(shape))
+        assert all(min(x.shape) >= 1 for x in levels)
+
+        thumbnail_path = f"{output_dir}/narrow.thumb.png"
+        save_image_thumbnail(thumbnail_path, np.random.rand(*shape))
+        with Image.open(thumbnail_path) as thumbnail:
+            assert max(thumbnail.size) <= 128
+            assert min(thumbnail.size) >= 1
+
+    image = ImageData(
+        np.random.rand(1000, 3), output_dir=output_dir, file_name="narrow"
+    )
+    image.save_json(output_dir)
+    assert np.array(JsonReader.read_as_output(image.json_path).data[0]).shape == (
+        1000,
+        3,
+    )
@@ -0,0 +1,119 @@
+import os
+import pickle
+import tracemalloc
+
+import numpy as np
+import tifffile
+
+from studio.app.common.core.utils.filepath_creater import create_directory
+from studio.app.common.core.utils.memmap_handler import MemmapReader
+from studio.app.common.dataclass import ImageData
+from studio.app.dir_path import DIRPATH
+from studio.app.optinist.dataclass import EditRoiData
+
+workspace_id = "default"
+unique_id = "memmap_test"
+
+output_dir = f"{DIRPATH.OUTPUT_DIR}/{workspace_id}/{unique_id}/caiman_mc"
+
+T, d1, d2 = 120, 64, 48
+
+
+def create_memmap(file_name, frames, dims):
+    """
+    Write a movie in the same layout as caiman.save_memmap(order="C")
+    """
+    create_directory(f"{output_dir}/mmap")
+    mmap_path = (
+        f"{output_dir}/mmap/{file_name}"
+        f"_d1_{dims[0]}_d2_{dims[1]}_d3_1_order_C_frames_{frames}.mmap"
+    )
+    movie = np.random.rand(frames, *dims).astype(np.float32)
+    Yr = np.memmap(
+        mmap_path, mode="w+", dtype=np.float32, shape=(np.prod(dims), frames)
+    )
+    Yr[:] = movie.reshape((frames, -1), order="F").T
+    Yr.flush()
+    del Yr
+
+    return mmap_path, movie
+
+
+def test_MemmapReader_read():
+    mmap_path, movie = create_memmap("Yr", T, (d1, d2))
+
+    assert MemmapReader.is_memmap_file(mmap_path)
+    assert not MemmapReader.is_memmap_file(f"{output_dir}/image.tif")
+    assert MemmapReader.parse_layout(mmap_path) == ((d1, d2), T, "C")
+
+    images = MemmapReader.read(mmap_path)
+    assert isinstance(images, np.memmap)
+    assert images.shape == (T, d1, d2)
+    np.testing.assert_array_equal(images, movie)
+
+    blocks = list(MemmapReader.iter_frames(mmap_path, chunk_bytes=d1 * d2 * 4 * 50))
+    assert [len(b) for b in blocks] == [50, 50, 20]
+    np.testing.assert_array_equal(np.concatenate(blocks), movie)
+
+    # movies are written through the (frames, *dims) view
+    mmap_path = MemmapReader.get_filepath(f"{output_dir}/mmap", "movie", movie.shape)
+    assert MemmapReader.parse_layout(mmap_path) == ((d1, d2), T, "F")
+    images = MemmapReader.read(mmap_path, mode="w+")
+    images[:] = movie
+    images.flush()
+    del images
+    np.testing.assert_array_equal(MemmapReader.read(mmap_path), movie)
+
+
+def test_ImageData_from_memmap():
+    mmap_path, movie = create_memmap("mc", T, (d1, d2))
+
+    image = ImageData(mmap_path, output_dir=output_dir, file_name="mc_images")
+
+    assert image.mmap_path == mmap_path
+    assert image.memmap.shape == (T, d1, d2)
+    assert image.output_path.max_index == T
+    np.testing.assert_array_equal(image.data, movie)
+
+    # the tiff for viewers is memory-mappable as well
+    assert tifffile.memmap(image.path[0], mode="r").shape == (T, d1, d2)
+
+
+def test_ImageData_from_memmap_peak_memory():
+    frames = 1000
+    mmap_path, movie = create_memmap("mc_large", frames, (d1, d2))
+    movie_bytes = movie.nbytes
+    del movie
+
+    chunk_bytes = MemmapReader.CHUNK_BYTES
+    MemmapReader.CHUNK_BYTES = movie_bytes // 10
+    try:
+        tracemalloc.start()
+        image = ImageData(mmap_path, output_dir=output_dir, file_name="mc_large")
+        image.output_path
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        MemmapReader.CHUNK_BYTES = chunk_bytes
+
+    print(f"movie: {movie_bytes / 1024**2:.1f} MiB, peak: {peak / 1024**2:.1f} MiB")
+    assert peak < movie_bytes / 4
+
+
+def test_EditRoiData_pickle_memmap_reference():
+    mmap_path, movie = create_memmap("cnmf", T, (d1, d2))
+    im = np.zeros((2, d1, d2))
+
+    data = EditRoiData(MemmapReader.read(mmap_path), im)
+    dumped = pickle.dumps(data)
+    assert len(dumped) < movie.nbytes / 10
+
+    loaded = pickle.loads(dumped)
+    assert isinstance(loaded.images, np.memmap)
+    np.testing.assert_array_equal(loaded.images, movie)
+
+    # in-memory images are still pickled as is
+    data = EditRoiData(np.array(movie), im)
+    os.remove(mmap_path)
+    loaded = pickle.loads(pickle.dumps(data))
+    np.testing.assert_array_equal(loaded.images, movie)
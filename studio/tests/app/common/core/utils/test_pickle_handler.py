@@ -1,7 +1,18 @@
 import os
+import pickle
+import subprocess
+import sys
 
-from studio.app.common.core.utils.pickle_handler import PickleReader, PickleWriter
+import numpy as np
+import pytest
+
+from studio.app.common.core.utils.pickle_handler import (
+    PickleReader,
+    PickleWriter,
+    get_pickle_arrays_dirpath,
+)
 from studio.app.dir_path import DIRPATH
+from studio.app.optinist.dataclass import FluoData
 
 workspace_id = "default"
 unique_id = "pickle_test"
@@ -25,3 +36,120 @@ def test_PickleReader():
     data = PickleReader.read(filepath)
 
     assert data == "abc"
+
+
+arrays_filepath = f"{DIRPATH.OUTPUT_DIR}/{workspace_id}/{unique_id}/func3/func3.pkl"
+
+
+def test_PickleWriter_arrays():
+    fluo = FluoData(np.random.rand(200, 1000), file_name="fluo")
+    small = np.arange(10)
+    PickleWriter.write(
+        arrays_filepath, {"fluo": fluo, "small": small, "same": fluo.data}
+    )
+
+    arrays_dirpath = get_pickle_arrays_dirpath(arrays_filepath)
+    (token,) = os.listdir(arrays_dirpath)
+    # the large array is saved once beside the pickle, the small one is kept in it
+    assert os.listdir(f"{arrays_dirpath}/{token}") == ["0.npy"]
+
+    data = PickleReader.read(arrays_filepath)
+    assert isinstance(data["fluo"].data, np.memmap)
+    assert np.array_equal(data["fluo"].data, fluo.data)
+    assert data["same"] is data["fluo"].data
+    assert not isinstance(data["small"], np.memmap)
+
+    # changes of the loaded arrays are not written back to the file
+    data["fluo"].data[0, 0] = -1
+    assert PickleReader.read(arrays_filepath)["fluo"].data[0, 0] == fluo.data[0, 0]
+
+    # rewrite (without loading the arrays) keeps the referenced arrays
+    PickleWriter.overwrite(arrays_filepath, {"small": small + 1})
+    data = PickleReader.read(arrays_filepath)
+    assert np.array_equal(data["fluo"].data, fluo.data)
+    assert np.array_equal(data["small"], small + 1)
+    assert os.listdir(arrays_dirpath) == [token]
+
+    # arrays of the previous contents are removed
+    PickleWriter.write(arrays_filepath, {"fluo": FluoData(fluo.data * 2)})
+    assert len(os.listdir(arrays_dirpath)) == 1
+    assert os.listdir(arrays_dirpath) != [token]
+
+    PickleWriter.write(arrays_filepath, "abc")
+    assert not os.path.exists(arrays_dirpath)
+
+
+def test_PickleWriter_copy():
+    fluo = FluoData(np.random.rand(200, 1000), file_name="fluo")
+    PickleWriter.write(arrays_filepath, {"fluo": fluo})
+    copy_filepath = f"{arrays_filepath}.orig"
+
+    # the copy is kept as is when the source pickle is rewritten
+    PickleWriter.copy(arrays_filepath, copy_filepath)
+    PickleWriter.write(arrays_filepath, {"fluo": FluoData(fluo.data * 2)})
+    data = PickleReader.read(copy_filepath)
+    assert np.array_equal(data["fluo"].data, fluo.data)
+    del data
+
+    PickleWriter.move(copy_filepath, arrays_filepath)
+    assert np.array_equal(PickleReader.read(arrays_filepath)["fluo"].data, fluo.data)
+    assert not os.path.exists(copy_filepath)
+    assert not os.path.exists(get_pickle_arrays_dirpath(copy_filepath))
+
+    PickleWriter.remove(arrays_filepath)
+    assert not os.path.exists(arrays_filepath)
+    assert not os.path.exists(get_pickle_arrays_dirpath(arrays_filepath))
+
+
+READ_INPUT_SCRIPT = """
+import sys, time
+from studio.app.common.core.rules.runner import Runner
+from studio.app.common.core.workflow.workflow_node_metrics import WorkflowNodeMetrics
+
+# Note: the peak RSS of this process itself (ru_maxrss is inherited from pytest).
+start_rss = WorkflowNodeMetrics.get_peak_rss()
+start = time.time()
+input_info = Runner.read_input_info([sys.argv[1]])
+fluo = input_info["fluo"].data
+value = float(fluo[:10].sum())  # the downstream node uses some of the cells
+elapsed = time.time() - start
+max_rss = WorkflowNodeMetrics.get_peak_rss()
+print(elapsed, (max_rss - start_rss) / 1024**2)
+"""
+
+
+def measure_read_input(filepath: str):
+    result = subprocess.run(
+        [sys.executable, "-c", READ_INPUT_SCRIPT, filepath],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": DIRPATH.ROOT_DIR},
+    )
+    elapsed, max_rss_mb = result.stdout.split()[-2:]
+    return float(elapsed), float(max_rss_mb)
+
+
+@pytest.mark.heavier_processing
+def test_read_input_benchmark():
+    n_bytes = int(os.environ.get("PICKLE_BENCHMARK_BYTES", 1024**3))
+    n_cells = 1000
+    fluo = FluoData(np.random.rand(n_cells, n_bytes // 8 // n_cells))
+    info = {"fluo": fluo, "nwbfile": {}}
+
+    PickleWriter.write(arrays_filepath, info)
+    legacy_filepath = f"{os.path.dirname(arrays_filepath)}/legacy.pkl"
+    with open(legacy_filepath, "wb") as f:
+        pickle.dump(info, f)
+    del fluo, info
+
+    legacy_time, legacy_rss = measure_read_input(legacy_filepath)
+    new_time, new_rss = measure_read_input(arrays_filepath)
+    os.remove(legacy_filepath)
+
+    print(
+        f"read_input_info ({n_bytes / 1024**2:.0f}MB result): "
+        f"legacy {legacy_time:.2f}s / +{legacy_rss:.0f}MB rss, "
+        f"new {new_time:.2f}s / +{new_rss:.0f}MB rss"
+    )
+    assert new_rss < legacy_rss
@@ -0,0 +1,70 @@
+import numpy as np
+
+from studio.app.common.core.utils.timeseries_decimator import TimeSeriesDecimator
+from studio.app.common.dataclass.timeseries import TimeSeriesData
+from studio.app.dir_path import DIRPATH
+
+output_dir = f"{DIRPATH.OUTPUT_DIR}/default/timeseries_decimator_test"
+
+n_cells, n_frames = 3, 20000
+
+
+def create_timeseries():
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(n_cells, n_frames)).cumsum(axis=1)
+    std = np.abs(rng.normal(size=(n_cells, n_frames)))
+    timeseries = TimeSeriesData(data, std=std, file_name="timeseries")
+    timeseries.save_json(output_dir)
+
+    return timeseries
+
+
+def test_decimate():
+    timeseries = create_timeseries()
+    summary = TimeSeriesDecimator.load_summary(timeseries.json_path)
+    assert "min_index_1" in summary
+
+    decimated = TimeSeriesDecimator.decimate(summary, n_points=1000)
+    assert list(decimated["data"].keys()) == ["0", "1", "2"]
+
+    for i in range(n_cells):
+        points = decimated["data"][str(i)]
+        assert len(points) <= 1000
+        # global extrema are kept
+        assert (
+            points[str(int(np.argmin(timeseries.data[i])))] == timeseries.data[i].min()
+        )
+        assert (
+            points[str(int(np.argmax(timeseries.data[i])))] == timeseries.data[i].max()
+        )
+        assert decimated["std"][str(i)].keys() == points.keys()
+
+    # xrange covers the points of all cells (selected by cell)
+    keys = set().union(*(x.keys() for x in decimated["data"].values()))
+    assert decimated["xrange"] == sorted(keys, key=int)
+    assert len(keys) > len(decimated["data"]["0"])
+
+
+def test_decimate_range():
+    timeseries = create_timeseries()
+    summary = TimeSeriesDecimator.load_summary(timeseries.json_path)
+
+    xmin, xmax = 5003, 15011
+    decimated = TimeSeriesDecimator.decimate(
+        summary, n_points=200, cell_numbers=["1"], xmin=xmin, xmax=xmax
+    )
+    points = decimated["data"]["1"]
+    positions = [int(x) for x in points.keys()]
+
+    assert list(decimated["data"].keys()) == ["1"]
+    assert min(positions) >= xmin and max(positions) <= xmax
+    assert len(points) <= 200
+    visible = timeseries.data[1, xmin : xmax + 1]
+    assert min(points.values()) == visible.min()
+    assert max(points.values()) == visible.max()
+
+    # narrow range: all samples are returned
+    decimated = TimeSeriesDecimator.decimate(
+        summary, n_points=200, cell_numbers=["1"], xmin=100, xmax=149
+    )
+    assert list(decimated["data"]["1"].values()) == timeseries.data[1, 100:150].tolist()
@@ -0,0 +1,105 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from studio.app.common.core.rules.runner import Runner
+from studio.app.common.core.utils.filepath_creater import join_filepath
+from studio.app.common.core.utils.pickle_handler import (
+    PickleReader,
+    PickleWriter,
+    get_pickle_arrays_dirpath,
+)
+from studio.app.common.core.workflow.workflow import (
+    DataFilterParam,
+    DataFilterRangeParam,
+)
+from studio.app.common.core.workflow.workflow_filter import WorkflowNodeDataFilter
+from studio.app.common.dataclass import ImageData
+from studio.app.dir_path import DIRPATH
+from studio.app.optinist.core.nwb.nwb import NWBDATASET
+from studio.app.optinist.dataclass import EditRoiData, FluoData, IscellData, RoiData
+
+workspace_id = "default"
+unique_id = "filter_test"
+node_id = "suite2p_roi_m6v8o3dctg"
+
+workflow_dirpath = join_filepath([DIRPATH.OUTPUT_DIR, workspace_id, unique_id])
+node_dirpath = join_filepath([workflow_dirpath, node_id])
+
+
+@pytest.fixture
+def node_output(monkeypatch):
+    shutil.rmtree(workflow_dirpath, ignore_errors=True)
+    shutil.copytree(
+        f"{DIRPATH.DATA_DIR}/output_test/{workspace_id}/0123",
+        workflow_dirpath,
+        ignore=shutil.ignore_patterns("func*", "*.nwb"),
+    )
+    # Note: whole.nwb is not created from the dummy nwbfile contents.
+    monkeypatch.setattr(Runner, "save_all_nwb", lambda *args: None)
+
+    # Note: the arrays of 1MiB or more are saved beside the pickle.
+    n_rois, n_frames = 200, 1000
+    im = np.full((n_rois, 32, 32), np.nan)
+    for i in range(n_rois):
+        im[i, i % 32, i // 32] = i
+    output_info = {
+        "edit_roi_data": EditRoiData(
+            images=ImageData(np.zeros((1, 32, 32)), file_name="images"), im=im
+        ),
+        "fluorescence": FluoData(
+            np.random.default_rng(0).random((n_rois, n_frames)),
+            file_name="fluorescence",
+        ),
+        "iscell": IscellData(np.ones(n_rois, dtype=bool)),
+        "cell_roi": RoiData(
+            np.nanmax(im, axis=0), output_dir=node_dirpath, file_name="cell_roi"
+        ),
+        "nwbfile": {
+            "suite2p_roi": {
+                NWBDATASET.POSTPROCESS: {"suite2p_roi": {}},
+            }
+        },
+    }
+    pkl_filepath = join_filepath([node_dirpath, "suite2p_roi.pkl"])
+    PickleWriter.write(pkl_filepath, output_info)
+    for name in ["fluorescence", "cell_roi"]:
+        output_info[name].save_json(node_dirpath)
+
+    yield pkl_filepath, output_info
+    shutil.rmtree(workflow_dirpath, ignore_errors=True)
+
+
+def test_filter_node_data(node_output):
+    pkl_filepath, output_info = node_output
+    fluorescence = output_info["fluorescence"].data
+    assert os.path.isdir(get_pickle_arrays_dirpath(pkl_filepath))
+
+    data_filter = WorkflowNodeDataFilter(workspace_id, unique_id, node_id)
+    params = DataFilterParam(
+        dim1=[DataFilterRangeParam(start=0, end=100)],
+        roi=[DataFilterRangeParam(start=0, end=10)],
+    )
+    data_filter.filter_node_data(params)
+    assert PickleReader.read(pkl_filepath)["fluorescence"].data.shape == (200, 100)
+
+    # filters are applied to the original data (kept as is by the filtered data)
+    params.dim1 = [DataFilterRangeParam(start=100, end=300)]
+    data_filter.filter_node_data(params)
+    filtered = PickleReader.read(pkl_filepath)
+    assert np.array_equal(filtered["fluorescence"].data, fluorescence[:, 100:300])
+    assert filtered["iscell"].data.sum() == 10
+
+    # reset filter
+    data_filter.filter_node_data(None)
+    recovered = PickleReader.read(pkl_filepath)
+    assert np.array_equal(recovered["fluorescence"].data, fluorescence)
+    assert np.array_equal(
+        recovered["edit_roi_data"].im, output_info["edit_roi_data"].im, equal_nan=True
+    )
+    assert not os.path.exists(data_filter.original_pkl_filepath)
+    assert not os.path.exists(
+        get_pickle_arrays_dirpath(data_filter.original_pkl_filepath)
+    )
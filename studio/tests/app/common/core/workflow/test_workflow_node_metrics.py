@@ -0,0 +1,179 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from studio.app.common.core.experiment.experiment_reader import ExptConfigReader
+from studio.app.common.core.mode import MODE
+from studio.app.common.core.snakemake.smk import SmkParam
+from studio.app.common.core.snakemake.snakemake_executor import snakemake_execute
+from studio.app.common.core.workflow.workflow import (
+    Edge,
+    Node,
+    NodeData,
+    NodePosition,
+    NodeRunStatus,
+    NodeType,
+    RunItem,
+)
+from studio.app.common.core.workflow.workflow_node_metrics import WorkflowNodeMetrics
+from studio.app.common.core.workflow.workflow_result import WorkflowResult
+from studio.app.common.core.workflow.workflow_runner import WorkflowRunner
+from studio.app.dir_path import DIRPATH
+
+workspace_id = "default"
+unique_id = "node_metrics_test"
+
+input_node_id = "input_0"
+input_filename = "node_metrics_fluo.csv"
+node_id = "pca_1234"
+
+output_dirpath = f"{DIRPATH.OUTPUT_DIR}/{workspace_id}/{unique_id}"
+
+
+def create_run_item() -> RunItem:
+    return RunItem(
+        name="node_metrics",
+        nodeDict={
+            input_node_id: Node(
+                id=input_node_id,
+                type=NodeType.FLUO,
+                data=NodeData(
+                    label=input_filename,
+                    param={"setHeader": None, "setIndex": False, "transpose": False},
+                    path=input_filename,
+                    type="input",
+                    fileType="csv",
+                ),
+                position=NodePosition(x=0, y=0),
+                style={},
+            ),
+            node_id: Node(
+                id=node_id,
+                type=NodeType.ALGO,
+                data=NodeData(
+                    label="pca",
+                    param={},
+                    path="optinist/dimension_reduction/pca",
+                    type="",
+                ),
+                position=NodePosition(x=0, y=0),
+                style={},
+            ),
+        },
+        edgeDict={
+            f"edge_{node_id}": Edge(
+                id=f"edge_{node_id}",
+                type="buttonedge",
+                animated=False,
+                source=input_node_id,
+                sourceHandle=f"{input_node_id}--fluo--FluoData",
+                target=node_id,
+                targetHandle=f"{node_id}--neural_data--FluoData",
+                style={},
+            )
+        },
+        snakemakeParam={},
+        nwbParam={},
+        forceRunList=[],
+    )
+
+
+@pytest.fixture
+def fluo_input():
+    input_dirpath = f"{DIRPATH.INPUT_DIR}/{workspace_id}"
+    os.makedirs(input_dirpath, exist_ok=True)
+    input_path = f"{input_dirpath}/{input_filename}"
+    np.savetxt(
+        input_path,
+        np.random.default_rng(0).random((200, 20)),
+        delimiter=",",
+    )
+    yield input_path
+    os.remove(input_path)
+    shutil.rmtree(output_dirpath, ignore_errors=True)
+
+
+def test_WorkflowNodeMetrics(tmp_path):
+    node_metrics = WorkflowNodeMetrics()
+
+    data = np.random.rand(1024, 1024)
+    np.save(tmp_path / "data.npy", data)
+    np.load(tmp_path / "data.npy")
+
+    saved = node_metrics.save(str(tmp_path))
+    metrics = WorkflowNodeMetrics.read(str(tmp_path))
+
+    assert metrics == saved
+    assert metrics.wall_time > 0
+    assert metrics.cpu_user + metrics.cpu_system > 0
+    assert metrics.max_rss > data.nbytes
+    assert metrics.read_bytes >= data.nbytes
+    assert metrics.write_bytes >= data.nbytes
+
+    assert WorkflowNodeMetrics.read(str(tmp_path / "unknown")) is None
+
+
+PEAK_RSS_SCRIPT = """
+from studio.app.common.core.workflow.workflow_node_metrics import WorkflowNodeMetrics
+
+print(WorkflowNodeMetrics.get_peak_rss())
+"""
+
+
+def test_peak_rss_of_child_process():
+    # the peak of this (parent) process is not taken for the node process
+    data = np.ones(256 * 1024**2 // 8)
+    result = subprocess.run(
+        [sys.executable, "-c", PEAK_RSS_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": DIRPATH.ROOT_DIR},
+    )
+    peak_rss = int(result.stdout.split()[-1])
+
+    assert WorkflowNodeMetrics.get_peak_rss() > data.nbytes
+    assert 0 < peak_rss < data.nbytes
+
+
+@pytest.mark.asyncio
+async def test_node_metrics_recorded(fluo_input):
+    # Force running in standalone-mode
+    MODE.reset_mode(is_standalone=True)
+
+    shutil.rmtree(output_dirpath, ignore_errors=True)
+    runner = WorkflowRunner("", workspace_id, unique_id, create_run_item())
+    runner.set_smk_config()
+    snakemake_execute(
+        workspace_id,
+        unique_id,
+        SmkParam(
+            use_conda=False,
+            cores=1,
+            forceall=True,
+            forcetargets=True,
+            lock=False,
+            mem_mb=runner.mem_mb,
+        ),
+    )
+
+    messages = await WorkflowResult(workspace_id, unique_id).observe([node_id])
+    message = messages[node_id]
+    assert message.status == NodeRunStatus.SUCCESS.value
+
+    metrics = message.metrics
+    assert metrics is not None
+    assert metrics.wall_time > 0
+    assert metrics.cpu_user + metrics.cpu_system > 0
+    assert metrics.max_rss > 0
+    assert metrics.read_bytes > 0
+    assert metrics.write_bytes > 0
+
+    # the metrics are stored with the experiment status
+    expt_function = ExptConfigReader.read(workspace_id, unique_id).function[node_id]
+    assert expt_function.metrics == metrics
+    assert expt_function.started_at == metrics.started_at
@@ -0,0 +1,144 @@
+import os
+import shutil
+import subprocess
+import time
+
+import pytest
+
+from studio.app.common.core.rules.runner import Runner
+from studio.app.common.core.workflow import workflow_result
+from studio.app.common.core.workflow.workflow import RunItem
+from studio.app.common.core.workflow.workflow_process_status import (
+    WorkflowProcessStatus,
+)
+from studio.app.common.core.workflow.workflow_result import WorkflowMonitor
+from studio.app.common.core.workflow.workflow_runner import WorkflowRunner
+from studio.app.dir_path import DIRPATH
+
+workspace_id = "default"
+unique_id = "process_status_test"
+
+workflow_dirpath = f"{DIRPATH.DATA_DIR}/output_test/{workspace_id}/result_test"
+
+
+def create_workflow(unique_id: str) -> str:
+    output_dirpath = f"{DIRPATH.OUTPUT_DIR}/{workspace_id}/{unique_id}"
+    shutil.rmtree(output_dirpath, ignore_errors=True)
+    shutil.copytree(workflow_dirpath, output_dirpath)
+
+    Runner.write_pid_file(
+        output_dirpath, "xxxx_dummy_func", "xxxx_dummy_func_script.py"
+    )
+    return output_dirpath
+
+
+def forbid_process_scan(monkeypatch):
+    def process_iter(*args, **kwargs):
+        raise AssertionError("process scan is not expected")
+
+    monkeypatch.setattr(workflow_result, "process_iter", process_iter)
+
+
+def test_process_status():
+    create_workflow(unique_id)
+    assert WorkflowProcessStatus.read(workspace_id, unique_id) is None
+
+    child = subprocess.Popen(["sleep", "30"])
+    process_status = WorkflowProcessStatus(workspace_id, unique_id)
+    try:
+        process_status.start()
+
+        record = WorkflowProcessStatus.read(workspace_id, unique_id)
+        assert record["pid"] == os.getpid()
+        assert not record["finished"]
+        assert WorkflowProcessStatus.is_alive(record)
+        assert any(
+            c["pid"] == child.pid and c["cmdline"] == "sleep 30"
+            for c in record["children"]
+        )
+    finally:
+        process_status.stop()
+        child.kill()
+        child.wait()
+
+    record = WorkflowProcessStatus.read(workspace_id, unique_id)
+    assert record["finished"]
+    assert not WorkflowProcessStatus.is_alive(record)
+
+    # a stale heartbeat, or a reused pid, is not alive
+    record["finished"] = False
+    assert WorkflowProcessStatus.is_alive(record)
+    record["create_time"] -= 10
+    assert not WorkflowProcessStatus.is_alive(record)
+    record["create_time"] += 10
+    record["heartbeat"] -= WorkflowProcessStatus.HEARTBEAT_TIMEOUT + 1
+    assert not WorkflowProcessStatus.is_alive(record)
+
+
+def test_search_process_with_process_status(monkeypatch):
+    create_workflow(unique_id)
+    forbid_process_scan(monkeypatch)
+    monitor = WorkflowMonitor(workspace_id, unique_id)
+
+    process_status = WorkflowProcessStatus(workspace_id, unique_id)
+    process_status.start()
+    try:
+        process_data = monitor.search_process()
+        assert process_data is not None
+        assert process_data.process is None
+    finally:
+        process_status.stop()
+
+    # finished executor is reported at once (without waiting for the timeout)
+    assert monitor.search_process() is None
+
+
+def test_search_process_rerun():
+    create_workflow(unique_id)
+    process_status = WorkflowProcessStatus(workspace_id, unique_id)
+    process_status.start()
+    process_status.stop()
+    monitor = WorkflowMonitor(workspace_id, unique_id)
+    assert monitor.search_process() is None
+
+    # run again: the process is waited for, until the new executor records it
+    WorkflowRunner(None, workspace_id, unique_id, RunItem(forceRunList=[]))
+    assert WorkflowProcessStatus.read(workspace_id, unique_id) is None
+    process_data = monitor.search_process()
+    assert process_data is not None
+    assert process_data.process is None
+
+
+@pytest.mark.heavier_processing
+def test_search_process_benchmark():
+    n_processes = int(os.environ.get("PROCESS_BENCHMARK_COUNT", 1000))
+    n_polls = 20
+    processes = [subprocess.Popen(["sleep", "600"]) for _ in range(n_processes)]
+
+    try:
+        create_workflow(unique_id)
+        monitor = WorkflowMonitor(workspace_id, unique_id)
+
+        start = time.time()
+        for _ in range(n_polls):
+            assert monitor.search_process() is not None
+        legacy_time = (time.time() - start) / n_polls
+
+        process_status = WorkflowProcessStatus(workspace_id, unique_id)
+        process_status.start()
+        try:
+            start = time.time()
+            for _ in range(n_polls):
+                assert monitor.search_process() is not None
+            new_time = (time.time() - start) / n_polls
+        finally:
+            process_status.stop()
+    finally:
+        for process in processes:
+            process.kill()
+            process.wait()
+
+    print(
+        f"search_process ({n_processes} processes): "
+        f"legacy {legacy_time * 1000:.1f}ms, new {new_time * 1000:.1f}ms"
+    )
@@ -0,0 +1,92 @@
+import threading
+import time
+
+from studio.app.common.core.workflow.workflow_scheduler import WorkflowScheduler
+
+workspace_id = "default"
+
+
+def wait_until_idle(timeout: float = 10):
+    deadline = time.time() + timeout
+    while WorkflowScheduler.get_usage() != (0, 0):
+        assert time.time() < deadline, "scheduled workflows did not finish"
+        time.sleep(0.01)
+
+
+def test_scheduler_queue(monkeypatch):
+    monkeypatch.setattr(WorkflowScheduler, "MAX_CORES", 1)
+
+    started = []
+    release = threading.Event()
+
+    def run_workflow(unique_id: str):
+        started.append(unique_id)
+        release.wait(10)
+
+    for user_key, unique_id in [("a", "a1"), ("a", "a2"), ("a", "a3"), ("b", "b1")]:
+        WorkflowScheduler.submit(
+            user_key, workspace_id, unique_id, 2, run_workflow, unique_id
+        )
+
+    assert WorkflowScheduler.get_status(workspace_id, "a1").status == "running"
+    assert WorkflowScheduler.get_status(workspace_id, "a1").cores == 1
+
+    # user "b" has no running workflow, so b1 is started before a2
+    assert WorkflowScheduler.get_status(workspace_id, "b1").position == 1
+    assert WorkflowScheduler.get_status(workspace_id, "a2").position == 2
+    assert WorkflowScheduler.get_status(workspace_id, "a3").position == 3
+    assert WorkflowScheduler.is_queued(workspace_id, "a3")
+
+    assert WorkflowScheduler.cancel(workspace_id, "a3")
+    assert not WorkflowScheduler.cancel(workspace_id, "a3")
+    assert WorkflowScheduler.get_status(workspace_id, "a3") is None
+
+    release.set()
+    wait_until_idle()
+
+    assert started == ["a1", "b1", "a2"]
+    assert WorkflowScheduler.get_status(workspace_id, "a2") is None
+
+
+def test_scheduler_budgets(monkeypatch):
+    monkeypatch.setattr(WorkflowScheduler, "MAX_CORES", 8)
+    monkeypatch.setattr(WorkflowScheduler, "MAX_MEMORY_MB", 16384)
+
+    n_workflows = 60
+    duration = 0.05
+    lock = threading.Lock()
+    usage = {"cores": 0, "memory_mb": 0, "peak_cores": 0, "peak_memory_mb": 0}
+    finished = []
+
+    def run_workflow(unique_id: str, cores: int, memory_mb: int):
+        with lock:
+            usage["cores"] += cores
+            usage["memory_mb"] += memory_mb
+            usage["peak_cores"] = max(usage["peak_cores"], usage["cores"])
+            usage["peak_memory_mb"] = max(usage["peak_memory_mb"], usage["memory_mb"])
+        time.sleep(duration)
+        with lock:
+            usage["cores"] -= cores
+            usage["memory_mb"] -= memory_mb
+            finished.append(unique_id)
+
+    for i in range(n_workflows):
+        unique_id = f"budget_{i}"
+        cores = [1, 2, 4][i % 3]
+        memory_mb = [2048, 4096][i % 2]
+        WorkflowScheduler.submit(
+            f"user_{i % 5}",
+            workspace_id,
+            unique_id,
+            cores,
+            run_workflow,
+            unique_id,
+            cores,
+            memory_mb,
+            memory_mb=memory_mb,
+        )
+    wait_until_idle()
+
+    assert len(finished) == n_workflows
+    assert usage["peak_cores"] <= 8
+    assert usage["peak_memory_mb"] <= 16384
@@ -0,0 +1,114 @@
+import asyncio
+import os
+import shutil
+import time
+
+import pytest
+
+from studio.app.common.core.rules.runner import Runner
+from studio.app.common.core.workflow.workflow import NodeRunStatus
+from studio.app.common.core.workflow.workflow_result import WorkflowResult
+from studio.app.common.core.workflow.workflow_status_events import WorkflowStatusEvents
+from studio.app.common.core.workflow.workflow_status_stream import WorkflowStatusStream
+from studio.app.dir_path import DIRPATH
+
+workspace_id = "default"
+unique_id = "status_stream_test"
+node_id = "func1"
+
+workflow_dirpath = f"{DIRPATH.DATA_DIR}/output_test/{workspace_id}/result_test"
+
+
+def create_workflow(unique_id: str, finished: bool = True) -> str:
+    output_dirpath = f"{DIRPATH.OUTPUT_DIR}/{workspace_id}/{unique_id}"
+    shutil.rmtree(output_dirpath, ignore_errors=True)
+    shutil.copytree(workflow_dirpath, output_dirpath)
+    if not finished:
+        os.remove(f"{output_dirpath}/{node_id}/func1.pkl")
+
+    Runner.write_pid_file(
+        output_dirpath, "xxxx_dummy_func", "xxxx_dummy_func_script.py"
+    )
+    return output_dirpath
+
+
+def test_status_events():
+    create_workflow(unique_id)
+
+    WorkflowStatusEvents.emit(
+        workspace_id, unique_id, node_id, NodeRunStatus.RUNNING.value
+    )
+    events, offset = WorkflowStatusEvents.read(workspace_id, unique_id)
+    assert [e["status"] for e in events] == ["running"]
+
+    assert WorkflowStatusEvents.read(workspace_id, unique_id, offset) == ([], offset)
+
+    WorkflowStatusEvents.emit(
+        workspace_id, unique_id, node_id, NodeRunStatus.SUCCESS.value
+    )
+    events, _ = WorkflowStatusEvents.read(workspace_id, unique_id, offset)
+    assert [(e["node_id"], e["status"]) for e in events] == [("func1", "success")]
+
+
+@pytest.mark.asyncio
+async def test_status_stream(monkeypatch):
+    monkeypatch.setattr(WorkflowStatusStream, "EVENTS_POLL_INTERVAL", 0.01)
+    create_workflow(unique_id)
+
+    async def watch():
+        return [
+            x async for x in WorkflowStatusStream.subscribe(workspace_id, unique_id)
+        ]
+
+    watchers = [asyncio.create_task(watch()) for _ in range(3)]
+    await asyncio.sleep(0.05)
+
+    WorkflowStatusEvents.emit(
+        workspace_id, unique_id, node_id, NodeRunStatus.RUNNING.value
+    )
+    WorkflowStatusEvents.emit(
+        workspace_id, unique_id, node_id, NodeRunStatus.SUCCESS.value
+    )
+
+    for transitions in await asyncio.wait_for(asyncio.gather(*watchers), 10):
+        assert transitions[0][node_id].status == "running"
+        assert transitions[-1][node_id].status == "success"
+
+
+@pytest.mark.heavier_processing
+@pytest.mark.asyncio
+async def test_status_watch_load():
+    n_workflows, duration = 100, 10
+    unique_ids = [f"status_load_{i}" for i in range(n_workflows)]
+    for uid in unique_ids:
+        create_workflow(uid, finished=False)
+
+    # polling: each client posts /run/result every second
+    start_cpu, start = time.process_time(), time.time()
+    while time.time() - start < duration:
+        for uid in unique_ids:
+            await WorkflowResult(workspace_id, uid).observe([node_id])
+        await asyncio.sleep(max(0, 1 - (time.time() - start) % 1))
+    polling_cpu = time.process_time() - start_cpu
+
+    # push: each client subscribes to the status stream
+    async def watch(uid):
+        async for _ in WorkflowStatusStream.subscribe(workspace_id, uid):
+            pass
+
+    start_cpu = time.process_time()
+    watchers = [asyncio.create_task(watch(uid)) for uid in unique_ids]
+    await asyncio.sleep(duration)
+    push_cpu = time.process_time() - start_cpu
+    for watcher in watchers:
+        watcher.cancel()
+    await asyncio.gather(*watchers, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    print(
+        f"{n_workflows} watched workflows for {duration}s, server CPU: "
+        f"polling {polling_cpu:.2f}s, push {push_cpu:.2f}s"
+    )
+
+    for uid in unique_ids:
+        shutil.rmtree(f"{DIRPATH.OUTPUT_DIR}/{workspace_id}/{uid}")
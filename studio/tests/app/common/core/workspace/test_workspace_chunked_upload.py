@@ -0,0 +1,78 @@
+import os
+import shutil
+
+import pytest
+
+from studio.app.common.core.storage.mock_storage_controller import MockStorageController
+from studio.app.common.core.utils.filepath_creater import join_filepath
+from studio.app.common.core.workspace.workspace_chunked_upload import (
+    ChunkedUploadOffsetError,
+    WorkspaceChunkedUpload,
+)
+from studio.app.dir_path import DIRPATH
+
+workspace_id = "chunked_upload_test"
+workspace_dir = join_filepath([DIRPATH.INPUT_DIR, workspace_id])
+filename = "upload.tif"
+
+CHUNK_BYTES = 1024
+data = os.urandom(CHUNK_BYTES * 4 + 100)
+chunks = [data[i : i + CHUNK_BYTES] for i in range(0, len(data), CHUNK_BYTES)]
+
+
+@pytest.fixture
+def mock_storage_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("REMOTE_STORAGE_TYPE", "1")
+    monkeypatch.setattr(MockStorageController, "MOCK_INPUT_DIR", f"{tmp_path}/input")
+    monkeypatch.setattr(MockStorageController, "MOCK_OUTPUT_DIR", f"{tmp_path}/output")
+    monkeypatch.setattr(
+        MockStorageController, "MOCK_MULTIPART_DIR", f"{tmp_path}/multipart"
+    )
+    monkeypatch.setattr(WorkspaceChunkedUpload, "MIN_CHUNK_BYTES", CHUNK_BYTES)
+    shutil.rmtree(workspace_dir, ignore_errors=True)
+
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_chunked_upload_resume(mock_storage_dir):
+    upload = WorkspaceChunkedUpload(workspace_id, filename, None)
+    assert upload.status["offset"] == 0
+
+    offset = 0
+    for chunk in chunks[:2]:
+        status = await upload.write_chunk(offset, len(data), chunk)
+        offset = status["offset"]
+
+    # interrupted: the upload is resumed by a new handler from the persisted state
+    upload = WorkspaceChunkedUpload(workspace_id, filename, None)
+    assert upload.status["offset"] == CHUNK_BYTES * 2
+
+    with pytest.raises(ChunkedUploadOffsetError):
+        await upload.write_chunk(CHUNK_BYTES, len(data), chunks[1])
+
+    for chunk in chunks[2:]:
+        status = await upload.write_chunk(offset, len(data), chunk)
+        offset = status["offset"]
+    assert status["completed"]
+
+    with open(join_filepath([workspace_dir, filename]), "rb") as f:
+        assert f.read() == data
+    with open(f"{mock_storage_dir}/input/{workspace_id}/{filename}", "rb") as f:
+        assert f.read() == data
+    assert not os.path.exists(upload.state_path)
+    assert os.listdir(f"{mock_storage_dir}/multipart") == []
+
+
+@pytest.mark.asyncio
+async def test_chunked_upload_chunk_size(mock_storage_dir):
+    upload = WorkspaceChunkedUpload(workspace_id, filename, None)
+
+    with pytest.raises(ValueError):
+        await upload.write_chunk(0, len(data), chunks[0][:10])
+
+    await upload.write_chunk(0, len(data), chunks[0])
+    await upload.abort()
+    assert upload.status["offset"] == 0
+    assert not os.path.exists(upload.part_path)
+    assert os.listdir(f"{mock_storage_dir}/multipart") == []
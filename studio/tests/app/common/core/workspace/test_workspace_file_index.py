@@ -0,0 +1,108 @@
+import os
+import shutil
+import time
+
+import pytest
+
+from studio.app.common.core.utils.filepath_creater import (
+    create_directory,
+    join_filepath,
+)
+from studio.app.common.core.workspace.workspace_file_index import WorkspaceFileIndex
+from studio.app.common.routers.files import DirTreeGetter
+from studio.app.const import ACCEPT_FILE_EXT
+from studio.app.dir_path import DIRPATH
+
+workspace_id = "file_index_test"
+workspace_dir = join_filepath([DIRPATH.INPUT_DIR, workspace_id])
+
+file_types = ACCEPT_FILE_EXT.CSV_EXT.value
+
+
+def create_workspace(n_dirs: int, n_files: int):
+    """
+    n_dirs directories of n_files csv files (with .orig copies)
+    """
+    shutil.rmtree(workspace_dir, ignore_errors=True)
+    for d in range(n_dirs):
+        dirpath = join_filepath([workspace_dir, f"dir{d:03}", "sub"])
+        create_directory(dirpath)
+        for f in range(n_files):
+            open(join_filepath([dirpath, f"data{f:04}.csv"]), "w").close()
+            open(join_filepath([dirpath, f"data{f:04}.csv.orig"]), "w").close()
+    create_directory(join_filepath([workspace_dir, "empty"]))
+    open(join_filepath([workspace_dir, "root.csv"]), "w").close()
+
+
+def tree_names(nodes):
+    return [(n.name, n.path, n.isdir, tree_names(n.nodes)) for n in nodes]
+
+
+def test_get_tree_from_index():
+    create_workspace(n_dirs=3, n_files=5)
+
+    tree = DirTreeGetter.get_tree(workspace_id, file_types)
+    assert [n.name for n in tree] == ["dir000", "dir001", "dir002", "root.csv"]
+    assert [n.name for n in tree[0].nodes[0].nodes] == [
+        f"data{f:04}.csv" for f in range(5)
+    ]
+    assert tree[0].nodes[0].nodes[0].path == "dir000/sub/data0000.csv"
+    assert os.path.isfile(WorkspaceFileIndex(workspace_id).index_path)
+
+    # served from the persisted index
+    assert tree_names(DirTreeGetter.get_tree(workspace_id, file_types)) == (
+        tree_names(tree)
+    )
+
+    # paging by directory
+    page = DirTreeGetter.get_tree(workspace_id, file_types, "dir001", recursive=False)
+    assert [(n.name, n.isdir, n.nodes) for n in page] == [("sub", True, [])]
+
+    # directories outside of the workspace are not listed
+    for dirname in ["..", "dir001/../../other", workspace_dir]:
+        with pytest.raises(ValueError):
+            DirTreeGetter.get_tree(workspace_id, file_types, dirname)
+
+
+def test_index_updates():
+    create_workspace(n_dirs=1, n_files=2)
+    DirTreeGetter.get_tree(workspace_id, file_types)
+
+    # file added by a handler
+    open(join_filepath([workspace_dir, "empty", "new.csv"]), "w").close()
+    WorkspaceFileIndex(workspace_id).update_file("empty/new.csv")
+    index = WorkspaceFileIndex(workspace_id)
+    assert index.list_dir("empty")["files"] == ["new.csv"]
+    assert "empty" in [n.name for n in DirTreeGetter.get_tree(workspace_id, file_types)]
+
+    # file removed outside of handlers is picked up by the mtime check
+    time.sleep(0.01)
+    os.remove(join_filepath([workspace_dir, "root.csv"]))
+    assert "root.csv" not in [
+        n.name for n in DirTreeGetter.get_tree(workspace_id, file_types)
+    ]
+
+
+@pytest.mark.heavier_processing
+def test_get_tree_benchmark():
+    # 100 dirs x 500 files x (csv + .orig) = 100k files
+    create_workspace(n_dirs=100, n_files=500)
+    index_path = WorkspaceFileIndex(workspace_id).index_path
+
+    start = time.time()
+    cold_tree = DirTreeGetter.get_tree(workspace_id, file_types)
+    cold_time = time.time() - start
+
+    start = time.time()
+    warm_tree = DirTreeGetter.get_tree(workspace_id, file_types)
+    warm_time = time.time() - start
+
+    start = time.time()
+    DirTreeGetter.get_tree(workspace_id, file_types, "dir050", recursive=False)
+    page_time = time.time() - start
+
+    print(
+        f"tree of 100k files: cold {cold_time:.3f}s, warm {warm_time:.3f}s, "
+        f"page {page_time:.3f}s, index {os.path.getsize(index_path) / 1024:.0f}KiB"
+    )
+    assert tree_names(cold_tree) == tree_names(warm_tree)
@@ -0,0 +1,175 @@
+import gzip
+import os
+import shutil
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from studio.app.common.core.utils.filepath_creater import join_filepath
+from studio.app.common.core.workspace.workspace_url_download import WorkspaceUrlDownload
+from studio.app.dir_path import DIRPATH
+
+workspace_id = "url_download_test"
+workspace_dir = join_filepath([DIRPATH.INPUT_DIR, workspace_id])
+file_name = "download.tif"
+
+
+class RangeRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves server.source_path, with Range support.
+    *If server.drop_at is set, the first response is cut at that offset.
+    *If server.gzip is set, the file is served gzip encoded
+      (regardless of Accept-Encoding).
+    """
+
+    def do_GET(self):
+        with open(self.server.source_path, "rb") as f:
+            body = f.read()
+        if self.server.gzip:
+            body = gzip.compress(body)
+        size = len(body)
+        start = 0
+        range_header = self.headers.get("Range")
+        self.server.range_headers.append(range_header)
+        self.server.accept_encodings.append(self.headers.get("Accept-Encoding"))
+        if range_header:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{size - 1}/{size}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(size - start))
+        self.send_header("Accept-Ranges", "bytes")
+        if self.server.gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+
+        stop = size
+        if self.server.drop_at is not None:
+            stop, self.server.drop_at = self.server.drop_at, None
+
+        while start < stop:
+            end = min(stop, start + 1024 * 1024)
+            self.wfile.write(body[start:end])
+            start = end
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_server(tmp_path):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeRequestHandler)
+    server.source_path = str(tmp_path / file_name)
+    server.drop_at = None
+    server.gzip = False
+    server.range_headers = []
+    server.accept_encodings = []
+    server.url = f"http://127.0.0.1:{server.server_port}/{file_name}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    shutil.rmtree(workspace_dir, ignore_errors=True)
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def download(url: str) -> WorkspaceUrlDownload:
+    res = requests.get(url, stream=True, headers=WorkspaceUrlDownload.REQUEST_HEADERS)
+    res.raise_for_status()
+    url_download = WorkspaceUrlDownload(workspace_id, file_name)
+    url_download.submit(res).result()
+    return url_download
+
+
+def test_download(http_server):
+    data = os.urandom(3 * 1024 * 1024 + 100)
+    with open(http_server.source_path, "wb") as f:
+        f.write(data)
+
+    url_download = download(http_server.url)
+
+    with open(url_download.filepath, "rb") as f:
+        assert f.read() == data
+    assert url_download.status == {
+        "total": len(data),
+        "current": len(data),
+        "error": None,
+    }
+    # the status is shared through the status file
+    assert WorkspaceUrlDownload(workspace_id, file_name).status["current"] == len(data)
+
+
+def test_download_resume(http_server):
+    data = os.urandom(3 * 1024 * 1024 + 100)
+    with open(http_server.source_path, "wb") as f:
+        f.write(data)
+    http_server.drop_at = 1024 * 1024
+
+    url_download = download(http_server.url)
+
+    with open(url_download.filepath, "rb") as f:
+        assert f.read() == data
+    assert url_download.status["error"] is None
+    assert http_server.range_headers[0] is None
+    assert http_server.range_headers[1] == "bytes=1048576-"
+    assert set(http_server.accept_encodings) == {"identity"}
+
+
+def test_download_resume_encoded(http_server):
+    data = os.urandom(3 * 1024 * 1024 + 100)
+    with open(http_server.source_path, "wb") as f:
+        f.write(data)
+    http_server.gzip = True
+    http_server.drop_at = 1024 * 1024
+
+    url_download = download(http_server.url)
+
+    # the decoded content cannot be resumed by Range, so it is downloaded again
+    with open(url_download.filepath, "rb") as f:
+        assert f.read() == data
+    assert url_download.status["error"] is None
+    assert http_server.range_headers == [None, None]
+
+
+def legacy_download(res, filepath, chunk_size=1024):
+    status = {}
+    total = int(res.headers.get("content-length", 0))
+    current = 0
+    with open(filepath, "wb") as file:
+        for data in res.iter_content(chunk_size=chunk_size):
+            size = file.write(data)
+            current += size
+            status[filepath] = {"total": total, "current": current}
+
+
+@pytest.mark.heavier_processing
+def test_download_benchmark(http_server):
+    size = int(os.environ.get("DOWNLOAD_BENCHMARK_BYTES", 2 * 1024**3))
+    with open(http_server.source_path, "wb") as f:
+        f.truncate(size)
+
+    start = time.time()
+    url_download = download(http_server.url)
+    new_time = time.time() - start
+    assert os.path.getsize(url_download.filepath) == size
+
+    # Note: the legacy 1KiB loop is measured on a part of the file.
+    legacy_size = min(size, 256 * 1024**2)
+    res = requests.get(
+        http_server.url, stream=True, headers={"Range": f"bytes={size - legacy_size}-"}
+    )
+    start = time.time()
+    legacy_download(res, f"{url_download.filepath}.legacy")
+    legacy_time = time.time() - start
+    os.remove(f"{url_download.filepath}.legacy")
+
+    print(
+        f"download throughput: legacy {legacy_size / legacy_time / 1024**2:.0f}MiB/s, "
+        f"new {size / new_time / 1024**2:.0f}MiB/s ({size / 1024**3:.1f}GiB)"
+    )
+    os.remove(url_download.filepath)
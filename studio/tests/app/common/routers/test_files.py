@@ -13,6 +13,14 @@ def test_create_files(client):
     assert len(data) > 0
 
 
+def test_get_files_outside_workspace(client):
+    for dirname in ["..", "files/../..", "/tmp"]:
+        response = client.get(
+            f"/files/{workspace_id}", params={"file_type": "image", "dirname": dirname}
+        )
+        assert response.status_code == 400
+
+
 def test_DirTreeGetter_tif():
     output = DirTreeGetter.get_tree(
         workspace_id, [".tif", ".tiff", ".TIF", ".TIFF"], "files"
@@ -1,3 +1,12 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+from studio.app.common.core.utils.timeseries_decimator import TimeSeriesDecimator
+from studio.app.common.dataclass.image import ImageData
+from studio.app.common.dataclass.timeseries import TimeSeriesData
 from studio.app.dir_path import DIRPATH
 
 workspace_id = "default"
@@ -78,3 +87,86 @@ def test_image(client):
 
     assert response.status_code == 200
     assert isinstance(data, dict)
+
+
+def test_timedata_decimated(client):
+    # outputs saved without the summary: it is built (and saved) on the first request
+    summary_path = TimeSeriesDecimator.get_summary_path(timeseries_dirpath)
+    if os.path.exists(summary_path):
+        os.remove(summary_path)
+
+    response = client.get(
+        f"/outputs/timedata/{timeseries_dirpath}/?index=0&n_points=100"
+    )
+    data = response.json()
+
+    assert response.status_code == 200
+    assert 0 < len(data["data"]["0"]) <= 100
+    assert data["xrange"] == list(data["data"]["0"].keys())
+    assert os.path.exists(summary_path)
+
+    response = client.get(
+        f"/outputs/alltimedata/{timeseries_dirpath}?n_points=100&xmin=100&xmax=199"
+    )
+    data = response.json()
+
+    assert response.status_code == 200
+    assert len(data["data"]) == 67
+    for value in data["data"].values():
+        assert 0 < len(value) <= 100
+        assert all(100 <= int(x) <= 199 for x in value.keys())
+    assert set(data["xrange"]) == set().union(*data["data"].values())
+
+
+@pytest.mark.heavier_processing
+def test_alltimedata_decimated_benchmark(client):
+    output_dir = f"{DIRPATH.OUTPUT_DIR}/default/timedata_benchmark"
+    for n_frames in [10000, 50000, 200000]:
+        timeseries = TimeSeriesData(
+            np.random.rand(20, n_frames), file_name=f"timeseries_{n_frames}"
+        )
+        timeseries.save_json(output_dir)
+
+        results = []
+        for query in ["", "?n_points=2000"]:
+            start = time.time()
+            response = client.get(f"/outputs/alltimedata/{timeseries.json_path}{query}")
+            results.append((len(response.content), time.time() - start))
+
+        print(
+            f"alltimedata 20 cells x {n_frames} frames: "
+            f"full {results[0][0] / 1024**2:.1f}MiB {results[0][1]:.2f}s, "
+            f"decimated {results[1][0] / 1024:.0f}KiB {results[1][1]:.2f}s"
+        )
+
+
+def test_image_zoom_levels(client):
+    output_dir = f"{DIRPATH.OUTPUT_DIR}/default/image_zoom_test"
+    image = ImageData(
+        np.random.rand(1024, 1024).astype(np.float32),
+        output_dir=output_dir,
+        file_name="mean_image",
+    )
+    image.save_json(output_dir)
+
+    sizes = []
+    for max_size in [None, 512, 256]:
+        query = "?workspace_id=default" + (f"&max_size={max_size}" if max_size else "")
+        start = time.time()
+        response = client.get(f"/outputs/image/{image.json_path}{query}")
+        elapsed = time.time() - start
+
+        assert response.status_code == 200
+        shape = np.array(response.json()["data"][0]).shape
+        sizes.append(len(response.content))
+        print(
+            f"image max_size={max_size}: {shape}, "
+            f"{len(response.content) / 1024:.0f}KiB, {elapsed:.3f}s"
+        )
+
+    assert sizes == sorted(sizes, reverse=True)
+    assert sizes[-1] < sizes[0] / 8
+
+    response = client.get(f"/outputs/thumbnail/{image.json_path}")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
@@ -0,0 +1,109 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from studio.app.optinist.wrappers.optinist.dimension_reduction.dpca_fit import (
+    createMatrix,
+)
+
+n_frames, n_units = 20000, 30
+duration = [-10, 10]
+
+
+def legacy_createMatrix(D, triggers, stims, duration):
+    """
+    Former (loop based) implementation of createMatrix, kept as a reference
+    """
+    num_unit = D.shape[1]
+    num_triggers = len(triggers)
+    num_property = len(stims)
+    num_timepoints = duration[1] - duration[0]
+
+    X = np.zeros([num_triggers, num_unit, num_timepoints])
+    for i in range(num_triggers):
+        X[i, :, :] = D[
+            triggers[i] + duration[0] : triggers[i] + duration[1], :
+        ].transpose()
+
+    columns = list(map(str, range(num_property)))
+    columns.append("all")
+    df = pd.DataFrame(data=None, index=list(range(num_triggers)), columns=columns)
+    for i in range(num_property):
+        df[columns[i]] = stims[i]
+    for i in range(num_triggers):
+        df.iloc[i, num_property] = "_".join(map(str, df.iloc[i, 0:2].values.tolist()))
+
+    uq_list = df["all"].unique()
+    uq_stims = []
+    num_uq_stims = []
+    for i in range(num_property):
+        uq_stims.append(list(df.iloc[:, i].unique()))
+        num_uq_stims.append(len(uq_stims[i]))
+
+    n = np.zeros([len(uq_list)], dtype=int)
+    index = []
+    for i in range(len(uq_list)):
+        index.append(list(df[df["all"] == uq_list[i]].index))
+        n[i] = len(index[i])
+    min_sample = int(np.min(n))
+
+    X2 = np.zeros([min_sample, num_unit, num_timepoints] + num_uq_stims)
+    for i in range(len(index)):
+        stims = list(df.iloc[index[i][0], 0 : df.shape[1] - 1])
+        tgtind = [uq_stims[j].index(stims[j]) for j in range(len(stims))]
+        X2[(slice(0, min_sample), slice(None), slice(None), *tgtind)] = X[
+            index[i][0:min_sample], :, :
+        ]
+
+    return X2
+
+
+def create_inputs(n_triggers, n_levels):
+    rng = np.random.default_rng(0)
+    D = rng.normal(size=(n_frames, n_units))
+    triggers = np.sort(
+        rng.choice(np.arange(-duration[0], n_frames - duration[1]), n_triggers, False)
+    )
+    stims = [rng.integers(1, n + 1, n_triggers).astype(float) for n in n_levels]
+
+    return D, triggers, stims
+
+
+@pytest.mark.parametrize("n_levels", [[4], [3, 5]])
+def test_createMatrix_equivalence(n_levels):
+    D, triggers, stims = create_inputs(3000, n_levels)
+
+    start = time.time()
+    expected = legacy_createMatrix(D, triggers, stims, duration)
+    legacy_time = time.time() - start
+
+    start = time.time()
+    X = createMatrix(D, triggers, stims, duration)
+    elapsed = time.time() - start
+
+    print(f"createMatrix {n_levels}: legacy {legacy_time:.3f}s, {elapsed:.3f}s")
+    assert X.shape == expected.shape
+    np.testing.assert_array_equal(X, expected)
+
+
+def test_createMatrix_three_properties():
+    D, triggers, stims = create_inputs(3000, [2, 3, 4])
+
+    X = createMatrix(D, triggers, stims, duration)
+
+    # conditions are the combinations of all three properties
+    keys = list(zip(*stims))
+    min_sample = min(keys.count(key) for key in set(keys))
+    assert X.shape == (min_sample, n_units, duration[1] - duration[0], 2, 3, 4)
+
+    uq_stims = [list(pd.unique(stim)) for stim in stims]
+    for key in set(keys):
+        samples = [t for t, k in zip(triggers, keys) if k == key][:min_sample]
+        tgtind = tuple(uq_stims[j].index(key[j]) for j in range(3))
+        for i, t in enumerate(samples):
+            np.testing.assert_array_equal(
+                X[(i, slice(None), slice(None)) + tgtind],
+                D[t + duration[0] : t + duration[1]].T,
+            )
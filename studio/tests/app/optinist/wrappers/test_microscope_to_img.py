@@ -0,0 +1,139 @@
+import os
+import pickle
+import shutil
+
+import numpy as np
+import pytest
+
+import studio.app.optinist.dataclass.microscope as microscope_module
+from studio.app.common.core.utils.filepath_creater import create_directory
+from studio.app.dir_path import DIRPATH
+from studio.app.optinist.dataclass.microscope import MicroscopeData
+from studio.app.optinist.microscopes.MicroscopeDataReaderBase import (
+    MicroscopeDataReaderBase,
+    OMEDataModel,
+)
+from studio.app.optinist.wrappers.optinist.visualize_utils import microscope_to_img
+
+workspace_id = "default"
+unique_id = "microscope_to_img_test"
+
+output_dir = f"{DIRPATH.OUTPUT_DIR}/{workspace_id}/{unique_id}/microscope_to_img"
+input_dir = f"{DIRPATH.OUTPUT_DIR}/{workspace_id}/{unique_id}/input"
+
+C, T, Y, X = 2, 30, 16, 12
+
+
+class CountingReader(MicroscopeDataReaderBase):
+    """
+    Reader of (ch, t, y, x) .npy stacks, counting the file opens
+    """
+
+    open_count = 0
+
+    def _init_library(self):
+        pass
+
+    def _load_file(self, data_file_path: str) -> object:
+        __class__.open_count += 1
+        return (np.load(data_file_path, mmap_mode="r"),)
+
+    def _build_original_metadata(self, data_name: str) -> dict:
+        return {"data_name": data_name}
+
+    def _build_ome_metadata(self, original_metadata: dict) -> OMEDataModel:
+        (stacks,) = self.resource_handles
+        return OMEDataModel(
+            image_name=original_metadata["data_name"],
+            size_x=stacks.shape[3],
+            size_y=stacks.shape[2],
+            size_t=stacks.shape[1],
+            size_z=0,
+            size_c=stacks.shape[0],
+            depth=16,
+            significant_bits=16,
+            acquisition_date="",
+            objective_model=None,
+            imaging_rate=30,
+        )
+
+    def _build_lab_specific_metadata(self, original_metadata: dict) -> dict:
+        return None
+
+    def _release_resources(self) -> None:
+        pass
+
+    def _get_image_stacks_shape(self) -> tuple:
+        (stacks,) = self.resource_handles
+        return stacks.shape
+
+    def _read_image_block(self, start: int, stop: int) -> np.ndarray:
+        (stacks,) = self.resource_handles
+        return np.array(stacks[:, start:stop])
+
+
+def create_microscope_file(monkeypatch):
+    create_directory(input_dir)
+    path = f"{input_dir}/sample.nd2"
+    stacks = np.random.randint(0, 4096, (C, T, Y, X)).astype(np.uint16)
+    with open(path, "wb") as f:
+        np.save(f, stacks)
+    shutil.rmtree(
+        f"{input_dir}/{MicroscopeData.OME_METADATA_DIRNAME}", ignore_errors=True
+    )
+
+    monkeypatch.setattr(microscope_module, "ND2Reader", CountingReader)
+    CountingReader.open_count = 0
+
+    return path, stacks
+
+
+def test_microscope_to_img_opens_file_once(monkeypatch):
+    path, stacks = create_microscope_file(monkeypatch)
+    microscope = MicroscopeData(path)
+
+    assert microscope.reader.ome_metadata.size_t == T
+    assert microscope.reader.ome_metadata.size_c == C
+    info = microscope_to_img(microscope, output_dir=output_dir, params={"ch": 1})
+
+    assert CountingReader.open_count == 1
+    np.testing.assert_array_equal(info["microscope_image"].data, stacks[1])
+    np.testing.assert_array_equal(microscope.data, stacks[1])
+    assert not os.path.exists(f"{output_dir}/microscope_stacks.npy")
+    # the channel is kept memory-mapped
+    assert isinstance(info["microscope_image"].memmap, np.memmap)
+    assert isinstance(microscope.data, np.memmap)
+
+    # the loaded reader is not pickled with the data
+    loaded = pickle.loads(pickle.dumps(microscope))
+    assert loaded._reader is None
+
+
+def test_microscope_to_img_removes_stacks_on_error(monkeypatch):
+    path, _ = create_microscope_file(monkeypatch)
+    microscope = MicroscopeData(path)
+
+    with pytest.raises(IndexError):
+        microscope_to_img(microscope, output_dir=output_dir, params={"ch": C})
+    assert not os.path.exists(f"{output_dir}/microscope_stacks.npy")
+
+
+def test_ome_metadata_cache(monkeypatch):
+    path, stacks = create_microscope_file(monkeypatch)
+
+    ome_metadata = MicroscopeData(path).ome_metadata
+    assert ome_metadata["Pixels"]["SizeT"] == T
+    assert CountingReader.open_count == 1
+    # the cache is kept in a hidden directory (not beside the input files)
+    assert os.path.isfile(MicroscopeData(path).ome_metadata_path)
+    assert sorted(os.listdir(input_dir)) == [".ome_metadata", "sample.nd2"]
+
+    # other instances read the metadata from the cache, without opening the file
+    assert MicroscopeData(path).ome_metadata == ome_metadata
+    assert CountingReader.open_count == 1
+
+    # changed files are loaded again
+    with open(path, "wb") as f:
+        np.save(f, stacks[:, : T // 2])
+    assert MicroscopeData(path).ome_metadata["Pixels"]["SizeT"] == T // 2
+    assert CountingReader.open_count == 2
@@ -0,0 +1,94 @@
+import os
+import time
+
+import numpy as np
+
+from studio.app.dir_path import DIRPATH
+from studio.app.optinist.dataclass import BehaviorData, FluoData
+from studio.app.optinist.wrappers.optinist.neural_decoding import LDA, SVM
+from studio.app.optinist.wrappers.optinist.utils import get_n_jobs
+
+workspace_id = "default"
+unique_id = "neural_decoding_test"
+
+output_dir = f"{DIRPATH.OUTPUT_DIR}/{workspace_id}/{unique_id}/func1"
+
+n_cells, n_frames = 40, 600
+
+
+def create_inputs():
+    rng = np.random.default_rng(0)
+    labels = rng.integers(0, 2, n_frames)
+    neural = rng.normal(size=(n_cells, n_frames)) + labels * 0.3
+    behavior = np.stack([np.arange(n_frames), labels], axis=1).astype(float)
+
+    return FluoData(neural), BehaviorData(behavior)
+
+
+def io_params():
+    return {
+        "target_index": 1,
+        "transpose_x": True,
+        "transpose_y": False,
+        "standard_x_mean": True,
+        "standard_x_std": True,
+    }
+
+
+def svm_params(n_jobs):
+    return {
+        "I/O": io_params(),
+        "n_jobs": n_jobs,
+        "use_grid_search": True,
+        "grid_search": {
+            "params_to_search": {"C": [0.01, 0.1, 1.0], "kernel": ["linear", "rbf"]}
+        },
+        "cross_validation": {"n_splits": 5, "shuffle": True, "random_state": 0},
+        "support_vector_classification": {"C": 1.0, "kernel": "rbf"},
+    }
+
+
+def lda_params(n_jobs):
+    return {
+        "I/O": io_params(),
+        "n_jobs": n_jobs,
+        "cross_validation": {"n_splits": 5, "shuffle": True, "random_state": 0},
+        "LDA": {"solver": "svd"},
+    }
+
+
+def run_decoding(func, params):
+    neural_data, behaviors_data = create_inputs()
+
+    start = time.time()
+    info = func(neural_data, behaviors_data, output_dir=output_dir, params=params)
+    elapsed = time.time() - start
+
+    return info["score"].data, elapsed
+
+
+def test_get_n_jobs(monkeypatch):
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(8)))
+    monkeypatch.setenv("OPTINIST_NODE_CPU_BUDGET", "4")
+
+    assert get_n_jobs(None) == 1
+    assert get_n_jobs(2) == 2
+    assert get_n_jobs(16) == 4
+    assert get_n_jobs(-1) == 4
+    assert get_n_jobs(-2) == 3
+
+
+def test_svm_parallel_scores():
+    serial_score, serial_time = run_decoding(SVM, svm_params(n_jobs=1))
+    parallel_score, parallel_time = run_decoding(SVM, svm_params(n_jobs=-1))
+
+    print(f"SVM serial: {serial_time:.2f}s, parallel: {parallel_time:.2f}s")
+    np.testing.assert_array_equal(serial_score, parallel_score)
+
+
+def test_lda_parallel_scores():
+    serial_score, serial_time = run_decoding(LDA, lda_params(n_jobs=1))
+    parallel_score, parallel_time = run_decoding(LDA, lda_params(n_jobs=-1))
+
+    print(f"LDA serial: {serial_time:.2f}s, parallel: {parallel_time:.2f}s")
+    np.testing.assert_array_equal(serial_score, parallel_score)
@@ -0,0 +1,83 @@
+import time
+import tracemalloc
+
+import numpy as np
+
+from studio.app.dir_path import DIRPATH
+from studio.app.optinist.core.nwb.nwb import NWBDATASET
+from studio.app.optinist.dataclass import FluoData
+from studio.app.optinist.wrappers.optinist.dimension_reduction import PCA
+
+workspace_id = "default"
+unique_id = "pca_test"
+
+output_dir = f"{DIRPATH.OUTPUT_DIR}/{workspace_id}/{unique_id}/func1"
+
+
+def create_neural_data(n_cells, n_frames):
+    """
+    Low rank activity + noise, so that the leading components are well separated
+    """
+    rng = np.random.default_rng(0)
+    latent = rng.normal(size=(n_frames, 3)) * [5.0, 3.0, 2.0]
+    mixing = rng.normal(size=(3, n_cells))
+    activity = latent @ mixing + rng.normal(size=(n_frames, n_cells))
+
+    return FluoData(activity.T)
+
+
+def pca_params(use_incremental, n_components=3, batch_size=None):
+    return {
+        "I/O": {"transpose": True, "standard_mean": True, "standard_std": True},
+        "PCA": {"n_components": n_components},
+        "incremental_pca": {"use": use_incremental, "batch_size": batch_size},
+    }
+
+
+def run_pca(neural_data, params):
+    tracemalloc.start()
+    start = time.time()
+    info = PCA(neural_data, output_dir=output_dir, params=params)
+    elapsed = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return info["nwbfile"][NWBDATASET.POSTPROCESS]["func1"], elapsed, peak
+
+
+def test_incremental_pca_compatible():
+    neural_data = create_neural_data(n_cells=200, n_frames=20000)
+
+    exact, exact_time, exact_peak = run_pca(neural_data, pca_params(False))
+    chunked, chunked_time, chunked_peak = run_pca(
+        neural_data, pca_params(True, batch_size=2000)
+    )
+
+    print(
+        f"exact: {exact_time:.2f}s {exact_peak / 1024**2:.1f}MiB, "
+        f"incremental: {chunked_time:.2f}s {chunked_peak / 1024**2:.1f}MiB"
+    )
+
+    for key in ["components", "explained_variance", "pca_projectedNd", "mean"]:
+        assert exact[key].shape == chunked[key].shape
+    assert chunked["n_samples"] == exact["n_samples"]
+
+    np.testing.assert_allclose(
+        chunked["explained_variance_ratio"],
+        exact["explained_variance_ratio"],
+        rtol=1e-3,
+    )
+    # components are the same up to sign
+    similarity = np.abs(np.sum(exact["components"] * chunked["components"], axis=1))
+    np.testing.assert_allclose(similarity, 1, atol=1e-3)
+
+    assert chunked_peak < exact_peak
+
+
+def test_incremental_pca_auto_selection():
+    neural_data = create_neural_data(n_cells=20, n_frames=500)
+
+    # small data: exact solver, also with float n_components
+    for n_components in [3, 0.9]:
+        result, _, _ = run_pca(neural_data, pca_params("auto", n_components))
+        assert result["n_samples"] == [500]
@@ -0,0 +1,66 @@
+import os
+import tracemalloc
+
+import numpy as np
+import tifffile
+
+from studio.app.common.core.utils.filepath_creater import create_directory
+from studio.app.dir_path import DIRPATH
+from studio.app.optinist.wrappers.suite2p.suite2p_utils import Suite2pUtils
+
+workspace_id = "default"
+unique_id = "suite2p_utils_test"
+
+output_dir = f"{DIRPATH.OUTPUT_DIR}/{workspace_id}/{unique_id}"
+input_dir = f"{output_dir}/input"
+bin_path = f"{output_dir}/suite2p_file_convert/data.bin"
+
+T, Ly, Lx = 2000, 32, 40
+
+
+def suite2p_reference(movie):
+    """
+    Result of the former conversion (tiff copy + suite2p.io.tiff_to_binary)
+    """
+    if movie.dtype.type == np.float32:
+        movie = (movie - movie.min()) / (movie.max() - movie.min())
+        movie = (movie * np.iinfo(np.int16).max).astype(np.int16)
+    if movie.dtype.type == np.uint16:
+        movie = (movie // 2).astype(np.int16)
+    return movie
+
+
+def test_tiff_to_binary():
+    create_directory(input_dir)
+    create_directory(os.path.dirname(bin_path))
+
+    movies = [
+        np.random.randint(0, 60000, (T, Ly, Lx)).astype(np.uint16),
+        (np.random.rand(T // 2, Ly, Lx) * 10 - 5).astype(np.float32),
+    ]
+    file_paths = [f"{input_dir}/uint16.tif", f"{input_dir}/float32.tif"]
+    tifffile.imwrite(file_paths[0], movies[0])
+    tifffile.imwrite(file_paths[1], movies[1], compression="zlib")
+
+    tracemalloc.start()
+    ops = Suite2pUtils.tiff_to_binary(file_paths, bin_path, batch_size=50)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    expected = np.concatenate([suite2p_reference(m) for m in movies])
+    written = np.fromfile(bin_path, dtype=np.int16).reshape(-1, Ly, Lx)
+    np.testing.assert_array_equal(written, expected)
+
+    assert ops["nframes"] == len(expected)
+    assert list(ops["frames_per_file"]) == [T, T // 2]
+    assert (ops["Ly"], ops["Lx"]) == (Ly, Lx)
+    assert ops["filelist"] == file_paths
+    np.testing.assert_allclose(ops["meanImg"], expected.mean(axis=0), rtol=1e-5)
+
+    # only the binary is written (no intermediate tiff copies)
+    bytes_written = os.path.getsize(bin_path)
+    assert bytes_written == expected.nbytes
+    assert os.listdir(os.path.dirname(bin_path)) == ["data.bin"]
+
+    print(f"written: {bytes_written / 1024**2:.1f} MiB, peak: {peak / 1024**2:.1f} MiB")
+    assert peak < expected.nbytes / 3
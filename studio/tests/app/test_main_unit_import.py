@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from studio.app.dir_path import DIRPATH
+
+# modules which are imported on first use, not at the API server startup
+lazy_modules = [
+    "studio.app.wrappers",
+    "studio.app.optinist.core.edit_ROI",
+    "pynwb",
+    "h5py",
+]
+
+# Note: generous bounds by default, set smaller ones to detect regressions.
+MAX_IMPORT_SECONDS = float(os.environ.get("MAIN_UNIT_IMPORT_MAX_SECONDS", 10))
+MAX_IMPORT_RSS_MB = float(os.environ.get("MAIN_UNIT_IMPORT_MAX_RSS_MB", 300))
+
+IMPORT_SCRIPT = """
+import sys, time
+
+start = time.time()
+import studio.__main_unit__
+elapsed = time.time() - start
+
+# Note: the peak RSS of this process itself (ru_maxrss is inherited from pytest).
+from studio.app.common.core.workflow.workflow_node_metrics import WorkflowNodeMetrics
+max_rss = WorkflowNodeMetrics.get_peak_rss()
+
+print(",".join(m for m in sys.argv[1:] if m in sys.modules))
+print(elapsed, max_rss / 1024**2)
+"""
+
+
+def import_main_unit():
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT] + lazy_modules,
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": DIRPATH.ROOT_DIR},
+    )
+    imported, timing = result.stdout.splitlines()[-2:]
+    elapsed, max_rss_mb = timing.split()
+
+    return imported, float(elapsed), float(max_rss_mb)
+
+
+def test_lazy_imports():
+    imported, _, _ = import_main_unit()
+    assert imported == "", f"imported at startup: {imported}"
+
+
+@pytest.mark.heavier_processing
+def test_import_benchmark():
+    imported, elapsed, max_rss_mb = import_main_unit()
+    assert imported == ""
+
+    print(f"import studio.__main_unit__: {elapsed:.2f}s / {max_rss_mb:.0f}MB rss")
+    assert elapsed < MAX_IMPORT_SECONDS
+    assert max_rss_mb < MAX_IMPORT_RSS_MB
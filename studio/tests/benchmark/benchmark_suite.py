@@ -0,0 +1,490 @@
+"""
+Benchmark suite of the key I/O paths and wrappers, over synthetic data.
+
+The data are generated (seeded) at a configurable scale, so that the results
+  are reproducible without the sample data, network or GPU.
+Usage: see run_benchmark.py (or docs/for_developers/test.md)
+"""
+
+import gc
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from functools import cached_property
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from studio.app.common.core.utils.filepath_creater import (
+    create_directory,
+    join_filepath,
+)
+from studio.app.const import DATE_FORMAT
+from studio.app.dir_path import DIRPATH
+
+SEED = 0
+
+# {case name: function (setup) returning the function to be timed}
+BENCHMARK_CASES: Dict[str, Callable[["BenchmarkData"], Callable[[], None]]] = {}
+
+
+def benchmark_case(name: str):
+    def decorator(func):
+        BENCHMARK_CASES[name] = func
+        return func
+
+    return decorator
+
+
+class BenchmarkData:
+    """
+    Synthetic data of the benchmark, generated at *scale (1.0: default size).
+    Outputs are written under OUTPUT_DIR/benchmark/<id>, removed by cleanup().
+    """
+
+    WORKSPACE_ID = "benchmark"
+
+    def __init__(self, scale: float = 1.0):
+        assert scale > 0, "scale should be positive"
+        self.scale = scale
+        self.unique_id = uuid.uuid4().hex[:8]
+        self.dirpath = join_filepath(
+            [DIRPATH.OUTPUT_DIR, self.WORKSPACE_ID, self.unique_id]
+        )
+
+    def scaled(self, size: int, minimum: int) -> int:
+        return max(int(size * self.scale), minimum)
+
+    @property
+    def num_frames(self) -> int:
+        return self.scaled(500, 100)
+
+    @property
+    def num_cells(self) -> int:
+        return self.scaled(200, 10)
+
+    @property
+    def image_size(self) -> int:
+        return 128
+
+    @cached_property
+    def movie(self) -> np.ndarray:
+        """
+        (frames, height, width) uint16 movie of blob-shaped cells
+          with sparse calcium-like transients over a noisy background.
+        """
+        rng = np.random.default_rng(SEED)
+        size = self.image_size
+        movie = rng.normal(100, 5, (self.num_frames, size, size)).astype(np.float32)
+
+        yy, xx = np.mgrid[:size, :size]
+        for _ in range(30):
+            cy, cx = rng.integers(8, size - 8, 2)
+            blob = np.exp(-((yy - cy) ** 2 + (xx - cx) ** 2) / (2 * 3.0**2))
+            spikes = rng.random(self.num_frames) < 0.05
+            trace = np.convolve(spikes, np.exp(-np.arange(20) / 5.0))[: self.num_frames]
+            movie += (50 + 100 * trace[:, None, None]) * blob.astype(np.float32)
+
+        return np.clip(movie, 0, np.iinfo(np.uint16).max).astype(np.uint16)
+
+    @cached_property
+    def fluorescence(self) -> np.ndarray:
+        """
+        (cells, frames) fluorescence, with correlated groups of cells.
+        """
+        rng = np.random.default_rng(SEED)
+        num_frames = self.scaled(2000, 100)
+        sources = rng.normal(0, 1, (5, num_frames))
+        weights = rng.random((self.num_cells, 5))
+        return weights @ sources + rng.normal(0, 0.5, (self.num_cells, num_frames))
+
+    @cached_property
+    def roi_masks(self) -> np.ndarray:
+        """
+        (cells, height, width) binary masks of square ROIs.
+        """
+        rng = np.random.default_rng(SEED)
+        size = self.image_size
+        num_rois = min(self.num_cells, 50)
+        masks = np.zeros((num_rois, size, size))
+        for i, (y, x) in enumerate(rng.integers(0, size - 6, (num_rois, 2))):
+            masks[i, y : y + 6, x : x + 6] = 1
+        return masks
+
+    def get_node_dirpath(self, function_id: str) -> str:
+        dirpath = join_filepath([self.dirpath, function_id])
+        create_directory(dirpath)
+        return dirpath
+
+    def cleanup(self):
+        shutil.rmtree(self.dirpath, ignore_errors=True)
+
+
+@benchmark_case("image_data_write")
+def bench_image_data_write(data: BenchmarkData):
+    from studio.app.common.dataclass import ImageData
+
+    movie = data.movie
+    output_dir = data.get_node_dirpath("image_data")
+
+    return lambda: ImageData(movie, output_dir=output_dir, file_name="movie")
+
+
+@benchmark_case("image_data_read")
+def bench_image_data_read(data: BenchmarkData):
+    from studio.app.common.dataclass import ImageData
+
+    image = ImageData(
+        data.movie, output_dir=data.get_node_dirpath("image_data"), file_name="movie"
+    )
+
+    return lambda: image.data
+
+
+@benchmark_case("image_data_save_json")
+def bench_image_data_save_json(data: BenchmarkData):
+    from studio.app.common.dataclass import ImageData
+
+    output_dir = data.get_node_dirpath("image_data")
+    image = ImageData(data.movie.mean(axis=0), output_dir=output_dir, file_name="mean")
+
+    return lambda: image.save_json(output_dir)
+
+
+@benchmark_case("json_writer_write_as_split")
+def bench_json_writer_write_as_split(data: BenchmarkData):
+    from studio.app.common.core.utils.json_writer import JsonWriter
+
+    fluorescence = data.fluorescence
+    filepath = join_filepath([data.get_node_dirpath("json_writer"), "fluo.json"])
+
+    return lambda: JsonWriter.write_as_split(filepath, fluorescence)
+
+
+@benchmark_case("json_writer_save_tiff2json")
+def bench_json_writer_save_tiff2json(data: BenchmarkData):
+    from studio.app.common.core.utils.json_writer import save_tiff2json
+    from studio.app.common.dataclass import ImageData
+
+    output_dir = data.get_node_dirpath("json_writer")
+    image = ImageData(data.movie, output_dir=output_dir, file_name="movie")
+
+    return lambda: save_tiff2json(image.path[0], output_dir, 1, 50)
+
+
+@benchmark_case("csv_cache_preview")
+def bench_csv_cache_preview(data: BenchmarkData):
+    from studio.app.common.core.utils.csv_cache import CsvCache
+
+    output_dir = data.get_node_dirpath("csv_cache")
+    csv_filepath = join_filepath([output_dir, "fluorescence.csv"])
+    if not os.path.exists(csv_filepath):
+        np.savetxt(csv_filepath, data.fluorescence.T, delimiter=",")
+        CsvCache.read(csv_filepath, output_dir)
+
+    # Note: repeated preview (the csv is parsed once, by the first read)
+    return lambda: CsvCache.read(csv_filepath, output_dir).get_values(slice(0, 1000))
+
+
+@benchmark_case("nwb_creater_save_nwb")
+def bench_nwb_creater_save_nwb(data: BenchmarkData):
+    from studio.app.common.core.workflow.workflow_params import get_typecheck_params
+    from studio.app.common.dataclass import ImageData
+    from studio.app.optinist.core.nwb.nwb import NWBDATASET
+    from studio.app.optinist.core.nwb.nwb_creater import save_nwb
+
+    function_id = "benchmark"
+    output_dir = data.get_node_dirpath("nwb_creater")
+    masks = data.roi_masks
+    fluorescence = data.fluorescence[: len(masks)]
+
+    input_config = get_typecheck_params({}, "nwb")
+    input_config[NWBDATASET.IMAGE_SERIES]["external_file"] = ImageData(
+        data.movie, output_dir=output_dir, file_name="movie"
+    )
+    config = {
+        NWBDATASET.ROI: {
+            function_id: {"roi_list": [{"image_mask": mask} for mask in masks]}
+        },
+        NWBDATASET.COLUMN: {
+            function_id: {
+                "name": "iscell",
+                "description": "two columns - iscell & probcell",
+                "data": np.ones(len(masks), dtype=int),
+            }
+        },
+        NWBDATASET.FLUORESCENCE: {
+            function_id: {
+                "Fluorescence": {
+                    "table_name": "Fluorescence",
+                    "region": list(range(len(fluorescence))),
+                    "name": "Fluorescence",
+                    "data": fluorescence,
+                    "unit": "lumens",
+                }
+            }
+        },
+    }
+    save_path = join_filepath([output_dir, "benchmark.nwb"])
+
+    return lambda: save_nwb(save_path, input_config, config)
+
+
+@benchmark_case("edit_roi")
+def bench_edit_roi(data: BenchmarkData):
+    from studio.app.common.core.utils.pickle_handler import PickleWriter
+    from studio.app.optinist.core.edit_ROI.edit_ROI import EditROI
+    from studio.app.optinist.dataclass import EditRoiData, IscellData
+    from studio.app.optinist.schemas.roi import RoiPos
+
+    # Note: EditROI expects a node (function_id with the 10 characters suffix)
+    #   of a roi detection, eg. lccd_cell_detection_xxxxxxxxxx
+    function_id = "lccd_cell_detection_0000000000"
+    shutil.rmtree(join_filepath([data.dirpath, function_id]), ignore_errors=True)
+    node_dirpath = data.get_node_dirpath(function_id)
+
+    im = data.roi_masks * np.arange(1, len(data.roi_masks) + 1)[:, None, None]
+    im[im == 0] = np.nan
+    im -= 1
+    pickle_path = join_filepath([node_dirpath, "lccd_cell_detection.pkl"])
+    PickleWriter.write(
+        pickle_path,
+        {
+            "edit_roi_data": EditRoiData(images=None, im=im),
+            "iscell": IscellData(np.ones(len(im), dtype=int)),
+        },
+    )
+
+    def run():
+        edit_roi = EditROI(pickle_path)
+        edit_roi.add(RoiPos(posx=20, posy=20, sizex=10, sizey=10))
+        edit_roi.merge([0, 1])
+        edit_roi.delete([2])
+
+    return run
+
+
+def get_wrapper_case(function_id: str, func_name: str, module: str, **params):
+    def bench_wrapper(data: BenchmarkData):
+        from importlib import import_module
+
+        from studio.app.common.core.workflow.workflow_params import get_default_params
+
+        func = getattr(
+            import_module(f"studio.app.optinist.wrappers.{module}"), func_name
+        )
+        default_params = get_default_params(function_id)
+        output_dir = data.get_node_dirpath(function_id)
+        input_data = create_wrapper_input(data, function_id, output_dir)
+
+        return lambda: func(
+            **input_data, output_dir=output_dir, params={**default_params, **params}
+        )
+
+    return bench_wrapper
+
+
+def create_wrapper_input(data: BenchmarkData, function_id: str, output_dir: str):
+    from studio.app.common.dataclass import ImageData
+    from studio.app.optinist.dataclass import FluoData
+
+    if function_id == "lccd_cell_detection":
+        return {
+            "mc_images": ImageData(data.movie, output_dir=output_dir, file_name="movie")
+        }
+    return {"neural_data": FluoData(data.fluorescence, file_name="fluorescence")}
+
+
+benchmark_case("wrapper_pca")(
+    get_wrapper_case("pca", "PCA", "optinist.dimension_reduction.pca")
+)
+benchmark_case("wrapper_correlation")(
+    get_wrapper_case(
+        "correlation",
+        "correlation",
+        "optinist.neural_population_analysis.correlation",
+    )
+)
+# Note: shuffles are reduced, the cost is (cells ** 2 * shuffles).
+benchmark_case("wrapper_cross_correlation")(
+    get_wrapper_case(
+        "cross_correlation",
+        "cross_correlation",
+        "optinist.neural_population_analysis.cross_correlation",
+        shuffle_sample_number=10,
+    )
+)
+benchmark_case("wrapper_lccd_cell_detection")(
+    get_wrapper_case("lccd_cell_detection", "lccd_detect", "lccd.lccd_detection")
+)
+
+
+@dataclass
+class BenchmarkResult:
+    times: List[float]
+    min: float
+    median: float
+
+
+@dataclass
+class BenchmarkReport:
+    created_at: str
+    scale: float
+    repeat: int
+    environment: Dict[str, Optional[str]]
+    results: Dict[str, BenchmarkResult] = field(default_factory=dict)
+    # Cases not run, for the missing optional (conda env) dependencies.
+    skipped: Dict[str, str] = field(default_factory=dict)
+    # Per-case regression thresholds, used when the report is the baseline.
+    thresholds: Dict[str, float] = field(default_factory=dict)
+
+    def save(self, path: str):
+        with open(path, "w") as f:
+            json.dump(asdict(self), f, indent=4)
+
+    @classmethod
+    def read(cls, path: str) -> "BenchmarkReport":
+        with open(path) as f:
+            report = json.load(f)
+        report["results"] = {
+            name: BenchmarkResult(**result)
+            for name, result in report["results"].items()
+        }
+        return cls(**report)
+
+
+@dataclass
+class BenchmarkRegression:
+    name: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+    def __str__(self):
+        return (
+            f"{self.name}: {self.baseline:.4f}s -> {self.current:.4f}s "
+            f"(x{self.ratio:.2f}, threshold x{1 + self.threshold:.2f})"
+        )
+
+
+def get_environment() -> Dict[str, Optional[str]]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=DIRPATH.ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": str(os.cpu_count()),
+        "numpy": np.__version__,
+        "commit": commit,
+    }
+
+
+def run_benchmarks(
+    scale: float = 1.0,
+    repeat: int = 3,
+    names: Optional[List[str]] = None,
+    logger: Callable[[str], None] = print,
+) -> BenchmarkReport:
+    """
+    Run the cases (all if *names is None) *repeat times each.
+    The setup of the cases (data generation, input files) is not timed.
+    """
+    names = names or list(BENCHMARK_CASES)
+    unknown = set(names) - set(BENCHMARK_CASES)
+    if unknown:
+        raise KeyError(f"Unknown benchmark cases: {sorted(unknown)}")
+
+    report = BenchmarkReport(
+        created_at=datetime.now().strftime(DATE_FORMAT),
+        scale=scale,
+        repeat=repeat,
+        environment=get_environment(),
+    )
+
+    data = BenchmarkData(scale)
+    try:
+        for name in names:
+            times = []
+            try:
+                for _ in range(repeat):
+                    run = BENCHMARK_CASES[name](data)
+                    gc.collect()
+                    start = time.perf_counter()
+                    run()
+                    times.append(round(time.perf_counter() - start, 6))
+            except ModuleNotFoundError as e:
+                report.skipped[name] = str(e)
+                logger(f"{name}: skipped ({e})")
+                continue
+
+            result = BenchmarkResult(
+                times=times, min=min(times), median=statistics.median(times)
+            )
+            report.results[name] = result
+            logger(f"{name}: min {result.min:.4f}s, median {result.median:.4f}s")
+    finally:
+        data.cleanup()
+
+    return report
+
+
+def compare_reports(
+    report: BenchmarkReport,
+    baseline: BenchmarkReport,
+    threshold: float = 0.2,
+    min_seconds: float = 0.01,
+) -> List[BenchmarkRegression]:
+    """
+    Compare the fastest runs (the least disturbed by other processes)
+      of the cases run in both reports.
+    A case regresses when it is slower than the baseline by more than
+      the threshold (ratio, the baseline thresholds override it per case)
+      and by more than *min_seconds (to ignore the noise of the tiny cases).
+    """
+    if report.scale != baseline.scale:
+        raise ValueError(
+            f"Scales differ (report: {report.scale}, baseline: {baseline.scale})"
+        )
+
+    regressions = []
+    for name, result in report.results.items():
+        if name not in baseline.results:
+            continue
+
+        base_time = baseline.results[name].min
+        case_threshold = baseline.thresholds.get(name, threshold)
+        if (
+            result.min > base_time * (1 + case_threshold)
+            and result.min - base_time > min_seconds
+        ):
+            regressions.append(
+                BenchmarkRegression(
+                    name=name,
+                    baseline=base_time,
+                    current=result.min,
+                    threshold=case_threshold,
+                )
+            )
+
+    return regressions
@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+from studio.app.common.core.utils.filepath_creater import join_filepath
+from studio.app.dir_path import DIRPATH
+from studio.tests.benchmark.benchmark_suite import (
+    BENCHMARK_CASES,
+    BenchmarkData,
+    BenchmarkReport,
+    BenchmarkResult,
+    compare_reports,
+    run_benchmarks,
+)
+
+
+def create_report(times: dict, scale=1.0, **kwargs) -> BenchmarkReport:
+    return BenchmarkReport(
+        created_at="2024-01-01 00:00:00",
+        scale=scale,
+        repeat=1,
+        environment={},
+        results={
+            name: BenchmarkResult(times=[t], min=t, median=t)
+            for name, t in times.items()
+        },
+        **kwargs,
+    )
+
+
+def list_benchmark_outputs():
+    dirpath = join_filepath([DIRPATH.OUTPUT_DIR, BenchmarkData.WORKSPACE_ID])
+    return os.listdir(dirpath) if os.path.isdir(dirpath) else []
+
+
+def test_run_benchmarks(tmp_path):
+    outputs = list_benchmark_outputs()
+    report = run_benchmarks(scale=0.01, repeat=1, logger=lambda _: None)
+
+    assert set(report.results) | set(report.skipped) == set(BENCHMARK_CASES)
+    assert all(result.min > 0 for result in report.results.values())
+    assert report.environment["python"]
+
+    # synthetic data are removed after the run
+    assert list_benchmark_outputs() == outputs
+
+    path = str(tmp_path / "results.json")
+    report.save(path)
+    assert BenchmarkReport.read(path) == report
+
+    with pytest.raises(KeyError):
+        run_benchmarks(names=["unknown"])
+
+
+def test_compare_reports():
+    baseline = create_report(
+        {"slower": 1.0, "noisy": 0.001, "tolerated": 1.0, "faster": 1.0},
+        thresholds={"tolerated": 1.0},
+    )
+    report = create_report(
+        {"slower": 1.5, "noisy": 0.005, "tolerated": 1.5, "faster": 0.5, "new": 1.0}
+    )
+
+    regressions = compare_reports(report, baseline, threshold=0.2)
+    assert [r.name for r in regressions] == ["slower"]
+    assert regressions[0].ratio == 1.5
+
+    assert compare_reports(report, baseline, threshold=0.6) == []
+
+    with pytest.raises(ValueError):
+        compare_reports(create_report({}, scale=2.0), baseline)